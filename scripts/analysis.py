@@ -3,14 +3,17 @@ import csv
 import random
 import ast
 
+from tonnetz.midi.cache import ParseCache
 from tonnetz.midi.parser import gen_transition_poly
 from tonnetz.graph.builder import build_graph
 from tonnetz.viz.plot import plot_graph, plot_degree_distribution
 from tonnetz.graph.statistics import Stats
 from tonnetz.graph.centrality import print_centralities
 from tonnetz.graph.centrality import get_centralities
+from tonnetz.gen.dataset import TOKENS_SUFFIX, read_tokens
 from tonnetz.gen.walk import biased_random_walk, purely_random_sequence
 from tonnetz.gen.create_midi import create_midi_from_list
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE
 
 filename = "My_Heart_Will_Go_On.mid"
 chord_overlay_filename = "My_Heart_Will_Go_On_combined.mid"
@@ -19,8 +22,15 @@ channel_number = 0
 ENABLE_OVERLAY = True  # Set True to enable playback overlay (it works visually even if you dont have fluidsynth installed)
 LSTM_SEQUENCE_COUNT = 3
 
-# For adding CSV formatted sequences
+# For adding CSV formatted sequences (or binary .tokens datasets)
 def load_random_sequences(csv_path: str, count: int) -> list[tuple[int, list[int]]]:
+    if csv_path.endswith(TOKENS_SUFFIX):
+        dataset = read_tokens(csv_path)
+        if len(dataset) < count:
+            raise ValueError(f"Expected at least {count} generated sequences in {csv_path}")
+        selected_indices = random.Random().sample(range(len(dataset)), count)
+        return list(zip(selected_indices, dataset.sequences(selected_indices)))
+
     with open(csv_path, newline="", encoding="utf-8") as f:
         reader = csv.reader(f)
         rows = list(reader)
@@ -62,7 +72,9 @@ def _parse_generated_sequence_row(row: list[str]) -> list[int]:
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(script_dir)
 midi_file = os.path.join(project_root, "raw_midi", filename)
-transition_matrix = gen_transition_poly(midi_file, channel_number)
+# Parsed matrices/event tables are cached by file content; clear with `python -m scripts.cache clear`
+parse_cache = ParseCache(os.path.join(project_root, ".cache", "tonnetz"))
+transition_matrix = gen_transition_poly(midi_file, channel_number, cache=parse_cache)
 
 # Generate random-walk melody variants from the selected Tonnetz graph.
 raw_midi_dir = os.path.join(project_root, "raw_midi")
@@ -94,7 +106,7 @@ random_seq = purely_random_sequence(
     length=96,
     rest_prob=0.25,
     seed=101,
-    num_notes=48,
+    num_notes=DEFAULT_PITCH_SPACE.num_notes,
 )
 random_name = "rw_melody_random.mid"
 create_midi_from_list(
@@ -137,6 +149,7 @@ plot_graph(
     overlay_chord_midi_name=chord_overlay_filename,
     overlay_melody_options=melody_outputs,
     enable_playback=ENABLE_OVERLAY,
+    cache=parse_cache,
 )
 
 
@@ -0,0 +1,48 @@
+"""
+cache.py
+
+Inspect or invalidate the on-disk parse cache used by analysis.py and
+scripts/ingest_corpus.py.
+
+Usage (from project root):
+    uv run python -m scripts.cache info
+    uv run python -m scripts.cache invalidate raw_midi/My_Heart_Will_Go_On.mid
+    uv run python -m scripts.cache clear --dir .cache/tonnetz
+"""
+
+import argparse
+
+from tonnetz.midi.cache import ParseCache
+
+# ---------------------------------------------------------------------------
+# Defaults
+# ---------------------------------------------------------------------------
+DEFAULT_CACHE_DIR = ".cache/tonnetz"
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the Tonnetz parse cache.")
+    parser.add_argument("command", choices=("info", "clear", "invalidate"),
+                        help="info: show size | clear: drop everything | invalidate: drop entries of FILES")
+    parser.add_argument("files", nargs="*",
+                        help="MIDI files whose entries should be invalidated")
+    parser.add_argument("--dir", type=str, default=DEFAULT_CACHE_DIR,
+                        help=f"Cache directory (default {DEFAULT_CACHE_DIR})")
+    args = parser.parse_args()
+
+    cache = ParseCache(args.dir)
+
+    if args.command == "info":
+        print(f"Cache: {cache.root.resolve()}")
+        print(f"Entries: {len(cache)}")
+        print(f"Size:    {cache.size_bytes() / 1024:.1f} KB (limit {cache.max_bytes / 1024**2:.0f} MB)")
+    elif args.command == "clear":
+        print(f"Removed {cache.clear()} entries from {cache.root.resolve()}")
+    else:
+        if not args.files:
+            parser.error("invalidate needs at least one MIDI file")
+        for midi_file in args.files:
+            print(f"Removed {cache.invalidate(midi_file)} entries for {midi_file}")
@@ -0,0 +1,42 @@
+"""
+convert_sequences.py
+
+Converts a sequence CSV written by generate_dataset (one sequence per row,
+step_i header) into the binary token format: an int8 token matrix in
+<output>.tokens plus a <output>.tokens.json header, memory-mapped by
+tonnetz.gen.dataset.read_tokens.
+
+Usage (from project root):
+    uv run python -m scripts.convert_sequences data/sequences.csv
+    uv run python -m scripts.convert_sequences data/sequences.csv --output data/train.tokens
+"""
+
+import argparse
+import time
+
+from tonnetz.gen.dataset import convert_csv, read_tokens
+
+# ---------------------------------------------------------------------------
+# Defaults
+# ---------------------------------------------------------------------------
+DEFAULT_INPUT = "data/sequences.csv"
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert a sequence CSV to binary tokens.")
+    parser.add_argument("input", nargs="?", default=DEFAULT_INPUT,
+                        help=f"Sequence CSV (default {DEFAULT_INPUT})")
+    parser.add_argument("--output", type=str, default=None,
+                        help="Token file path (default: input with a .tokens suffix)")
+    args = parser.parse_args()
+
+    start = time.time()
+    out = convert_csv(args.input, args.output)
+    dataset = read_tokens(out)
+    num, length = dataset.tokens.shape
+    print(f"Converted {num} sequences of length {length} to {out.resolve()}")
+    print(f"Total time: {time.time() - start:.2f}s")
+    print(f"File size:  {out.stat().st_size / 1024:.1f} KB")
@@ -7,19 +7,34 @@ and saves them to a CSV file.
 Each row in the CSV = one sequence of 1000 note values.
 Values are node indices [0-47] or -1 for a rest.
 
+An output path ending in .tokens writes the binary format instead: an int8
+(num, length) token matrix plus a <output>.json header with the seed,
+matrix hash and walk parameters, read back with
+tonnetz.gen.dataset.read_tokens (memory-mapped). Existing CSVs are
+converted with scripts.convert_sequences.
+
+Sequences can be generated by a process pool (--workers), each worker
+writing its own shard files (--shards) that are merged into the output at
+the end (unless --no-merge). Every sequence is seeded from its own child of
+np.random.SeedSequence(seed), so the output does not depend on how the work
+was split.
+
 Usage (from project root):
     uv run python -m scripts.generate_dataset
     uv run python -m scripts.generate_dataset --output data/sequences.csv --seed 42
+    uv run python -m scripts.generate_dataset --num 1000000 --workers 8 --shards 64 --no-merge
+    uv run python -m scripts.generate_dataset --output data/sequences.tokens
 """
 
 import argparse
-import csv
 import time
 from pathlib import Path
 
 import numpy as np
 
-from tonnetz.gen.walk import biased_random_walk
+from tonnetz.gen.dataset import write_walk_dataset
+from tonnetz.gen.walk import Walker
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE
 
 # ---------------------------------------------------------------------------
 # Defaults
@@ -27,7 +42,7 @@ from tonnetz.gen.walk import biased_random_walk
 NUM_SEQUENCES = 350
 SEQUENCE_LENGTH = 1000
 DEFAULT_OUTPUT = "data/sequences.csv"
-N_NODES = 48
+N_NODES = DEFAULT_PITCH_SPACE.num_notes
 
 
 def make_adjacency_matrix(n: int = N_NODES, seed: int | None = None) -> np.ndarray:
@@ -44,10 +59,13 @@ def generate_dataset(
     sequence_length: int = SEQUENCE_LENGTH,
     output_path: str = DEFAULT_OUTPUT,
     seed: int | None = 42,
-) -> Path:
+    workers: int | None = 1,
+    shards: int | None = None,
+    merge: bool = True,
+) -> list[Path]:
     """
     Generate `num_sequences` biased random walk sequences of `sequence_length`
-    and write them to a CSV file.
+    and write them to CSV.
 
     Parameters
     ----------
@@ -56,55 +74,66 @@ def generate_dataset(
     sequence_length : int
         Length of each sequence (default 1000).
     output_path : str
-        Path to save the CSV file.
+        Path to save the CSV file (or the binary token file, for a .tokens
+        suffix).
     seed : int | None
         Base random seed for reproducibility. Each sequence gets its own
-        derived seed (seed + i) so sequences are distinct but reproducible.
+        child of SeedSequence(seed) so sequences are distinct but
+        reproducible, whatever the number of workers.
+    workers : int | None
+        Worker processes (None = all cores, 1 = in-process).
+    shards : int | None
+        Number of shard files (default: one per worker).
+    merge : bool
+        Merge the shards into `output_path` (default) or keep them.
 
     Returns
     -------
-    Path
-        Path to the saved CSV file.
+    list[Path]
+        The saved file, or the shard files when not merged.
     """
-    # Build one shared adjacency matrix for all sequences
+    # Build one shared adjacency matrix for all sequences, and compile its
+    # walk (centrality and transition tables) once
     adj = make_adjacency_matrix(n=N_NODES, seed=seed)
+    walker = Walker(adj, centrality_type="eigenvector")
 
     out = Path(output_path)
-    out.parent.mkdir(parents=True, exist_ok=True)
 
     print(f"Generating {num_sequences} sequences of length {sequence_length}...")
     print(f"Graph: {N_NODES} nodes | Rest probability: 0.3 | Walk probability: 0.7")
     print(f"Output: {out.resolve()}\n")
 
     start = time.time()
-
-    with open(out, "w", newline="") as f:
-        writer = csv.writer(f)
-
-        # Header: step_0, step_1, ..., step_999
-        writer.writerow([f"step_{i}" for i in range(sequence_length)])
-
-        for i in range(num_sequences):
-            # Each sequence gets a unique but deterministic seed
-            seq_seed = None if seed is None else seed + i
-            sequence = biased_random_walk(
-                adj_matrix=adj,
-                length=sequence_length,
-                seed=seq_seed,
-            )
-            writer.writerow(sequence)
-
-            # Progress indicator every 50 sequences
-            if (i + 1) % 50 == 0:
-                elapsed = time.time() - start
-                print(f"  [{i + 1}/{num_sequences}] sequences generated ({elapsed:.1f}s)")
+    reported = 0
+
+    def report(done: int, total: int) -> None:
+        # About 20 progress lines however large the run
+        nonlocal reported
+        if done - reported >= max(1, total // 20) or done == total:
+            reported = done
+            elapsed = time.time() - start
+            print(f"  [{done}/{total}] sequences generated ({elapsed:.1f}s)")
+
+    paths = write_walk_dataset(
+        walker,
+        num_sequences,
+        sequence_length,
+        out,
+        seed=seed,
+        workers=workers,
+        shards=shards,
+        merge=merge,
+        progress=report,
+    )
 
     elapsed = time.time() - start
-    print(f"\nDone! {num_sequences} sequences saved to {out.resolve()}")
+    size = sum(p.stat().st_size for p in paths)
+    where = out.resolve() if paths == [out] else f"{len(paths)} shards next to {out.resolve()}"
+    print(f"\nDone! {num_sequences} sequences saved to {where}")
     print(f"Total time: {elapsed:.2f}s")
-    print(f"File size:  {out.stat().st_size / 1024:.1f} KB")
+    print(f"File size:  {size / 1024:.1f} KB")
 
-    return out
+    return paths
 
 
 # ---------------------------------------------------------------------------
@@ -117,9 +146,15 @@ if __name__ == "__main__":
     parser.add_argument("--length", type=int, default=SEQUENCE_LENGTH,
                         help=f"Length of each sequence (default {SEQUENCE_LENGTH})")
     parser.add_argument("--output", type=str, default=DEFAULT_OUTPUT,
-                        help=f"Output CSV path (default {DEFAULT_OUTPUT})")
+                        help=f"Output path, .csv or .tokens (default {DEFAULT_OUTPUT})")
     parser.add_argument("--seed", type=int, default=42,
                         help="Random seed (default 42)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes; 0 uses all cores (default 1)")
+    parser.add_argument("--shards", type=int, default=None,
+                        help="Number of shard files (default: one per worker)")
+    parser.add_argument("--no-merge", action="store_true",
+                        help="Keep the shard files instead of merging them into --output")
     args = parser.parse_args()
 
     generate_dataset(
@@ -127,4 +162,7 @@ if __name__ == "__main__":
         sequence_length=args.length,
         output_path=args.output,
         seed=args.seed,
+        workers=args.workers or None,
+        shards=args.shards,
+        merge=not args.no_merge,
     )
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+ingest_corpus.py
+
+Parses a directory (or glob) of MIDI files into a stacked (n_files, 48, 48)
+transition tensor using a process pool. With a wider pitch range (e.g.
+--min-note 0 --num-notes 128) the matrices are stored sparse instead, as an
+(n_files, n * n) CSR matrix with one flattened matrix per row. Files are
+decoded with the byte-level SMF reader unless --reader mido is given.
+
+Writes two files:
+    <output>.npz            matrices array (scipy.sparse.save_npz format when sparse)
+    <output>.manifest.json  one record per input file (path, channel, row, error)
+
+Usage (from project root):
+    uv run python -m scripts.ingest_corpus raw_midi
+    uv run python -m scripts.ingest_corpus "corpus/**/*.mid" --channels raw_midi/mono_channels.csv --workers 8
+    uv run python -m scripts.ingest_corpus raw_midi --min-note 0 --num-notes 128
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+from tonnetz.midi.corpus import parse_corpus
+from tonnetz.midi.events import READERS
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE, PitchSpace
+
+# ---------------------------------------------------------------------------
+# Defaults
+# ---------------------------------------------------------------------------
+DEFAULT_OUTPUT = "data/corpus"
+DEFAULT_CHANNEL_MAP = "raw_midi/mono_channels.csv"
+
+
+def ingest_corpus(
+    source: str,
+    output_path: str = DEFAULT_OUTPUT,
+    channel_map: str | None = DEFAULT_CHANNEL_MAP,
+    default_channel: int = 0,
+    workers: int | None = None,
+    cache_dir: str | None = None,
+    pitch_space: PitchSpace = DEFAULT_PITCH_SPACE,
+    reader: str = "smf",
+) -> Path:
+    """
+    Parse `source` and save the stacked matrices plus manifest.
+
+    Returns
+    -------
+    Path
+        Path to the saved .npz file.
+    """
+    out = Path(output_path).with_suffix(".npz")
+    out.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path = out.with_suffix(".manifest.json")
+
+    if channel_map is not None and not Path(channel_map).exists():
+        print(f"Channel map not found at '{channel_map}', using channel {default_channel}")
+        channel_map = None
+
+    start = time.time()
+
+    def report(done: int, total: int) -> None:
+        step = max(1, total // 20)
+        if done % step == 0 or done == total:
+            elapsed = time.time() - start
+            print(f"  [{done}/{total}] files parsed ({elapsed:.1f}s)")
+
+    print(f"Parsing MIDI files from {source}...")
+    matrices, manifest = parse_corpus(
+        source,
+        channel_map=channel_map,
+        default_channel=default_channel,
+        workers=workers,
+        progress=report,
+        cache_dir=cache_dir,
+        pitch_space=pitch_space,
+        reader=reader,
+    )
+
+    if sp.issparse(matrices):
+        sp.save_npz(out, matrices)
+    else:
+        np.savez(out, matrices=matrices)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    failed = [m for m in manifest if m["error"] is not None]
+    elapsed = time.time() - start
+    print(f"\nDone! {matrices.shape[0]} of {len(manifest)} files parsed in {elapsed:.2f}s")
+    print(f"Matrices: {out.resolve()}  shape={matrices.shape}")
+    print(f"Manifest: {manifest_path.resolve()}")
+    for record in failed:
+        print(f"  failed: {record['path']} ({record['error']})")
+
+    return out
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parse a MIDI corpus into transition matrices.")
+    parser.add_argument("source", type=str,
+                        help="Directory (searched recursively), glob pattern or MIDI file")
+    parser.add_argument("--output", type=str, default=DEFAULT_OUTPUT,
+                        help=f"Output path without extension (default {DEFAULT_OUTPUT})")
+    parser.add_argument("--channels", type=str, default=DEFAULT_CHANNEL_MAP,
+                        help=f"Channel map CSV (default {DEFAULT_CHANNEL_MAP})")
+    parser.add_argument("--default-channel", type=int, default=0,
+                        help="Channel for files missing from the channel map (default 0)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: all cores)")
+    parser.add_argument("--cache", type=str, default=None,
+                        help="Parse cache directory, e.g. .cache/tonnetz (default: no cache)")
+    parser.add_argument("--min-note", type=int, default=DEFAULT_PITCH_SPACE.min_note,
+                        help=f"MIDI note of matrix index 0 (default {DEFAULT_PITCH_SPACE.min_note})")
+    parser.add_argument("--num-notes", type=int, default=DEFAULT_PITCH_SPACE.num_notes,
+                        help=f"Number of matrix nodes (default {DEFAULT_PITCH_SPACE.num_notes})")
+    parser.add_argument("--reader", choices=READERS, default="smf",
+                        help="MIDI decoder: byte-level 'smf' fast path (default) or 'mido'")
+    args = parser.parse_args()
+
+    ingest_corpus(
+        source=args.source,
+        output_path=args.output,
+        channel_map=args.channels,
+        default_channel=args.default_channel,
+        workers=args.workers,
+        cache_dir=args.cache,
+        pitch_space=PitchSpace(args.min_note, args.num_notes),
+        reader=args.reader,
+    )
@@ -0,0 +1,118 @@
+"""
+live_analysis.py
+
+Continuously builds the Tonnetz transition matrix of a live MIDI stream with
+TransitionAccumulator and prints a summary at a fixed interval.
+
+The stream is either a MIDI input port (requires a mido backend such as
+python-rtmidi) or a MIDI file replayed in real time as a stand-in.
+
+Usage (from project root):
+    uv run python -m scripts.live_analysis --midi My_Heart_Will_Go_On.mid --channel 3
+    uv run python -m scripts.live_analysis --midi My_Heart_Will_Go_On.mid --channel 3 --fast
+    uv run python -m scripts.live_analysis --port "Virtual Keyboard" --channel 0
+    uv run python -m scripts.live_analysis --midi My_Heart_Will_Go_On.mid --channel 3 --centrality
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import mido
+import numpy as np
+
+from tonnetz.graph.incremental import IncrementalCentrality
+from tonnetz.midi.parser import TransitionAccumulator
+from tonnetz.util.util import create_note_labels
+
+# ---------------------------------------------------------------------------
+# Defaults
+# ---------------------------------------------------------------------------
+REPORT_INTERVAL = 2.0  # seconds of stream time between summaries
+TOP_N = 5
+
+
+def print_summary(
+    acc: TransitionAccumulator, stream_time: float, tracker: IncrementalCentrality | None = None
+) -> None:
+    matrix = acc.snapshot()
+    labels = create_note_labels()
+    edges = int(np.count_nonzero(matrix))
+    incoming = matrix.sum(axis=0)
+    top = np.argsort(incoming)[::-1][:TOP_N]
+    top_text = ", ".join(f"{labels[int(i)]} {incoming[i]:.2f}" for i in top if incoming[i] > 0)
+    print(f"[{stream_time:7.2f}s] events={acc.num_events:<6} edges={edges:<5} top in-weight: {top_text}")
+    if tracker is not None:
+        changed = tracker.update_matrix(matrix)
+        eig = tracker.eigenvector()
+        best = int(np.argmax(eig))
+        print(f"{'':11}changed={changed:<5} eigenvector top: {labels[best]} {eig[best]:.3f} "
+              f"({tracker.iterations['eigenvector']} iterations)")
+
+
+def replay_file(midi_path: Path, realtime: bool):
+    """Yield (stream_time, message) pairs from a file, optionally in real time."""
+    mid = mido.MidiFile(midi_path)
+    now = 0.0
+    messages = mid.play() if realtime else mid
+    for msg in messages:
+        now += msg.time
+        yield now, msg
+
+
+def read_port(port_name: str):
+    """Yield (stream_time, message) pairs from a MIDI input port."""
+    start = time.perf_counter()
+    with mido.open_input(port_name) as port:
+        for msg in port:
+            yield time.perf_counter() - start, msg
+
+
+def run(
+    stream, channel: int | None, interval: float, centrality: bool = False
+) -> TransitionAccumulator:
+    acc = TransitionAccumulator(target_channel=channel)
+    tracker = IncrementalCentrality(acc.snapshot()) if centrality else None
+    next_report = interval
+    stream_time = 0.0
+    try:
+        for stream_time, msg in stream:
+            acc.feed(msg)
+            if stream_time >= next_report:
+                print_summary(acc, stream_time, tracker)
+                next_report = stream_time + interval
+    except KeyboardInterrupt:
+        pass
+    print_summary(acc, stream_time, tracker)
+    return acc
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Live Tonnetz transition analysis.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--midi", type=str,
+                        help="MIDI file to replay (looked up in raw_midi/) or absolute path")
+    source.add_argument("--port", type=str,
+                        help="Name of a MIDI input port to listen on")
+    parser.add_argument("--channel", type=int, default=None,
+                        help="Only analyse this channel (0-15). Default: all channels")
+    parser.add_argument("--interval", type=float, default=REPORT_INTERVAL,
+                        help=f"Seconds of stream time between summaries (default {REPORT_INTERVAL})")
+    parser.add_argument("--fast", action="store_true",
+                        help="Replay the file as fast as possible instead of in real time")
+    parser.add_argument("--centrality", action="store_true",
+                        help="Also track eigenvector centrality, updated incrementally per summary")
+    args = parser.parse_args()
+
+    if args.port:
+        stream = read_port(args.port)
+    else:
+        midi_path = Path(args.midi)
+        if not midi_path.is_absolute():
+            midi_path = Path(__file__).resolve().parent.parent / "raw_midi" / args.midi
+        stream = replay_file(midi_path, realtime=not args.fast)
+
+    run(stream, args.channel, args.interval, centrality=args.centrality)
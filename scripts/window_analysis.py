@@ -0,0 +1,62 @@
+"""
+window_analysis.py
+
+Tracks harmonic drift through a piece: builds the transition matrix of every
+sliding window (e.g. 8 bars, 1-bar hop) from a single parse and prints the
+per-window statistics.
+
+Usage (from project root):
+    uv run python -m scripts.window_analysis beethooven-3rd-movement.mid
+    uv run python -m scripts.window_analysis My_Heart_Will_Go_On.mid --channel 4 --window 4 --hop 1
+"""
+
+import argparse
+from pathlib import Path
+
+from tonnetz.midi.windows import (
+    DEFAULT_BEATS_PER_BAR,
+    DEFAULT_HOP_BARS,
+    DEFAULT_WINDOW_BARS,
+    gen_transition_windows,
+    window_statistics,
+)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sliding-window Tonnetz transition statistics.")
+    parser.add_argument("midi", type=str,
+                        help="MIDI file (looked up in raw_midi/) or absolute path")
+    parser.add_argument("--channel", type=int, default=None,
+                        help="Only analyse this channel (0-15). Default: all channels")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW_BARS,
+                        help=f"Window length in bars (default {DEFAULT_WINDOW_BARS})")
+    parser.add_argument("--hop", type=int, default=DEFAULT_HOP_BARS,
+                        help=f"Hop between windows in bars (default {DEFAULT_HOP_BARS})")
+    parser.add_argument("--beats-per-bar", type=int, default=DEFAULT_BEATS_PER_BAR,
+                        help=f"Beats per bar (default {DEFAULT_BEATS_PER_BAR})")
+    args = parser.parse_args()
+
+    midi_path = Path(args.midi)
+    if not midi_path.is_absolute():
+        midi_path = Path(__file__).resolve().parent.parent / "raw_midi" / args.midi
+
+    windows = gen_transition_windows(
+        str(midi_path),
+        target_channel=args.channel,
+        window_bars=args.window,
+        hop_bars=args.hop,
+        beats_per_bar=args.beats_per_bar,
+    )
+    stats = window_statistics(windows)
+
+    print(f"{'bars':>9}  {'trans':>6}  {'edges':>5}  {'clust':>5}  {'giant':>5}  {'drift':>5}")
+    for w in range(len(windows)):
+        first_bar = w * args.hop + 1
+        print(
+            f"{first_bar:>4}-{first_bar + args.window - 1:<4}  {stats['transitions'][w]:>6}  "
+            f"{stats['edges'][w]:>5}  {stats['average_clustering'][w]:>5.2f}  "
+            f"{stats['giant_component'][w]:>5}  {stats['drift'][w]:>5.3f}"
+        )
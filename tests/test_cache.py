@@ -0,0 +1,59 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from tonnetz.midi.cache import ParseCache
+from tonnetz.midi.events import read_event_table
+from tonnetz.midi.parser import gen_transition_counts, gen_transition_poly
+
+
+@pytest.fixture
+def midi_file(tmp_path):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    src = os.path.join(project_root, "raw_midi", "My_Heart_Will_Go_On.mid")
+    dst = tmp_path / "song.mid"
+    shutil.copy(src, dst)
+    return str(dst)
+
+
+def test_cached_results_match(tmp_path, midi_file):
+    cache = ParseCache(tmp_path / "cache")
+    expected = gen_transition_poly(midi_file, 3)
+
+    first = gen_transition_poly(midi_file, 3, cache=cache)
+    assert len(cache) == 2  # event table + matrix
+    second = gen_transition_poly(midi_file, 3, cache=cache)
+    assert np.array_equal(first, expected) and np.array_equal(second, expected)
+
+    table = cache.event_table(midi_file)
+    assert np.array_equal(table.events, read_event_table(midi_file).events)
+
+    counts = gen_transition_counts(midi_file, 3, cache=cache)
+    assert np.array_equal(counts.counts, gen_transition_counts(midi_file, 3).counts)
+    assert np.array_equal(counts.matrix, expected)
+
+
+def test_key_follows_content(tmp_path, midi_file):
+    cache = ParseCache(tmp_path / "cache")
+    cache.event_table(midi_file)
+    renamed = shutil.copy(midi_file, tmp_path / "renamed.mid")
+    cache.event_table(str(renamed))
+    assert len(cache) == 1
+
+    assert cache.invalidate(midi_file) == 1
+    assert len(cache) == 0
+
+
+def test_lru_eviction(tmp_path, midi_file):
+    cache = ParseCache(tmp_path / "cache")
+    cache.event_table(midi_file)
+    limit = cache.size_bytes() + 4096
+    cache = ParseCache(tmp_path / "cache", max_bytes=limit)
+    for channel in range(16):
+        cache.transition_matrix(midi_file, channel)
+    assert cache.size_bytes() <= limit
+    cache.clear()
+    assert len(cache) == 0
@@ -1,13 +1,18 @@
+import re
+
 import numpy as np
 import pytest
 from tonnetz.graph.builder import build_random_adjacency_matrix
 from tonnetz.graph.centrality import (
+    CentralityEngine,
+    get_centralities,
     find_betweenness_centrality,
     find_eigenvector_centrality,
     find_degree_centrality,
     print_top,
     print_centralities
 )
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE, FULL_PITCH_SPACE
 
 # --- Fixtures ---
 
@@ -72,6 +77,71 @@ def test_random_graph_node_count(random_adj):
     n = random_adj.shape[0]
     assert len(find_degree_centrality(random_adj)) == n
 
+
+# --- CentralityEngine ---
+
+def test_engine_matches_dict_functions(random_adj):
+    engine = CentralityEngine()
+    scores = engine.compute(random_adj)
+    btw = find_betweenness_centrality(random_adj)
+    eig = find_eigenvector_centrality(random_adj)
+    deg = find_degree_centrality(random_adj)
+    n = random_adj.shape[0]
+    assert np.allclose(scores["betweenness"], [btw[str(i)] for i in range(n)])
+    assert np.allclose(scores["eigenvector"], [eig[str(i)] for i in range(n)])
+    assert np.allclose(scores["degree"], [deg[i] for i in range(n)])
+
+    ctr = get_centralities(random_adj, engine=engine)
+    assert ctr["btw"] is scores["betweenness"]
+    assert not ctr["deg"].flags.writeable
+
+def test_engine_builds_graph_once_and_memoizes(simple_adj):
+    engine = CentralityEngine()
+    graph = engine.graph(simple_adj)
+    engine.compute(simple_adj, ("deg",))
+    engine.compute(simple_adj.copy(), ("degree", "btw"))
+    assert engine.graph(simple_adj.copy()) is graph
+    assert engine.misses == 2 and engine.hits == 1
+
+def test_engine_degree_needs_no_graph(random_adj):
+    import networkx as nx
+    engine = CentralityEngine()
+    adj = random_adj.copy()
+    adj[3, 3] = 0.5  # self-loops count once, as in networkx
+    scores = engine.degree(adj)
+    assert engine._entries[next(iter(engine._entries))]["graph"] is None
+    expected = nx.in_degree_centrality(nx.from_numpy_array(adj, create_using=nx.DiGraph()))
+    assert np.allclose(scores, [expected[node] for node in range(adj.shape[0])])
+
+def test_print_centralities_labels_any_size(capsys):
+    rng = np.random.default_rng(0)
+    adj = (rng.random((128, 128)) < 0.05) * rng.random((128, 128))
+    print_centralities(adj)
+    labels = FULL_PITCH_SPACE.labels()
+    ranked = re.findall(r"Node\s+(\d+) \((\S+)\)", capsys.readouterr().out)
+    assert len(ranked) == 30
+    assert all(labels[int(node)] == label for node, label in ranked)
+    with pytest.raises(ValueError):
+        print_centralities(adj, pitch_space=DEFAULT_PITCH_SPACE)
+
+def test_engine_evicts_least_recently_used(simple_adj):
+    engine = CentralityEngine(max_entries=2)
+    a, b, c = simple_adj, simple_adj * 2, simple_adj * 3
+    engine.degree(a)
+    engine.degree(b)
+    engine.degree(a)        # a is now most recently used
+    engine.degree(c)        # evicts b
+    assert len(engine) == 2
+    misses = engine.misses
+    engine.degree(a)
+    assert engine.misses == misses
+    engine.degree(b)
+    assert engine.misses == misses + 1
+
+def test_engine_rejects_unknown_metric(simple_adj):
+    with pytest.raises(ValueError):
+        CentralityEngine().compute(simple_adj, ("closeness",))
+
 if __name__ == "__main__":
     adj = build_random_adjacency_matrix()
     print_centralities(adj)
\ No newline at end of file
@@ -0,0 +1,59 @@
+import os
+
+import numpy as np
+import pytest
+
+from tonnetz.midi.corpus import corpus_counts, find_midi_files, parse_corpus
+from tonnetz.midi.parser import gen_transition_poly
+
+
+@pytest.fixture
+def midi_dir():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    return os.path.join(project_root, "raw_midi")
+
+
+@pytest.fixture
+def corpus_dir(tmp_path, midi_dir):
+    for name in ("My_Heart_Will_Go_On.mid", "rw_melody_degree.mid"):
+        (tmp_path / name).write_bytes(open(os.path.join(midi_dir, name), "rb").read())
+    (tmp_path / "broken.mid").write_bytes(b"not a midi file")
+    (tmp_path / "channels.csv").write_text("My_Heart_Will_Go_On.mid, 3\n")
+    return tmp_path
+
+
+def test_find_midi_files(corpus_dir):
+    assert len(find_midi_files(corpus_dir)) == 3
+    assert len(find_midi_files(str(corpus_dir / "rw_*.mid"))) == 1
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_corpus_matches_single_file(corpus_dir, workers):
+    matrices, manifest = parse_corpus(
+        corpus_dir, channel_map=corpus_dir / "channels.csv", workers=workers
+    )
+    assert matrices.shape == (2, 48, 48)
+    assert [m["channel"] for m in manifest] == [3, 0, 0]
+
+    for record in manifest:
+        if record["row"] is None:
+            continue
+        expected = gen_transition_poly(record["path"], record["channel"])
+        assert np.allclose(matrices[record["row"]], expected)
+
+
+def test_parse_corpus_records_errors(corpus_dir):
+    calls = []
+    _, manifest = parse_corpus(corpus_dir, workers=1, progress=lambda d, t: calls.append((d, t)))
+    broken = [m for m in manifest if m["path"].endswith("broken.mid")]
+    assert broken[0]["row"] is None and broken[0]["error"]
+    assert calls[-1] == (3, 3)
+
+
+def test_corpus_counts_reduce(corpus_dir):
+    stacked, _ = parse_corpus(corpus_dir, workers=1, raw_counts=True)
+    total, manifest = corpus_counts(corpus_dir, workers=2)
+    assert np.issubdtype(stacked.dtype, np.unsignedinteger)
+    assert np.array_equal(total.counts, stacked.sum(axis=0))
+    assert sum(m["error"] is not None for m in manifest) == 1
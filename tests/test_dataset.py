@@ -0,0 +1,143 @@
+import csv
+
+import numpy as np
+import pytest
+
+from tonnetz.gen.dataset import (
+    WRITE_BLOCK,
+    convert_csv,
+    header_path,
+    read_tokens,
+    sequence_seeds,
+    shard_ranges,
+    write_walk_dataset,
+)
+from tonnetz.gen.walk import Walker
+
+
+@pytest.fixture
+def walker():
+    rng = np.random.default_rng(0)
+    mat = rng.exponential(0.3, size=(48, 48))
+    mat = mat / mat.max()
+    mat[mat < 0.2] = 0
+    return Walker(mat)
+
+
+def test_sequence_seeds_match_spawn():
+    children = np.random.SeedSequence(7).spawn(10)
+    for got, expected in zip(sequence_seeds(7, 4, 10), children[4:]):
+        assert np.array_equal(got.generate_state(4), expected.generate_state(4))
+
+
+def test_shard_ranges_cover_all_sequences():
+    ranges = shard_ranges(10, 3)
+    assert ranges[0][0] == 0 and ranges[-1][1] == 10
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    with pytest.raises(ValueError):
+        shard_ranges(10, 0)
+
+
+@pytest.mark.parametrize("workers, shards", [(1, 3), (2, 2), (2, 5)])
+def test_output_independent_of_workers_and_shards(tmp_path, walker, workers, shards):
+    (single,) = write_walk_dataset(walker, 23, 40, tmp_path / "single.csv", seed=5)
+    (merged,) = write_walk_dataset(
+        walker, 23, 40, tmp_path / "merged.csv", seed=5, workers=workers, shards=shards
+    )
+    assert merged.read_bytes() == single.read_bytes()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["merged.csv", "single.csv"]
+
+    with open(single, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == [f"step_{i}" for i in range(40)]
+    seeds = np.random.SeedSequence(5).spawn(23)
+    assert [int(v) for v in rows[12]] == walker.sample(40, seeds[11])
+    assert len(rows) == 24
+
+
+def test_progress_per_block_in_process(tmp_path, walker):
+    calls = []
+    write_walk_dataset(walker, 150, 5, tmp_path / "seq.csv", seed=0,
+                       progress=lambda done, total: calls.append((done, total)))
+    assert calls == [(WRITE_BLOCK, 150), (2 * WRITE_BLOCK, 150), (150, 150)]
+
+    calls.clear()
+    write_walk_dataset(walker, 150, 5, tmp_path / "seq.csv", seed=0, workers=2, shards=3,
+                       progress=lambda done, total: calls.append((done, total)))
+    assert calls == [(50, 150), (100, 150), (150, 150)]
+
+
+def test_unmerged_shards(tmp_path, walker):
+    paths = write_walk_dataset(walker, 10, 20, tmp_path / "seq.csv", seed=1, shards=4, merge=False)
+    assert [p.name for p in paths] == [f"seq.shard-{k:05d}-of-00004.csv" for k in range(4)]
+    rows = [row for p in paths for row in list(csv.reader(open(p, newline="")))[1:]]
+    expected = walker.sample_many(np.random.SeedSequence(1).spawn(10), 20)
+    assert np.array_equal(np.array(rows, dtype=int), expected)
+
+
+def test_tokens_match_csv(tmp_path, walker):
+    (csv_path,) = write_walk_dataset(walker, 30, 50, tmp_path / "seq.csv", seed=3)
+    (tokens_path,) = write_walk_dataset(
+        walker, 30, 50, tmp_path / "seq.tokens", seed=3, workers=2, shards=4
+    )
+    dataset = read_tokens(tokens_path)
+    assert isinstance(dataset.tokens, np.memmap) and dataset.tokens.dtype == np.int8
+    assert dataset.tokens.shape == (30, 50)
+    assert dataset.seed == 3 and dataset.matrix_hash == walker.matrix_hash
+    assert dataset.params["centrality_type"] == "eigenvector"
+
+    with open(csv_path, newline="") as f:
+        rows = [[int(v) for v in row] for row in list(csv.reader(f))[1:]]
+    assert dataset.sequences() == rows
+    assert dataset.subset(10, 12).sequences() == rows[10:12]
+
+    converted = read_tokens(convert_csv(csv_path, tmp_path / "converted.tokens", block=7))
+    assert np.array_equal(converted.tokens, dataset.tokens)
+    assert converted.seed is None and converted.params == {"source": "seq.csv"}
+
+    # A whole block of blank lines does not end the conversion early
+    lines = csv_path.read_text().splitlines(keepends=True)
+    gappy = tmp_path / "gappy.csv"
+    gappy.write_text("".join(lines[:5] + ["\n"] * 20 + lines[5:] + ["\n"] * 3))
+    converted = read_tokens(convert_csv(gappy, block=7))
+    assert np.array_equal(converted.tokens, dataset.tokens)
+
+
+def test_unmerged_token_shards_have_headers(tmp_path, walker):
+    paths = write_walk_dataset(walker, 9, 20, tmp_path / "seq.tokens", seed=2, shards=2, merge=False)
+    first = [read_tokens(p).header["first_sequence"] for p in paths]
+    assert first == [start for start, _ in shard_ranges(9, 2)]
+    stacked = np.concatenate([read_tokens(p).tokens for p in paths])
+    assert np.array_equal(stacked, walker.sample_many(np.random.SeedSequence(2).spawn(9), 20))
+
+    paths[0].write_bytes(paths[0].read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        read_tokens(paths[0])
+    header_path(paths[1]).write_text('{"format": "other"}')
+    with pytest.raises(ValueError):
+        read_tokens(paths[1])
+
+
+def test_windows_match_create_seq(tmp_path, walker):
+    (path,) = write_walk_dataset(walker, 4, 40, tmp_path / "seq.tokens", seed=0)
+    dataset = read_tokens(path)
+    seq_len = 31
+
+    # Pairs in the order create_seq writes them to the windowed CSV
+    expected = [
+        (row[i:i + seq_len], row[i + seq_len])
+        for row in dataset.sequences()
+        for i in range(len(row) - seq_len)
+    ]
+    windows = dataset.windows(seq_len)
+    assert len(windows) == len(expected) == 4 * 9
+    for k in (0, 8, 9, 35, -1):
+        x, y = windows[k]
+        assert (x.tolist(), y) == expected[k]
+
+    x, y = windows.batch([3, 20, 35])
+    assert x.shape == (3, seq_len)
+    assert [(a.tolist(), int(b)) for a, b in zip(x, y)] == [expected[k] for k in (3, 20, 35)]
+    with pytest.raises(IndexError):
+        windows[len(expected)]
+    assert len(dataset.windows(40)) == 0
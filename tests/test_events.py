@@ -0,0 +1,116 @@
+import os
+
+import mido
+import numpy as np
+import pytest
+
+from tonnetz.midi.events import (
+    EVENT_DTYPE,
+    NOTE_OFF,
+    NOTE_ON,
+    read_event_table,
+    select_events,
+)
+from tonnetz.midi.tempo import DEFAULT_TEMPO, TempoMap
+
+
+@pytest.fixture
+def midi_file():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    return os.path.join(project_root, "raw_midi", "My_Heart_Will_Go_On_combined.mid")
+
+
+@pytest.fixture
+def tempo_change_file(tmp_path):
+    """Two tracks with a tempo change halfway through the first beat pair."""
+    mid = mido.MidiFile(ticks_per_beat=100)
+    conductor = mido.MidiTrack()
+    conductor.append(mido.MetaMessage("set_tempo", tempo=500_000, time=0))
+    conductor.append(mido.MetaMessage("set_tempo", tempo=250_000, time=100))
+    notes = mido.MidiTrack()
+    notes.append(mido.Message("note_on", note=60, velocity=90, channel=2, time=0))
+    notes.append(mido.Message("control_change", control=7, value=100, channel=2, time=50))
+    notes.append(mido.Message("note_off", note=60, velocity=40, channel=2, time=150))
+    notes.append(mido.Message("note_on", note=64, velocity=0, channel=3, time=0))
+    mid.tracks.extend([conductor, notes])
+    path = tmp_path / "tempo.mid"
+    mid.save(path)
+    return str(path)
+
+
+def test_matches_mido_playback_order(midi_file):
+    table = read_event_table(midi_file)
+    assert table.events.dtype == EVENT_DTYPE
+
+    expected = []
+    abs_sec = 0.0
+    for msg in mido.MidiFile(midi_file):
+        abs_sec += msg.time
+        if msg.type in ("note_on", "note_off"):
+            expected.append((abs_sec, msg.channel, msg.note))
+
+    assert len(expected) == table.events.size
+    times, channels, notes = zip(*expected)
+    assert np.allclose(table.events["time_sec"], times)
+    assert np.array_equal(table.events["channel"], channels)
+    assert np.array_equal(table.events["note"], notes)
+
+
+def test_tempo_changes(tempo_change_file):
+    table = read_event_table(tempo_change_file)
+    assert table.ticks_per_beat == 100
+    assert np.array_equal(table.tempos["tempo"], [500_000, 250_000])
+
+    events = table.events
+    assert np.array_equal(events["tick"], [0, 200, 200])
+    # 100 ticks at 0.5 s/beat + 100 ticks at 0.25 s/beat
+    assert np.allclose(events["time_sec"], [0.0, 0.75, 0.75])
+    assert np.array_equal(events["kind"], [NOTE_ON, NOTE_OFF, NOTE_OFF])
+    assert np.array_equal(events["track"], [1, 1, 1])
+
+
+def test_select_events(tempo_change_file):
+    events = read_event_table(tempo_change_file).events
+    assert select_events(events, channels=[2]).size == 2
+    assert select_events(events, note_range=(62, 70))["note"].tolist() == [64]
+    assert select_events(events, tracks=[0]).size == 0
+
+
+def test_tempo_map(tempo_change_file):
+    tempo_map = read_event_table(tempo_change_file).tempo_map
+    assert tempo_map.initial_bpm == 120.0
+    assert np.allclose(tempo_map.to_seconds([0, 50, 100, 200, 300]), [0.0, 0.25, 0.5, 0.75, 1.0])
+    assert np.allclose(tempo_map.to_ticks([0.0, 0.25, 0.5, 0.75, 1.0]), [0, 50, 100, 200, 300])
+    assert tempo_map.tempo_at(99) == 500_000 and tempo_map.tempo_at(100) == 250_000
+
+    empty = TempoMap.from_tempos(np.zeros(0, dtype=[("tick", "i8"), ("tempo", "i8")]), 480)
+    assert empty.initial_tempo == DEFAULT_TEMPO
+    assert np.isclose(empty.to_seconds(960), 1.0)
+
+
+def test_tempo_map_dense_automation(tmp_path):
+    """A ritardando with a tempo change every tick matches mido playback."""
+    mid = mido.MidiFile(ticks_per_beat=96)
+    track = mido.MidiTrack()
+    for i in range(400):
+        track.append(mido.MetaMessage("set_tempo", tempo=400_000 + 1_000 * i, time=0 if i == 0 else 1))
+        if i % 10 == 0:
+            track.append(mido.Message("note_on", note=60, velocity=80, time=0))
+            track.append(mido.Message("note_off", note=60, velocity=0, time=0))
+    mid.tracks.append(track)
+    path = tmp_path / "rit.mid"
+    mid.save(path)
+
+    expected = []
+    now = 0.0
+    for msg in mido.MidiFile(path):
+        now += msg.time
+        if msg.type == "note_on":
+            expected.append(now)
+
+    table = read_event_table(str(path))
+    on_times = table.events["time_sec"][table.events["kind"] == NOTE_ON]
+    assert np.allclose(on_times, expected)
+    ticks = table.events["tick"][table.events["kind"] == NOTE_ON]
+    assert np.allclose(table.tempo_map.to_ticks(on_times), ticks)
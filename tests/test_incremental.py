@@ -0,0 +1,62 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from tonnetz.graph.builder import build_random_adjacency_matrix
+from tonnetz.graph.incremental import IncrementalCentrality
+from tonnetz.graph.spectral import eigenvector_centrality, pagerank
+
+
+@pytest.fixture
+def adj():
+    np.random.seed(5)
+    return build_random_adjacency_matrix()
+
+
+def _in_degree(adj):
+    G = nx.from_numpy_array(adj, create_using=nx.DiGraph())
+    scores = nx.in_degree_centrality(G)
+    return np.array([scores[i] for i in range(adj.shape[0])])
+
+
+def test_updates_match_recomputation(adj):
+    tracker = IncrementalCentrality(adj)
+    tracker.eigenvector()
+    tracker.pagerank()
+    cold = tracker.total_iterations["eigenvector"]
+
+    current = adj.copy()
+    rng = np.random.default_rng(0)
+    for _ in range(5):
+        rows, cols = rng.integers(0, 48, size=(2, 6))
+        weights = np.where(rng.random(6) < 0.3, 0.0, rng.random(6))
+        tracker.update(rows, cols, weights)
+        for r, c, w in zip(rows, cols, weights):
+            current[r, c] = w
+
+        assert np.array_equal(tracker.matrix, current)
+        assert np.allclose(tracker.degree(), _in_degree(current))
+        assert np.allclose(tracker.eigenvector(), eigenvector_centrality(current).scores, atol=1e-4)
+        assert np.allclose(tracker.pagerank(), pagerank(current).scores, atol=1e-4)
+        assert tracker.iterations["eigenvector"] < cold
+
+
+def test_update_matrix_and_laziness(adj):
+    tracker = IncrementalCentrality(adj)
+    first = tracker.eigenvector()
+    assert tracker.update_matrix(adj) == 0
+    assert tracker.eigenvector() is first
+
+    changed = adj.copy()
+    changed[0, :] = 0
+    changed[3, 7] = 0.5
+    expected = np.count_nonzero(changed != adj)
+    assert tracker.update_matrix(changed) == expected
+    assert np.allclose(tracker.degree(), _in_degree(changed))
+    assert tracker.eigenvector() is not first
+
+    # Repeated edges: the last weight wins
+    tracker.update([1, 1], [2, 2], [0.3, 0.0])
+    assert tracker.matrix[1, 2] == 0
+    with pytest.raises(ValueError):
+        tracker.update_matrix(np.zeros((4, 4)))
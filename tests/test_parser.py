@@ -1,7 +1,20 @@
 # Test if midi is loaded correctly and transition matrix is generated
 import os
+import mido
 import numpy as np
-from tonnetz.midi.parser import gen_transition_poly
+import scipy.sparse as sp
+from tonnetz.midi.events import EVENT_DTYPE, NOTE_OFF, NOTE_ON, read_events
+from tonnetz.midi.parser import (
+    TransitionAccumulator,
+    TransitionCounts,
+    gen_transition_all_channels,
+    gen_transition_counts,
+    gen_transition_poly,
+    normalize_transition_counts,
+    split_by_channel,
+    transition_counts_from_events,
+)
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE, FULL_PITCH_SPACE, PitchSpace
 
 
 def test_gen_transition_mono():
@@ -26,5 +39,128 @@ def test_gen_transition_mono():
     print("Monophonic parser working correctly.")
 
 
+def test_all_channels_single_pass():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    midi_file = os.path.join(project_root, "raw_midi", "Pinball_Wizard.mid")
+
+    result = gen_transition_all_channels(midi_file)
+    assert result.matrices.shape == (16, 48, 48)
+    for channel in range(16):
+        assert np.allclose(result.matrices[channel], gen_transition_poly(midi_file, channel))
+        assert np.all(result.events[channel]["channel"] == channel)
+
+    assert sum(ev.size for ev in result.events) == read_events(midi_file).size
+    assert np.allclose(result.combined, normalize_transition_counts(result.counts.sum(axis=0)))
+
+
+def test_accumulator_streaming_matches_file():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    midi_file = os.path.join(project_root, "raw_midi", "My_Heart_Will_Go_On.mid")
+
+    acc = TransitionAccumulator(target_channel=4)
+    for msg in mido.MidiFile(midi_file):
+        acc.feed(msg)
+    assert np.array_equal(acc.snapshot(), gen_transition_poly(midi_file, 4))
+
+
+def test_accumulator_chord_semantics():
+    acc = TransitionAccumulator(PitchSpace(min_note=0, num_notes=4))
+    acc.note_on(0)
+    acc.note_on(1)          # chord 0+1
+    acc.note_off(0)         # prev chord = {0, 1}
+    acc.note_on(2)          # active {1} <-> 2, plus prev chord {0, 1} -> 2
+    first = acc.snapshot()
+    assert acc.snapshot() is first
+
+    expected = np.zeros((4, 4), dtype=int)
+    expected[0, 1] = expected[1, 0] = 1
+    expected[1, 2] = 2
+    expected[2, 1] = 1
+    expected[0, 2] = 1
+    assert np.array_equal(acc.counts, expected)
+
+    acc.note_on(3)
+    assert acc.snapshot() is not first
+
+
+def test_transition_counts_merge():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    midi_file = os.path.join(project_root, "raw_midi", "Pinball_Wizard.mid")
+
+    per_channel = [gen_transition_counts(midi_file, ch) for ch in range(16)]
+    assert np.array_equal(per_channel[0].matrix, gen_transition_poly(midi_file, 0))
+    assert per_channel[0].counts.dtype.itemsize <= 2
+    assert not per_channel[0].counts.flags.writeable
+
+    merged = sum(per_channel)
+    by_channel = gen_transition_all_channels(midi_file)
+    assert np.array_equal(merged.counts, by_channel.counts.sum(axis=0))
+    assert np.allclose(merged.matrix, by_channel.combined)
+    assert merged.total == sum(c.total for c in per_channel)
+    assert merged.thresholded(0.05) is merged.thresholded(0.05)
+
+    stacked = TransitionCounts(by_channel.counts)
+    assert np.array_equal(stacked.sum().counts, merged.counts)
+
+
+def test_full_pitch_space_is_sparse():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    midi_file = os.path.join(project_root, "raw_midi", "Pinball_Wizard.mid")
+
+    full = gen_transition_counts(midi_file, 0, pitch_space=FULL_PITCH_SPACE)
+    assert full.is_sparse and full.counts.shape == (128, 128)
+    assert sp.issparse(full.matrix)
+    dense_full = gen_transition_poly(midi_file, 0, pitch_space=FULL_PITCH_SPACE)
+    assert np.allclose(full.matrix.toarray(), dense_full)
+
+    # Channel 0 stays inside C2-B5, so the default matrix is a sub-block
+    window = gen_transition_counts(midi_file, 0)
+    lo, hi = DEFAULT_PITCH_SPACE.min_note, DEFAULT_PITCH_SPACE.max_note + 1
+    assert np.array_equal(full.toarray()[lo:hi, lo:hi], window.counts)
+
+    # Channel 4 reaches down to E1; those notes are only counted in full range
+    low_full = gen_transition_counts(midi_file, 4, pitch_space=FULL_PITCH_SPACE)
+    assert low_full.total > gen_transition_counts(midi_file, 4).total
+    assert low_full.toarray()[:, :lo].any()
+
+    merged = full + full
+    assert merged.is_sparse and merged.total == 2 * full.total
+
+
+def _loop_counts(events, pitch_space=DEFAULT_PITCH_SPACE):
+    acc = TransitionAccumulator(pitch_space)
+    acc.feed_events(events)
+    return acc.counts
+
+
+def test_vectorized_counts_match_accumulator():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    for name in sorted(os.listdir(os.path.join(project_root, "raw_midi"))):
+        if not name.endswith(".mid"):
+            continue
+        events = read_events(os.path.join(project_root, "raw_midi", name))
+        for channel_events in split_by_channel(events):
+            assert np.array_equal(
+                transition_counts_from_events(channel_events), _loop_counts(channel_events)
+            ), name
+
+    # Synthetic streams with repeated note_ons, stray releases, notes outside
+    # the window and chords spanning the 4096-event state blocks
+    rng = np.random.default_rng(0)
+    space = PitchSpace(min_note=40, num_notes=12)
+    for size in (0, 1, 50, 10_000):
+        events = np.zeros(size, dtype=EVENT_DTYPE)
+        events["note"] = rng.integers(36, 56, size)
+        events["kind"] = np.where(rng.random(size) < 0.6, NOTE_ON, NOTE_OFF)
+        assert np.array_equal(
+            transition_counts_from_events(events, space), _loop_counts(events, space)
+        )
+
+
 if __name__ == "__main__":
     test_gen_transition_mono()
@@ -0,0 +1,118 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from tonnetz.graph.centrality import find_betweenness_centrality, find_closeness_centrality
+from tonnetz.graph.paths import (
+    approximate_betweenness,
+    betweenness_samples,
+    largest_component,
+    shortest_paths,
+)
+from tonnetz.graph.statistics import Stats
+
+
+@pytest.fixture(params=[0, 1, 2])
+def adj(request):
+    rng = np.random.default_rng(request.param)
+    mat = rng.exponential(0.3, size=(48, 48))
+    mat = mat / mat.max()
+    mat[mat < (0.2, 0.5, 0.6)[request.param]] = 0
+    if request.param == 1:
+        # Coarse weights produce many equal-length shortest paths
+        mat = np.round(mat * 4) / 4
+    return mat
+
+
+def test_betweenness_matches_networkx(adj):
+    G = nx.from_numpy_array(adj, create_using=nx.DiGraph())
+    for weighted, weight in ((True, "weight"), (False, None)):
+        expected = nx.betweenness_centrality(G, normalized=True, weight=weight)
+        result = shortest_paths(adj, weighted=weighted).betweenness()
+        assert np.allclose(result, [expected[i] for i in range(48)], rtol=0, atol=1e-12)
+
+    expected = nx.betweenness_centrality(G, normalized=False, weight="weight")
+    result = shortest_paths(adj).betweenness(normalized=False)
+    assert np.allclose(result, [expected[i] for i in range(48)], rtol=0, atol=1e-9)
+
+    result = find_betweenness_centrality(adj)
+    expected = nx.betweenness_centrality(G, normalized=True, weight="weight")
+    assert all(np.isclose(result[str(i)], expected[i], rtol=0, atol=1e-12) for i in range(48))
+
+
+def test_closeness_matches_networkx(adj):
+    G = nx.from_numpy_array(adj, create_using=nx.DiGraph())
+    expected = nx.closeness_centrality(G, distance="weight")
+    result = find_closeness_centrality(adj)
+    assert all(np.isclose(result[str(i)], expected[i]) for i in range(48))
+
+    expected = nx.closeness_centrality(G, wf_improved=False)
+    result = shortest_paths(adj, weighted=False).closeness(wf_improved=False)
+    assert np.allclose(result, [expected[i] for i in range(48)])
+
+
+def test_diameter_and_eccentricity_match_networkx(adj):
+    U = (adj != 0) | (adj != 0).T
+    np.fill_diagonal(U, False)
+    Gu = nx.from_numpy_array(U.astype(int), create_using=nx.Graph())
+    giant = max(nx.connected_components(Gu), key=len)
+    H = Gu.subgraph(giant)
+
+    assert list(largest_component(adj)) == sorted(giant)
+    assert Stats.find_eccentricity(adj) == nx.eccentricity(H)
+    assert Stats.find_diameter(adj) == nx.diameter(H)
+
+    G = nx.from_numpy_array(adj, create_using=nx.DiGraph())
+    paths = shortest_paths(adj)
+    if nx.is_strongly_connected(G):
+        assert paths.diameter() == pytest.approx(nx.diameter(G, weight="weight"))
+    else:
+        assert paths.diameter() == np.inf
+
+
+def test_degenerate_graphs():
+    assert Stats.find_diameter(np.zeros((48, 48))) == 0
+    assert Stats.find_diameter(np.zeros((0, 0))) == 0
+    assert np.array_equal(shortest_paths(np.zeros((4, 4))).betweenness(), np.zeros(4))
+
+    # Unreachable pairs contribute nothing
+    chain = np.zeros((5, 5))
+    chain[0, 1] = chain[1, 2] = chain[3, 4] = 1
+    assert np.allclose(shortest_paths(chain).betweenness(normalized=False), [0, 1, 0, 0, 0])
+
+
+def test_approximate_betweenness(adj):
+    exact = shortest_paths(adj).betweenness()
+
+    full = approximate_betweenness(adj, samples=1000)
+    assert full.samples == 48 and full.error == 0
+    assert np.allclose(full.scores, exact, rtol=0, atol=1e-12)
+
+    first = approximate_betweenness(adj, samples=16, seed=3)
+    again = approximate_betweenness(adj, samples=16, seed=3)
+    assert np.array_equal(first.scores, again.scores)
+    assert first.samples == 16 and 0 < first.error < 1
+    assert np.abs(first.scores - exact).max() <= first.error
+    assert first.std_error.shape == (48,)
+
+    # Unbiased: averaging many independent estimates approaches the exact values
+    mean = np.mean([approximate_betweenness(adj, samples=8, seed=s).scores for s in range(200)], axis=0)
+    assert np.abs(mean - exact).max() < 0.01
+
+    result = find_betweenness_centrality(adj, samples=16, seed=3)
+    assert np.allclose([result[str(i)] for i in range(48)], first.scores)
+
+
+def test_betweenness_samples_bound():
+    # k >= R^2 / (2 eps^2) ln(2n / delta), R = n / (n - 1)
+    k = betweenness_samples(1000, epsilon=0.05, delta=0.1)
+    R = 1000 / 999
+    assert k == int(np.ceil(R**2 / (2 * 0.05**2) * np.log(2 * 1000 / 0.1)))
+    assert betweenness_samples(1000, 0.1) < k
+
+    est = approximate_betweenness(np.ones((200, 200)), epsilon=0.2, delta=0.1, seed=0)
+    assert est.samples == betweenness_samples(200, 0.2, 0.1)
+    assert est.error <= 0.2 + 1e-12
+
+    with pytest.raises(ValueError):
+        approximate_betweenness(np.ones((4, 4)))
@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from scipy.sparse import csgraph
+
+from tonnetz.graph.percolation import threshold_sweep
+from tonnetz.graph.statistics import GraphStats
+from tonnetz.midi.parser import gen_transition_counts
+
+
+@pytest.fixture
+def counts():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    return gen_transition_counts(os.path.join(project_root, "raw_midi", "My_Heart_Will_Go_On.mid"), 4)
+
+
+def _stats(adj):
+    stats = GraphStats(adj)
+    num_components, _ = csgraph.connected_components(stats.undirected, directed=False)
+    return np.count_nonzero(adj), num_components, stats.giant_component_size
+
+
+def test_sweep_matches_rethresholding():
+    rng = np.random.default_rng(0)
+    adj = np.round(rng.random((48, 48)), 2)
+    adj[adj < 0.9] = 0
+    curve = threshold_sweep(adj)
+    assert np.all(np.diff(curve.thresholds) < 0)
+    for i, threshold in enumerate(curve.thresholds):
+        pruned = np.where(adj >= threshold, adj, 0)
+        assert (curve.edges[i], curve.components[i], curve.giant_component[i]) == _stats(pruned)
+
+
+def test_curve_of_transition_matrix(counts):
+    curve = threshold_sweep(counts.normalized)
+    assert curve.edges[-1] == np.count_nonzero(counts.normalized)
+
+    # The default pruning threshold is one point of the curve
+    point = curve.at(0.01)
+    assert (point["edges"], point["components"], point["giant_component"]) == _stats(counts.matrix)
+
+    above = curve.at([2.0, curve.thresholds[0]])
+    assert list(above["edges"]) == [0, np.count_nonzero(counts.normalized == curve.thresholds[0])]
+    assert above["components"][0] == 48 and above["giant_component"][0] == 1
+
+    sparse = threshold_sweep(sp.csr_array(counts.normalized))
+    assert np.array_equal(sparse.giant_component, curve.giant_component)
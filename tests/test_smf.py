@@ -0,0 +1,75 @@
+import os
+
+import mido
+import numpy as np
+import pytest
+
+from tonnetz.midi.events import read_event_table
+from tonnetz.midi.parser import gen_transition_poly
+from tonnetz.midi.player import midi_to_events_ticks
+from tonnetz.midi.smf import parse_smf, read_smf_event_table
+
+
+def _raw_midi_files():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    raw_dir = os.path.join(project_root, "raw_midi")
+    return [os.path.join(raw_dir, f) for f in sorted(os.listdir(raw_dir)) if f.endswith(".mid")]
+
+
+@pytest.mark.parametrize("midi_file", _raw_midi_files(), ids=os.path.basename)
+def test_smf_matches_mido(midi_file):
+    expected = read_event_table(midi_file)
+    table = read_smf_event_table(midi_file)
+    assert table.ticks_per_beat == expected.ticks_per_beat
+    assert np.array_equal(table.events, expected.events)
+    assert np.array_equal(table.tempos, expected.tempos)
+
+    for channel in np.unique(expected.events["channel"]).tolist():
+        assert np.array_equal(
+            gen_transition_poly(midi_file, channel, reader="smf"),
+            gen_transition_poly(midi_file, channel),
+        )
+        assert midi_to_events_ticks(midi_file, channel, reader="smf") == midi_to_events_ticks(
+            midi_file, channel
+        )
+
+
+def test_running_status_and_skipped_messages(tmp_path):
+    mid = mido.MidiFile(ticks_per_beat=120)
+    track = mido.MidiTrack()
+    track.append(mido.MetaMessage("set_tempo", tempo=400_000, time=0))
+    track.append(mido.Message("sysex", data=[1, 2, 3], time=0))
+    # mido writes consecutive same-status messages with running status
+    track.append(mido.Message("note_on", note=60, velocity=80, channel=5, time=10))
+    track.append(mido.Message("note_on", note=64, velocity=80, channel=5, time=0))
+    track.append(mido.Message("pitchwheel", pitch=100, channel=5, time=5))
+    track.append(mido.Message("program_change", program=3, channel=5, time=0))
+    track.append(mido.MetaMessage("text", text="hello", time=0))
+    track.append(mido.Message("note_on", note=60, velocity=0, channel=5, time=20))
+    track.append(mido.Message("note_off", note=64, velocity=30, channel=5, time=0))
+    mid.tracks.append(track)
+    path = tmp_path / "running.mid"
+    mid.save(path)
+
+    table = parse_smf(path.read_bytes())
+    expected = read_event_table(str(path))
+    assert np.array_equal(table.events, expected.events)
+    assert table.events["note"].tolist() == [60, 64, 60, 64]
+    assert table.tempos["tempo"].tolist() == [400_000]
+
+
+def test_rejects_bad_files(tmp_path):
+    with pytest.raises(ValueError):
+        parse_smf(b"RIFF0000")
+    path = tmp_path / "empty.mid"
+    path.write_bytes(b"")
+    with pytest.raises(EOFError):
+        read_smf_event_table(str(path))
+
+    mid = mido.MidiFile()
+    mid.tracks.append(mido.MidiTrack([mido.Message("note_on", note=60, time=0)]))
+    truncated = tmp_path / "truncated.mid"
+    mid.save(truncated)
+    with pytest.raises(EOFError):
+        parse_smf(truncated.read_bytes()[:-3])
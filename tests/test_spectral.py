@@ -0,0 +1,87 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from tonnetz.graph.centrality import (
+    find_eigenvector_centrality,
+    find_katz_centrality,
+    find_pagerank_centrality,
+)
+from tonnetz.graph.spectral import eigenvector_centrality, katz_centrality, pagerank
+
+
+@pytest.fixture
+def stack():
+    rng = np.random.default_rng(7)
+    mats = rng.exponential(0.3, size=(12, 48, 48))
+    mats /= mats.max(axis=(1, 2), keepdims=True)
+    mats[mats < 0.2] = 0
+    # Sparser members converge more slowly
+    mats[::3][mats[::3] < 0.4] = 0
+    return mats
+
+
+def _as_array(scores: dict) -> np.ndarray:
+    return np.array([scores[i] for i in range(len(scores))])
+
+
+def test_batched_matches_networkx(stack):
+    eig = eigenvector_centrality(stack)
+    pr = pagerank(stack)
+    katz = katz_centrality(stack)
+    assert eig.scores.shape == pr.scores.shape == katz.scores.shape == (12, 48)
+
+    for i, adj in enumerate(stack):
+        G = nx.from_numpy_array(adj, create_using=nx.DiGraph())
+        if eig.converged[i]:
+            expected = nx.eigenvector_centrality(G, max_iter=1000, tol=1e-6, weight="weight")
+            assert np.allclose(eig.scores[i], _as_array(expected), atol=1e-12)
+        assert np.allclose(pr.scores[i], _as_array(nx.pagerank(G, weight="weight")), atol=1e-12)
+        assert np.allclose(katz.scores[i], _as_array(nx.katz_centrality(G, weight="weight")), atol=1e-12)
+
+    assert np.allclose(find_eigenvector_centrality(stack), eig.scores)
+    assert np.allclose(find_pagerank_centrality(stack), pr.scores)
+    assert np.allclose(find_katz_centrality(stack), katz.scores)
+    single = find_pagerank_centrality(stack[0])
+    assert np.allclose(_as_array({int(k): v for k, v in single.items()}), pr.scores[0])
+
+
+def test_fallback_solves_exactly(stack):
+    G = nx.from_numpy_array(stack[1], create_using=nx.DiGraph())
+
+    eig = eigenvector_centrality(stack[1], max_iter=2)
+    assert not eig.converged and eig.iterations == 2
+    expected = nx.eigenvector_centrality_numpy(G, weight="weight")
+    assert np.allclose(eig.scores, _as_array(expected))
+
+    pr = pagerank(stack[1], max_iter=2)
+    assert not pr.converged
+    expected = nx.pagerank(G, weight="weight", tol=1e-14, max_iter=1000)
+    assert np.allclose(pr.scores, _as_array(expected), atol=1e-12)
+
+    katz = katz_centrality(stack[1], max_iter=2)
+    assert np.allclose(katz.scores, _as_array(nx.katz_centrality_numpy(G, weight="weight")))
+
+
+def test_katz_rejects_divergent_alpha():
+    complete = np.ones((5, 5)) - np.eye(5)  # spectral radius 4
+    with pytest.raises(nx.PowerIterationFailedConvergence):
+        nx.katz_centrality(nx.from_numpy_array(complete, create_using=nx.DiGraph()), alpha=0.5)
+    with pytest.raises(ValueError):
+        katz_centrality(complete, alpha=0.5)
+    with pytest.raises(ValueError):
+        find_katz_centrality(np.stack([complete * 0.01, complete]), alpha=0.5)
+    assert katz_centrality(complete, alpha=0.2).converged
+
+
+def test_warm_start_cuts_iterations(stack):
+    cold = eigenvector_centrality(stack)
+    warm = eigenvector_centrality(stack, x0=cold.scores)
+    assert np.all(warm.iterations <= cold.iterations)
+    assert np.all(warm.iterations[cold.converged] <= 2)
+    assert np.allclose(warm.scores[cold.converged], cold.scores[cold.converged], atol=1e-4)
+
+
+def test_rejects_non_square():
+    with pytest.raises(ValueError):
+        pagerank(np.zeros((3, 4)))
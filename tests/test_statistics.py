@@ -1,7 +1,9 @@
+import networkx as nx
+import numpy as np
 import pytest
 
 from tonnetz.graph.builder import build_random_adjacency_matrix
-from tonnetz.graph.statistics import Stats
+from tonnetz.graph.statistics import BatchGraphStats, GraphStats, Stats
 
 @pytest.fixture
 def random_adj():
@@ -18,5 +20,95 @@ def test_print():
     random_adj = build_random_adjacency_matrix()
     Stats.print_statistics(random_adj)
 
+def test_graph_stats_match_networkx(random_adj):
+    stats = GraphStats(random_adj)
+    U = nx.from_numpy_array(stats.undirected, create_using=nx.Graph())
+    expected = nx.clustering(U)
+    assert np.allclose(stats.clustering, [expected[i] for i in range(len(random_adj))])
+    assert stats.average_clustering == pytest.approx(nx.average_clustering(U))
+    assert stats.giant_component_size == len(max(nx.connected_components(U), key=len))
+
+    # The static wrappers report the same values
+    assert Stats.find_clustering_coefficient(random_adj) == stats.clustering_coefficient
+    assert Stats.find_degree_distribution(random_adj) == stats.degree_distribution
+    assert Stats.find_diameter(random_adj) == stats.diameter
+
+def test_graph_stats_caches_intermediates(random_adj):
+    stats = GraphStats(random_adj)
+    U = stats.undirected
+    stats.average_clustering
+    stats.diameter
+    assert stats.undirected is U
+    assert stats.clustering_coefficient is stats.clustering_coefficient
+
+def test_empty_graph_stats():
+    stats = GraphStats(np.zeros((48, 48)))
+    assert stats.degree_distribution == {}
+    assert stats.average_clustering == 0.0
+    assert stats.giant_component_size == 1
+    assert stats.diameter == 0
+    assert GraphStats(np.zeros((0, 0))).giant_component_size == 0
+
+def test_batch_stats_match_per_matrix():
+    rng = np.random.default_rng(0)
+    mats = rng.random((40, 48, 48))
+    # From dense to empty, so components and diameters vary
+    mats[mats < np.linspace(0.5, 1.0, 40)[:, None, None]] = 0
+    batch = BatchGraphStats(mats)
+
+    assert Stats.find_clustering_coefficient(mats).shape == (40, 48)
+    assert Stats.find_degree_distribution(mats).shape == (40, 97)
+    for k, adj in enumerate(mats):
+        stats = GraphStats(adj)
+        assert np.allclose(batch.clustering[k], stats.clustering)
+        assert batch.average_clustering[k] == pytest.approx(stats.average_clustering)
+        assert batch.giant_component_size[k] == stats.giant_component_size
+        assert np.array_equal(np.flatnonzero(batch.giant_component[k]), stats.giant_component)
+        assert batch.diameter[k] == stats.diameter
+        dist = {d: p for d, p in enumerate(batch.degree_distribution[k]) if p > 0}
+        assert dist == pytest.approx(stats.degree_distribution)
+
+    assert np.array_equal(Stats.find_diameter(mats), batch.diameter)
+    with pytest.raises(ValueError):
+        BatchGraphStats(mats[0])
+
+def test_weighted_stats_match_networkx(random_adj):
+    stats = GraphStats(random_adj)
+    U = nx.from_numpy_array(stats.weighted_undirected)
+    expected = nx.clustering(U, weight="weight")
+    assert np.allclose(stats.weighted_clustering, [expected[i] for i in range(len(random_adj))])
+    assert stats.average_weighted_clustering == pytest.approx(np.mean(list(expected.values())))
+
+    G = nx.from_numpy_array(random_adj, create_using=nx.DiGraph())
+    in_strength, out_strength = Stats.find_weighted_degree(random_adj)
+    assert np.allclose(in_strength, [G.in_degree(i, weight="weight") for i in G])
+    assert np.allclose(out_strength, [G.out_degree(i, weight="weight") for i in G])
+
+    fractions, edges = Stats.find_strength_distribution(random_adj, bins=5)
+    assert fractions.shape == (5,) and edges.shape == (6,)
+    assert fractions.sum() == pytest.approx(1.0)
+    assert edges[-1] == pytest.approx(stats.strength.max())
+
+    # Explicit edges: strengths outside them are not counted, as np.histogram
+    positive = stats.strength[stats.strength > 0]
+    bins = np.quantile(positive, [0.2, 0.5, 0.9])
+    fractions, edges = Stats.find_strength_distribution(random_adj, bins=bins)
+    counts, _ = np.histogram(positive, bins=bins)
+    assert np.array_equal(edges, bins)
+    assert np.allclose(fractions, counts / counts.sum())
+
+def test_weighted_batch_matches_per_matrix():
+    rng = np.random.default_rng(1)
+    mats = rng.random((10, 48, 48))
+    mats[mats < 0.8] = 0
+    batch = BatchGraphStats(mats)
+    fractions, edges = batch.strength_distribution()
+    for k, adj in enumerate(mats):
+        stats = GraphStats(adj)
+        assert np.allclose(batch.weighted_clustering[k], stats.weighted_clustering)
+        assert np.allclose(batch.in_strength[k], stats.in_strength)
+        assert np.allclose(fractions[k], stats.strength_distribution(edges)[0])
+    assert np.allclose(Stats.find_average_weighted_clustering(mats), batch.average_weighted_clustering)
+
 if __name__ == "__main__":
     test_print()
\ No newline at end of file
@@ -0,0 +1,132 @@
+import pickle
+from bisect import bisect_right
+
+import numpy as np
+import pytest
+
+from tonnetz.gen.walk import (
+    REST, Walker, WalkTables, batch_random_walk, biased_random_walk, compile_walk
+)
+from tonnetz.graph.centrality import CentralityEngine
+
+
+@pytest.fixture
+def adj():
+    rng = np.random.default_rng(3)
+    mat = rng.exponential(0.3, size=(48, 48))
+    mat = mat / mat.max()
+    mat[mat < 0.6] = 0
+    mat[9, :] = 0  # dead end
+    return mat
+
+
+def _reference_walk(adj, centrality, start, length, rest_prob, seed):
+    """Step-by-step walk with rng.choice, as the walk used to be written."""
+    rng = np.random.default_rng(seed)
+    best = int(np.argmax(centrality))
+    current, sequence = start, []
+    while len(sequence) < length:
+        if rng.random() < rest_prob:
+            sequence.append(REST)
+            continue
+        neighbors = np.flatnonzero(adj[current])
+        if neighbors.size == 0:
+            sequence.append(REST)
+            current = best
+            continue
+        weights = adj[current, neighbors] * centrality[neighbors]
+        if weights.sum() <= 0:
+            weights = np.ones(neighbors.size)
+        current = int(rng.choice(neighbors, p=weights / weights.sum()))
+        sequence.append(current)
+    return sequence
+
+
+@pytest.mark.parametrize("metric", ["degree", "betweenness", "eigenvector"])
+def test_compiled_walk_matches_step_by_step(adj, metric):
+    engine = CentralityEngine()
+    centrality = engine.compute(adj, (metric,))[metric]
+    for seed in range(5):
+        for start in (None, 9, 20):
+            expected = _reference_walk(
+                adj, centrality, int(np.argmax(centrality)) if start is None else start, 300, 0.3, seed
+            )
+            walk = biased_random_walk(adj, start, 300, centrality_type=metric, seed=seed, engine=engine)
+            assert walk == expected
+
+
+def test_tables_layout(adj):
+    tables = compile_walk(adj, "degree")
+    assert isinstance(tables, WalkTables)
+    assert tables.num_nodes == 48
+    assert np.array_equal(np.diff(tables.indptr), np.count_nonzero(adj, axis=1))
+    ends = tables.cdf[tables.indptr[1:][np.diff(tables.indptr) > 0] - 1]
+    assert np.allclose(ends, 1.0)
+
+    restored = pickle.loads(pickle.dumps(tables))
+    walk = restored.walk(0, 50, 0.3, np.random.default_rng(1))
+    assert walk == tables.walk(0, 50, 0.3, np.random.default_rng(1))
+
+
+def test_batch_walk_follows_edges():
+    adj = np.random.default_rng(0).exponential(0.3, size=(48, 48))
+    adj[adj < 0.3] = 0
+    adj[9, :] = 0  # dead end
+    walks = batch_random_walk(adj, 500, 200, centrality_type="degree", seed=4, start_nodes=20)
+    assert walks.shape == (500, 200) and walks.dtype == np.int8
+    assert np.array_equal(walks, batch_random_walk(adj, 500, 200, centrality_type="degree",
+                                                   seed=4, start_nodes=20))
+    assert abs(np.mean(walks == REST) - 0.3) < 0.05
+
+    # Every move follows an edge from the previous node (or from the restart after a dead end)
+    tables = compile_walk(adj, "degree")
+    current = np.full(500, 20)
+    for t in range(200):
+        step = walks[:, t].astype(int)
+        moved = step != REST
+        assert np.all(adj[current[moved], step[moved]] > 0)
+        stuck = ~moved & (np.count_nonzero(adj[current], axis=1) == 0)
+        current = np.where(moved, step, np.where(stuck, tables.restart, current))
+
+
+def test_batch_sampling_is_exact_inverse_cdf(adj):
+    tables = compile_walk(adj, "eigenvector")
+    scale = 2.0**53
+    for row in np.flatnonzero(np.diff(tables.indptr)):
+        lo, hi = tables.indptr[row], tables.indptr[row + 1]
+        cdf = tables.cdf[lo:hi]
+        # Random draws plus the draws adjacent to every CDF boundary
+        draws = np.concatenate((np.random.default_rng(row).random(500),
+                                np.floor(cdf * scale) / scale, np.ceil(cdf * scale) / scale))
+        draws = draws[draws < 1]
+        keys = (np.uint64(row) << np.uint64(54)) | (draws * scale).astype(np.uint64)
+        found = np.searchsorted(tables._keys, keys, side="right")
+        assert np.array_equal(found, [lo + bisect_right(cdf.tolist(), d) for d in draws])
+
+
+def test_walker_matches_biased_random_walk(adj):
+    engine = CentralityEngine()
+    walker = Walker(adj, "betweenness", engine=engine)
+    for seed in range(5):
+        expected = biased_random_walk(adj, length=200, centrality_type="betweenness", seed=seed,
+                                      engine=engine)
+        assert walker.sample(200, seed) == expected
+    assert walker.sample(50, 1, start_node=9) == biased_random_walk(
+        adj, 9, 50, centrality_type="betweenness", seed=1, engine=engine)
+
+    many = walker.sample_many([3, np.random.SeedSequence(3), 7], 100)
+    assert many.shape == (3, 100) and many.dtype == np.int8
+    assert many[0].tolist() == many[1].tolist() == walker.sample(100, 3)
+    assert many[2].tolist() == walker.sample(100, 7)
+
+
+def test_walker_pickles_without_lookup_caches(adj):
+    walker = Walker(adj, "degree")
+    walker.sample(100, 0)
+    walker.sample_batch(10, 100, 0)
+    assert "_rows" in walker.tables.__dict__ and "_keys" in walker.tables.__dict__
+
+    clone = pickle.loads(pickle.dumps(walker))
+    assert "_rows" not in clone.tables.__dict__ and "_keys" not in clone.tables.__dict__
+    assert clone.sample(300, 5) == walker.sample(300, 5)
+    assert np.array_equal(clone.sample_batch(50, 100, 2), walker.sample_batch(50, 100, 2))
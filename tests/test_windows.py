@@ -0,0 +1,56 @@
+import os
+
+import numpy as np
+import pytest
+
+from tonnetz.midi.events import read_event_table, select_events
+from tonnetz.midi.parser import TransitionAccumulator, channel_transition_counts
+from tonnetz.midi.windows import gen_transition_windows, sliding_window_counts, window_statistics
+
+
+@pytest.fixture
+def table():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    return read_event_table(os.path.join(project_root, "raw_midi", "My_Heart_Will_Go_On.mid"))
+
+
+def test_windows_match_accumulator(table):
+    windows = sliding_window_counts(table.events, table.ticks_per_beat, target_channel=4,
+                                    window_bars=8, hop_bars=2)
+    assert len(windows) > 1
+    assert np.all(windows.ends - windows.starts == 8 * 4 * table.ticks_per_beat)
+
+    # Reference: stream the events and snapshot the counts at every hop boundary
+    events = select_events(table.events, channels=[4])
+    acc = TransitionAccumulator()
+    boundaries = np.unique(np.concatenate((windows.starts, windows.ends)))
+    snapshots = {}
+    pos = 0
+    for boundary in boundaries:
+        while pos < events.size and events["tick"][pos] < boundary:
+            acc.feed_events(events[pos:pos + 1])
+            pos += 1
+        snapshots[int(boundary)] = acc.counts.copy()
+    for w in range(len(windows)):
+        expected = snapshots[int(windows.ends[w])] - snapshots[int(windows.starts[w])]
+        assert np.array_equal(windows.counts[w], expected)
+
+
+def test_single_window_is_whole_file(table):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)
+    midi_file = os.path.join(project_root, "raw_midi", "My_Heart_Will_Go_On.mid")
+
+    windows = gen_transition_windows(midi_file, 4, window_bars=10_000, hop_bars=10_000)
+    assert len(windows) == 1
+    assert np.array_equal(windows.counts[0], channel_transition_counts(table.events, 4))
+
+    stats = window_statistics(gen_transition_windows(midi_file, 4))
+    assert stats["drift"][0] == 0
+    assert all(len(v) == len(stats["drift"]) for v in stats.values())
+
+
+def test_window_must_be_multiple_of_hop(table):
+    with pytest.raises(ValueError):
+        sliding_window_counts(table.events, table.ticks_per_beat, window_bars=8, hop_bars=3)
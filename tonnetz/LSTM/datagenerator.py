@@ -3,6 +3,10 @@ from torch.utils.data import Dataset
 import torch
 import pandas as pd
 
+from tonnetz.gen.dataset import TokenWindows
+
+WINDOW_LEN=31 # input tokens per training window (x), followed by one target token (y)
+
 class GenerateDataMap(Dataset):
     def __init__(self,seq,target):
         super().__init__()
@@ -16,7 +20,22 @@ class GenerateDataMap(Dataset):
         return self.x[idx], self.y[idx]
     
 
-def create_seq(path_in,path_out,seq_len=31): #didnt add stride0
+class TokenWindowMap(Dataset):
+    """(x, y) windows of a binary token dataset, sliced from the memmap on access
+    instead of being expanded into a windowed CSV (see tonnetz.gen.dataset)"""
+    def __init__(self,windows:TokenWindows):
+        super().__init__()
+        self.windows=windows
+
+    def __len__(self):
+        return len(self.windows)
+
+    def __getitem__(self, idx):
+        x,y=self.windows[idx]
+        return torch.from_numpy(x.astype(np.int64)), torch.tensor(y,dtype=torch.long)
+
+
+def create_seq(path_in,path_out,seq_len=WINDOW_LEN): #didnt add stride0
     # x=[]
     # y=[]
     with open(path_in,'r') as f ,open(path_out,'w') as f_out:
@@ -32,10 +51,12 @@ def create_seq(path_in,path_out,seq_len=31): #didnt add stride0
                 # inp,out= np.array(x),np.array(y)
                 f_out.write(f'"{x}",{y}\n')
 
-path_in='/tonnetz-graph/data/sequences.csv'
-path_out='/tonnetz-graph/data/lstm_data.csv'
+if __name__=="__main__":
+    # Windowed CSV for older checkpoints; train.py reads the token file directly
+    path_in='/tonnetz-graph/data/sequences.csv'
+    path_out='/tonnetz-graph/data/lstm_data.csv'
 
-create_seq(path_in,path_out)
+    create_seq(path_in,path_out)
 
 
 
@@ -3,7 +3,9 @@ import torch
 import numpy as np
 import torch.functional as F
 
-notes_class=49
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE
+
+notes_class=DEFAULT_PITCH_SPACE.num_notes+1 # note indices plus the rest token (-1)
 class LSTM(nn.Module):
     def __init__(self,latent_dim=10,layer_count=2,embedding_dim=49,notes_class=notes_class,dropout=0.3):
         super().__init__()
@@ -2,10 +2,9 @@ import torch
 import torch.nn.functional as F
 from model import LSTM,notes_class
 import numpy as np
-import pandas as pd
-import ast
 from torch.utils.data import DataLoader, SubsetRandomSampler
 import datagenerator
+from tonnetz.gen.dataset import read_tokens
 
 def generate_seq(model,seed,length=128,temperature=1.0,top_k=10,device=None):
     generated_seq=[]
@@ -43,15 +42,14 @@ embedding_dim=49
 dropout=0.3
 train_split=0.9
 
-data=pd.read_csv("/tonnetz-graph/data/lstm_data.csv") 
-x=np.array([ast.literal_eval(seq) for seq in data['x']],dtype=np.int32)
-y=np.array(data['y'],dtype=np.int32)
+data=read_tokens("/tonnetz-graph/data/sequences.tokens")
 till=int(len(data)*train_split)
-val_size = len(data) - till
+validation_windows=datagenerator.TokenWindowMap(data.subset(till).windows(datagenerator.WINDOW_LEN))
+val_size = len(validation_windows)
 indices = np.random.randint(0, val_size, size=500)
 # indices=np.random.randint(till+1,len(data),size=500)
 sampler=SubsetRandomSampler(indices)
-validation_dataset=DataLoader(datagenerator.GenerateDataMap(x[till:],y[till:]),sampler=sampler)
+validation_dataset=DataLoader(validation_windows,sampler=sampler)
 
 device = "cuda" if torch.cuda.is_available() else "cpu"
 
@@ -1,17 +1,15 @@
 import torch
 import torch.optim as optim 
 from torch.utils.data import DataLoader
-import numpy as np
 from model import LSTM
-import pandas as pd
-import ast
 import datagenerator
+from tonnetz.gen.dataset import read_tokens
 import torch.nn as nn
 import matplotlib.pyplot as plt
 
 
 
-seq_len=30
+seq_len=datagenerator.WINDOW_LEN # tokens per input window, as create_seq writes them
 latent_dim=10
 layers_count=2
 embedding_dim=49
@@ -22,14 +20,12 @@ lr=0.001
 train_split=0.9
 
 
-data=pd.read_csv("/tonnetz-graph/data/lstm_data.csv") #add path
-x=np.array([ast.literal_eval(seq) for seq in data['x']],dtype=np.int32)
-# print(x)
-# x=np.array([np.array(ast.literal_eval(seq), dtype=np.int32) for seq in data['x']])
-y=np.array(data['y'],dtype=np.int32)
+# Binary token dataset (scripts.generate_dataset / scripts.convert_sequences), memory-mapped;
+# windows of seq_len tokens are sliced on access
+data=read_tokens("/tonnetz-graph/data/sequences.tokens") #add path
 till=int(len(data)*train_split)
-train_dataset=DataLoader(datagenerator.GenerateDataMap(x[:till],y[:till]),batch_size=batch_size,shuffle=True)
-validation_dataset=DataLoader(datagenerator.GenerateDataMap(x[till:],y[till:]),batch_size=batch_size)
+train_dataset=DataLoader(datagenerator.TokenWindowMap(data.subset(0,till).windows(seq_len)),batch_size=batch_size,shuffle=True)
+validation_dataset=DataLoader(datagenerator.TokenWindowMap(data.subset(till).windows(seq_len)),batch_size=batch_size)
 
 device = "cuda" if torch.cuda.is_available() else "cpu"
 
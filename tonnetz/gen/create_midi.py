@@ -6,11 +6,13 @@ from typing import Sequence
 
 import mido
 
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE, PitchSpace
+
 
 MIN_NOTE_IDX = 0
-MAX_NOTE_IDX = 47
+MAX_NOTE_IDX = DEFAULT_PITCH_SPACE.num_notes - 1
 REST_TOKEN = -1
-MIDI_NOTE_OFFSET = 36
+MIDI_NOTE_OFFSET = DEFAULT_PITCH_SPACE.min_note
 
 
 def create_midi_from_list(
@@ -24,6 +26,7 @@ def create_midi_from_list(
     randomize_note_length: bool = False,
     note_length_jitter: float = 0.25,
     random_seed: int | None = None,
+    pitch_space: PitchSpace = DEFAULT_PITCH_SPACE,
 ) -> Path:
     """
     Create a monophonic MIDI file from Tonnetz note indices.
@@ -31,7 +34,8 @@ def create_midi_from_list(
     Parameters
     ----------
     notes
-        Sequence of note indices where values 0..47 map to C2..B5 and -1 is a rest.
+        Sequence of note indices where values 0..47 map to C2..B5 and -1 is a rest
+        (index i is MIDI note `pitch_space.min_note + i` in general).
     output_path
         Destination `.mid` file path.
     bpm
@@ -51,6 +55,8 @@ def create_midi_from_list(
         is scaled by a factor sampled from [0.75, 1.25].
     random_seed
         Optional seed for deterministic random durations.
+    pitch_space
+        Pitch space the note indices refer to (defaults to C2..B5).
     """
     if bpm <= 0:
         raise ValueError("bpm must be > 0")
@@ -77,6 +83,7 @@ def create_midi_from_list(
     tempo = mido.bpm2tempo(bpm)
     track.append(mido.MetaMessage("set_tempo", tempo=tempo, time=0))
 
+    max_note_idx = pitch_space.num_notes - 1
     pending_ticks = 0
     base_ticks = ticks_per_beat * note_length_beats
 
@@ -85,14 +92,14 @@ def create_midi_from_list(
             pending_ticks += _step_ticks(base_ticks, rng, note_length_jitter)
             continue
 
-        if not (MIN_NOTE_IDX <= note_idx <= MAX_NOTE_IDX):
+        if not (MIN_NOTE_IDX <= note_idx <= max_note_idx):
             raise ValueError(
                 f"Invalid note index at position {idx}: {note_idx}. "
-                f"Expected {REST_TOKEN} or {MIN_NOTE_IDX}..{MAX_NOTE_IDX}."
+                f"Expected {REST_TOKEN} or {MIN_NOTE_IDX}..{max_note_idx}."
             )
 
         duration_ticks = _step_ticks(base_ticks, rng, note_length_jitter)
-        midi_note = note_idx + MIDI_NOTE_OFFSET
+        midi_note = pitch_space.note(note_idx)
 
         track.append(
             mido.Message(
@@ -0,0 +1,404 @@
+from __future__ import annotations
+import csv
+import itertools
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from tonnetz.gen.walk import REST, Walker
+
+
+# Sequences generated and written at a time by one worker (and the
+# granularity of in-process progress reports)
+WRITE_BLOCK = 64
+
+# Binary token datasets: a raw C-order (num_sequences, sequence_length)
+# token matrix in `<name>.tokens` plus a JSON header in `<name>.tokens.json`
+TOKENS_SUFFIX = ".tokens"
+TOKENS_FORMAT = "tonnetz-tokens"
+TOKENS_VERSION = 1
+
+# The walker of each worker process, shipped once by the pool initializer.
+_WORKER_WALKER: Optional[Walker] = None
+
+
+def sequence_seeds(entropy: int, start: int, stop: int) -> list[np.random.SeedSequence]:
+    """
+    Seeds of sequences start..stop-1, equal to
+    `np.random.SeedSequence(entropy).spawn(stop)[start:stop]` but built
+    without spawning the ones before `start`.
+    """
+    return [np.random.SeedSequence(entropy, spawn_key=(i,)) for i in range(start, stop)]
+
+
+def shard_ranges(num_sequences: int, shards: int) -> list[tuple[int, int]]:
+    """Split sequences 0..num_sequences-1 into `shards` contiguous (start, stop) ranges."""
+    if shards < 1:
+        raise ValueError("shards must be >= 1")
+    bounds = np.linspace(0, num_sequences, shards + 1).round().astype(int).tolist()
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def shard_paths(output_path: str | Path, shards: int) -> list[Path]:
+    """Shard files next to `output_path`, e.g. sequences.shard-00001-of-00004.csv."""
+    out = Path(output_path)
+    return [
+        out.with_name(f"{out.stem}.shard-{k:05d}-of-{shards:05d}{out.suffix}")
+        for k in range(shards)
+    ]
+
+
+def header_path(tokens_path: str | Path) -> Path:
+    """JSON header of a token file, e.g. sequences.tokens.json."""
+    path = Path(tokens_path)
+    return path.with_name(path.name + ".json")
+
+
+def _is_tokens(path: str | Path) -> bool:
+    return Path(path).suffix == TOKENS_SUFFIX
+
+
+def _init_worker(walker: Walker) -> None:
+    global _WORKER_WALKER
+    _WORKER_WALKER = walker
+
+
+def _write_shard(
+    job: tuple[str, int, int, int, int], written: Optional[Callable[[int], None]] = None
+) -> tuple[str, int]:
+    """
+    Worker entry point: write sequences start..stop-1 to one shard (CSV, or
+    raw tokens for a .tokens path), returning (path, sequences written).
+    `written(count)` is called after every block when given.
+    """
+    path, entropy, start, stop, length = job
+    walker = _WORKER_WALKER
+    tokens = _is_tokens(path)
+    with open(path, "wb" if tokens else "w", newline=None if tokens else "") as f:
+        if not tokens:
+            writer = csv.writer(f)
+            writer.writerow([f"step_{i}" for i in range(length)])
+        for lo in range(start, stop, WRITE_BLOCK):
+            hi = min(lo + WRITE_BLOCK, stop)
+            block = walker.sample_many(sequence_seeds(entropy, lo, hi), length)
+            if tokens:
+                f.write(block.tobytes())
+            else:
+                writer.writerows(block.tolist())
+            if written is not None:
+                written(hi - lo)
+    return path, stop - start
+
+
+def merge_shards(paths: list[Path], output_path: str | Path, remove: bool = True) -> Path:
+    """
+    Concatenate shards, in order, into one file (CSV shards keep only the
+    first header); the shards are deleted afterwards if `remove`. Token
+    headers are not touched, see `write_header`.
+    """
+    out = Path(output_path)
+    csv_header = not _is_tokens(out)
+    with open(out, "wb") as dst:
+        for k, path in enumerate(paths):
+            with open(path, "rb") as src:
+                if csv_header:
+                    header = src.readline()
+                    if k == 0:
+                        dst.write(header)
+                shutil.copyfileobj(src, dst)
+    if remove:
+        for path in paths:
+            os.remove(path)
+    return out
+
+
+def write_header(
+    tokens_path: str | Path,
+    shape: tuple[int, int],
+    dtype,
+    seed: int | None = None,
+    matrix_hash: str | None = None,
+    params: dict | None = None,
+    **extra,
+) -> Path:
+    """
+    Write the JSON header of a token file: format, dtype and shape of the
+    matrix, plus the seed, adjacency-matrix hash and generation parameters.
+    """
+    header = {
+        "format": TOKENS_FORMAT,
+        "version": TOKENS_VERSION,
+        "dtype": np.dtype(dtype).name,
+        "shape": [int(s) for s in shape],
+        "rest": REST,
+        "seed": seed,
+        "matrix_hash": matrix_hash,
+        "params": params or {},
+        **extra,
+    }
+    path = header_path(tokens_path)
+    path.write_text(json.dumps(header, indent=2) + "\n")
+    return path
+
+
+def write_walk_dataset(
+    walker: Walker,
+    num_sequences: int,
+    sequence_length: int,
+    output_path: str | Path,
+    seed: int | None = None,
+    workers: Optional[int] = 1,
+    shards: Optional[int] = None,
+    merge: bool = True,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> list[Path]:
+    """
+    Write `num_sequences` walks of `walker`, split into shards written by a
+    process pool. A `.tokens` output path writes the binary token format
+    (see `read_tokens`), anything else CSV rows with one `step_i` column
+    per step.
+
+    Sequence i is sampled from the i-th child of `SeedSequence(seed)`, so
+    its content depends only on `seed` and i: the merged file is
+    bit-identical for any number of workers or shards.
+
+    Parameters
+    ----------
+    walker : Walker
+        Compiled walk; pickled once to every worker.
+    num_sequences, sequence_length : int
+        Number and length of the sequences.
+    output_path : str | Path
+        Path of the merged output; shards are written next to it (see
+        `shard_paths`).
+    seed : int | None
+        Root seed; None draws fresh entropy (shared by all shards).
+    workers : int | None
+        Number of worker processes. None uses all cores; 1 writes in-process.
+    shards : int | None
+        Number of shard files; defaults to one per worker.
+    merge : bool
+        Concatenate the shards into `output_path` and delete them. With a
+        single shard the output is written directly.
+    progress : callable | None
+        Called as progress(done, total) with sequence counts after every
+        block of WRITE_BLOCK sequences when writing in-process, and after
+        every finished shard with a pool.
+
+    Returns
+    -------
+    list[Path]
+        `[output_path]` when merged, else the shard files in order.
+    """
+    if num_sequences < 0 or sequence_length < 0:
+        raise ValueError("num_sequences and sequence_length must be >= 0")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if shards is None:
+        shards = workers
+    shards = max(1, min(shards, num_sequences))
+
+    out = Path(output_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    paths = [out] if shards == 1 and merge else shard_paths(out, shards)
+    ranges = shard_ranges(num_sequences, shards)
+    entropy = np.random.SeedSequence(seed).entropy
+    jobs = [
+        (str(path), entropy, start, stop, sequence_length)
+        for path, (start, stop) in zip(paths, ranges)
+    ]
+
+    done = 0
+
+    def advance(count: int) -> None:
+        nonlocal done
+        done += count
+        if progress is not None:
+            progress(done, num_sequences)
+
+    if workers == 1 or len(jobs) == 1:
+        _init_worker(walker)
+        for job in jobs:
+            _write_shard(job, advance)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(jobs)), initializer=_init_worker, initargs=(walker,)
+        ) as executor:
+            for _, count in executor.map(_write_shard, jobs):
+                advance(count)
+
+    if merge and len(paths) > 1:
+        paths = [merge_shards(paths, out)]
+        ranges = [(0, num_sequences)]
+
+    if _is_tokens(out):
+        params = {
+            "centrality_type": walker.centrality_type,
+            "rest_prob": walker.rest_prob,
+            "num_nodes": walker.num_nodes,
+        }
+        for path, (start, stop) in zip(paths, ranges):
+            write_header(
+                path, (stop - start, sequence_length), walker.token_dtype, seed=seed,
+                matrix_hash=walker.matrix_hash, params=params, entropy=entropy,
+                first_sequence=start,
+            )
+    return paths
+
+
+@dataclass(frozen=True, eq=False)
+class TokenWindows:
+    """
+    The (x, y) training pairs of every sequence, x = seq[i:i+seq_len] and
+    y = seq[i+seq_len] as written by `LSTM.datagenerator.create_seq`, as a
+    strided view of the token matrix; nothing is copied until indexed.
+    """
+
+    view: np.ndarray  # (N, P, seq_len + 1) sliding windows, P = sequence_length - seq_len
+
+    @classmethod
+    def from_tokens(cls, tokens: np.ndarray, seq_len: int) -> "TokenWindows":
+        if seq_len < 1:
+            raise ValueError("seq_len must be >= 1")
+        N, L = tokens.shape
+        if L <= seq_len:
+            return cls(view=np.zeros((N, 0, seq_len + 1), dtype=tokens.dtype))
+        view = np.lib.stride_tricks.sliding_window_view(tokens, seq_len + 1, axis=1)
+        return cls(view=view[:, : L - seq_len])
+
+    @property
+    def seq_len(self) -> int:
+        return self.view.shape[2] - 1
+
+    def __len__(self) -> int:
+        return self.view.shape[0] * self.view.shape[1]
+
+    def __getitem__(self, index: int) -> tuple[np.ndarray, int]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("window index out of range")
+        window = self.view[divmod(index, self.view.shape[1])]
+        return window[:-1], int(window[-1])
+
+    def batch(self, indices) -> tuple[np.ndarray, np.ndarray]:
+        """x (B, seq_len) and y (B,) of the windows at `indices`, copied."""
+        rows, pos = np.divmod(np.asarray(indices, dtype=np.int64), self.view.shape[1])
+        windows = self.view[rows, pos]
+        return windows[:, :-1], windows[:, -1]
+
+
+@dataclass(frozen=True, eq=False)
+class TokenDataset:
+    """A binary token dataset, memory-mapped by `read_tokens`."""
+
+    tokens: np.ndarray  # (N, L) tokens, node indices and REST; a read-only memmap
+    header: dict        # parsed JSON header (seed, matrix_hash, params, ...)
+
+    def __len__(self) -> int:
+        return self.tokens.shape[0]
+
+    def __getitem__(self, index) -> np.ndarray:
+        return self.tokens[index]
+
+    @property
+    def sequence_length(self) -> int:
+        return self.tokens.shape[1]
+
+    @property
+    def seed(self) -> int | None:
+        return self.header.get("seed")
+
+    @property
+    def matrix_hash(self) -> str | None:
+        return self.header.get("matrix_hash")
+
+    @property
+    def params(self) -> dict:
+        return self.header.get("params", {})
+
+    def subset(self, start: int | None = None, stop: int | None = None) -> "TokenDataset":
+        """Sequences start..stop-1, still memory-mapped (e.g. a train/validation split)."""
+        return TokenDataset(tokens=self.tokens[start:stop], header=self.header)
+
+    def sequences(self, indices=None) -> list[list[int]]:
+        """Selected (default all) sequences as lists, as read from the CSV."""
+        tokens = self.tokens if indices is None else self.tokens[np.asarray(indices)]
+        return tokens.tolist()
+
+    def windows(self, seq_len: int) -> TokenWindows:
+        return TokenWindows.from_tokens(self.tokens, seq_len)
+
+
+def read_tokens(tokens_path: str | Path) -> TokenDataset:
+    """
+    Open a binary token dataset: parse its JSON header and memory-map the
+    token matrix read-only with `np.memmap`.
+    """
+    path = Path(tokens_path)
+    header = json.loads(header_path(path).read_text())
+    if header.get("format") != TOKENS_FORMAT or header.get("version") != TOKENS_VERSION:
+        raise ValueError(f"{path} is not a {TOKENS_FORMAT} v{TOKENS_VERSION} file")
+    dtype = np.dtype(header["dtype"])
+    shape = tuple(header["shape"])
+    expected = dtype.itemsize * int(np.prod(shape))
+    size = path.stat().st_size
+    if size != expected:
+        raise ValueError(f"{path} holds {size} bytes, header expects {expected}")
+    if expected == 0:
+        tokens = np.zeros(shape, dtype=dtype)
+    else:
+        tokens = np.memmap(path, dtype=dtype, mode="r", shape=shape)
+    return TokenDataset(tokens=tokens, header=header)
+
+
+def convert_csv(
+    csv_path: str | Path,
+    tokens_path: str | Path | None = None,
+    dtype=np.int8,
+    block: int = 4096,
+) -> Path:
+    """
+    Convert a sequence CSV (one sequence per row, optional `step_i` header,
+    as written by `generate_dataset`) into the binary token format, reading
+    `block` rows at a time. Seed and matrix hash are unknown and left null.
+
+    Returns
+    -------
+    Path
+        The token file (default: the CSV path with a .tokens suffix).
+    """
+    src = Path(csv_path)
+    out = src.with_suffix(TOKENS_SUFFIX) if tokens_path is None else Path(tokens_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    dtype = np.dtype(dtype)
+    info = np.iinfo(dtype)
+
+    rows, length = 0, None
+    with open(src, newline="") as f, open(out, "wb") as dst:
+        first = f.readline()
+        lines = itertools.chain([] if first.startswith("step_") else [first], f)
+        while batch := list(itertools.islice(lines, block)):
+            chunk = [line for line in batch if line.strip()]
+            if not chunk:
+                continue
+            values = np.loadtxt(chunk, delimiter=",", dtype=np.int64, ndmin=2)
+            if length is None:
+                length = values.shape[1]
+            elif values.shape[1] != length:
+                raise ValueError(f"{src}: rows of {values.shape[1]} values, expected {length}")
+            if values.size and (values.min() < info.min or values.max() > info.max):
+                raise ValueError(f"{src}: values outside the {dtype.name} range")
+            dst.write(values.astype(dtype).tobytes())
+            rows += values.shape[0]
+
+    if length is None:
+        length = len(first.split(",")) if first.startswith("step_") else 0
+    write_header(out, (rows, length), dtype, params={"source": src.name})
+    return out
@@ -1,17 +1,266 @@
+from __future__ import annotations
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import cached_property
+
 import numpy as np
-import networkx as nx
 
-from tonnetz.graph.centrality import (
-    find_degree_centrality,
-    find_betweenness_centrality,
-    find_eigenvector_centrality,
-)
+from tonnetz.graph.centrality import CentralityEngine, default_engine, matrix_key, resolve_metric
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE
 
 REST = -1
 REST_PROB = 0.3
 WALK_PROB = 0.7
 SEQUENCE_LENGTH = 30
-NUM_NOTES = 48
+NUM_NOTES = DEFAULT_PITCH_SPACE.num_notes
+
+# Fixed-point scale of Generator.random(): every draw is m / 2**53, m integer
+_UNIFORM_BITS = 53
+
+
+@dataclass(frozen=True, eq=False)
+class WalkTables:
+    """
+    A biased walk compiled into CSR inverse-CDF tables: row i holds the
+    successors of node i (in node order) and their cumulative transition
+    probabilities, edge weight * centrality of the successor, normalized
+    (uniform if they sum to 0). Dead ends restart at `restart`.
+
+    Sampling a row with one uniform draw and a right bisection of its CDF
+    is exactly what `rng.choice(successors, p=...)` does, so walks are
+    identical to choosing step by step, but nothing is rebuilt per step.
+    """
+
+    indptr: np.ndarray    # (n + 1,) row pointers
+    indices: np.ndarray   # (E,) successor nodes
+    cdf: np.ndarray       # (E,) cumulative probabilities, each row ending at 1
+    restart: int          # highest-centrality node
+
+    @classmethod
+    def compile(cls, adj_matrix: np.ndarray, centrality: np.ndarray) -> WalkTables:
+        adj_matrix = np.asarray(adj_matrix)
+        centrality = np.asarray(centrality)
+        n = adj_matrix.shape[0]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        indices, cdf = [], []
+        for node in range(n):
+            neighbors = np.flatnonzero(adj_matrix[node])
+            indptr[node + 1] = indptr[node] + neighbors.size
+            if neighbors.size == 0:
+                continue
+            weights = adj_matrix[node, neighbors] * centrality[neighbors]
+            total = float(weights.sum())
+            if total <= 0:
+                weights = np.full(len(neighbors), 1.0 / len(neighbors), dtype=float)
+            else:
+                weights = weights / total
+            # As in Generator.choice: cumulative sum rescaled to end at 1
+            row = weights.cumsum()
+            row /= row[-1]
+            indices.append(neighbors)
+            cdf.append(row)
+        return cls(
+            indptr=indptr,
+            indices=np.concatenate(indices) if indices else np.zeros(0, dtype=np.intp),
+            cdf=np.concatenate(cdf) if cdf else np.zeros(0),
+            restart=int(np.argmax(centrality)) if n else 0,
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    def __getstate__(self) -> dict:
+        # Ship only the arrays; the lookup structures are rebuilt on demand
+        return {k: v for k, v in self.__dict__.items() if k not in ("_rows", "_keys")}
+
+    @cached_property
+    def _rows(self) -> list[tuple[list[int], list[float]]]:
+        # Plain lists: bisect and indexing on them beat numpy calls per step
+        rows = []
+        for lo, hi in zip(self.indptr[:-1].tolist(), self.indptr[1:].tolist()):
+            rows.append((self.indices[lo:hi].tolist(), self.cdf[lo:hi].tolist()))
+        return rows
+
+    def walk(
+        self,
+        start_node: int,
+        length: int,
+        rest_prob: float,
+        rng: np.random.Generator,
+    ) -> list[int]:
+        """
+        One walk of `length` steps. 2 * length uniforms are drawn up front
+        and used in the order of one `rng.random()` per step plus one per
+        move, so a fresh generator yields the step-by-step walk.
+        """
+        rows = self._rows
+        restart = self.restart
+        # At most two draws per step, generated in one call
+        uniforms = rng.random(2 * length).tolist() if length > 0 else []
+        used = 0
+        sequence: list[int] = []
+        current = int(start_node)
+        for _ in range(length):
+            u = uniforms[used]
+            used += 1
+            if u < rest_prob:
+                sequence.append(REST)
+                continue
+            neighbors, cdf = rows[current]
+            if not neighbors:
+                sequence.append(REST)
+                current = restart
+                continue
+            current = neighbors[bisect_right(cdf, uniforms[used])]
+            used += 1
+            sequence.append(current)
+        return sequence
+
+    @cached_property
+    def _keys(self) -> np.ndarray:
+        """
+        Flat CSR search keys: row r's CDF as exact 53-bit fixed point, offset
+        by r * 2**54, so one `searchsorted` over all rows finds, for row r
+        and draw m / 2**53, the same entry as bisecting row r with the draw.
+        """
+        if self.num_nodes >= 1 << (64 - _UNIFORM_BITS - 1):
+            raise ValueError("too many nodes for batched walks")
+        rows = np.repeat(np.arange(self.num_nodes, dtype=np.uint64), np.diff(self.indptr))
+        # cdf <= m / 2**53  <=>  ceil(cdf * 2**53) <= m, all exact in float64
+        fixed = np.ceil(self.cdf * 2.0**_UNIFORM_BITS).astype(np.uint64)
+        return (rows << np.uint64(_UNIFORM_BITS + 1)) | fixed
+
+    def walk_many(
+        self,
+        start_nodes,
+        length: int,
+        rest_prob: float,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        """
+        Advance len(start_nodes) independent walkers together, one
+        vectorized step at a time: a rest mask from one uniform per walker,
+        and inverse-CDF sampling of the next node with a second uniform.
+
+        Returns
+        -------
+        np.ndarray
+            (num_walkers, length) node indices and REST (-1); int8 for up to
+            127 nodes, else int16.
+        """
+        current = np.array(start_nodes, dtype=np.int64, ndmin=1)
+        num_walkers = current.size
+        dtype = np.int8 if self.num_nodes <= np.iinfo(np.int8).max else np.int16
+        out = np.empty((num_walkers, length), dtype=dtype)
+        if num_walkers == 0 or length == 0:
+            return out
+
+        keys = self._keys
+        dead_end = np.diff(self.indptr) == 0
+        shift = np.uint64(_UNIFORM_BITS + 1)
+        scale = 2.0**_UNIFORM_BITS
+        for t in range(length):
+            rest_u, step_u = rng.random((2, num_walkers))
+            moving = rest_u >= rest_prob
+            stuck = moving & dead_end[current]
+            moving &= ~stuck
+
+            rows = current[moving].astype(np.uint64)
+            draws = (step_u[moving] * scale).astype(np.uint64)
+            pos = np.searchsorted(keys, (rows << shift) | draws, side="right")
+            current[moving] = self.indices[pos]
+            current[stuck] = self.restart
+            out[:, t] = np.where(moving, current, REST)
+        return out
+
+
+def compile_walk(
+    adj_matrix: np.ndarray,
+    centrality_type: str = "eigenvector",
+    engine: CentralityEngine | None = None,
+) -> WalkTables:
+    """`WalkTables` of a matrix biased by one centrality metric."""
+    adj_matrix = np.asarray(adj_matrix)
+    metric = resolve_metric(centrality_type)
+    engine = default_engine if engine is None else engine
+    return WalkTables.compile(adj_matrix, engine.compute(adj_matrix, (metric,))[metric])
+
+
+class Walker:
+    """
+    A biased random walk over one matrix, compiled once.
+
+    The centrality and the `WalkTables` are computed at construction; every
+    sample afterwards only walks. The walker holds no graph or engine, so it
+    pickles to a few small arrays and can be shipped to worker processes.
+
+    Parameters
+    ----------
+    adj_matrix : np.ndarray
+        Square weighted adjacency matrix (n x n).
+    centrality_type : str
+        Centrality metric used for bias (see `biased_random_walk`).
+    rest_prob : float
+        Probability of emitting a rest at each step.
+    engine : CentralityEngine | None
+        Engine computing the centrality; defaults to the shared engine.
+    """
+
+    def __init__(
+        self,
+        adj_matrix: np.ndarray,
+        centrality_type: str = "eigenvector",
+        rest_prob: float = REST_PROB,
+        engine: CentralityEngine | None = None,
+    ):
+        if not 0.0 <= rest_prob <= 1.0:
+            raise ValueError("rest_prob must be in [0, 1]")
+        self.centrality_type = resolve_metric(centrality_type)
+        self.rest_prob = rest_prob
+        self.matrix_hash = matrix_key(np.asarray(adj_matrix))
+        self.tables = compile_walk(adj_matrix, self.centrality_type, engine)
+
+    @property
+    def num_nodes(self) -> int:
+        return self.tables.num_nodes
+
+    @property
+    def token_dtype(self) -> np.dtype:
+        """Smallest signed dtype holding every node index and the rest."""
+        return np.dtype(np.int8 if self.num_nodes <= np.iinfo(np.int8).max else np.int16)
+
+    def sample(
+        self, length: int = SEQUENCE_LENGTH, seed=None, start_node: int | None = None
+    ) -> list[int]:
+        """
+        One walk, equal to `biased_random_walk` on the same matrix with the
+        same seed (an int, SeedSequence or None).
+        """
+        start = self.tables.restart if start_node is None else start_node
+        return self.tables.walk(start, length, self.rest_prob, np.random.default_rng(seed))
+
+    def sample_many(
+        self, seeds, length: int = SEQUENCE_LENGTH, start_node: int | None = None
+    ) -> np.ndarray:
+        """
+        One `sample` per seed, stacked into a (len(seeds), length) array
+        (int8, or int16 for more than 127 nodes); row i depends only on
+        seeds[i].
+        """
+        seeds = list(seeds)
+        out = np.empty((len(seeds), length), dtype=self.token_dtype)
+        for i, seed in enumerate(seeds):
+            out[i] = self.sample(length, seed, start_node)
+        return out
+
+    def sample_batch(
+        self, num_walkers: int, length: int = SEQUENCE_LENGTH, seed=None, start_nodes=None
+    ) -> np.ndarray:
+        """Vectorized walks of many walkers from one seed, see `WalkTables.walk_many`."""
+        start = self.tables.restart if start_nodes is None else start_nodes
+        start = np.broadcast_to(np.asarray(start, dtype=np.int64), (num_walkers,))
+        return self.tables.walk_many(start, length, self.rest_prob, np.random.default_rng(seed))
 
 
 def biased_random_walk(
@@ -21,6 +270,7 @@ def biased_random_walk(
     rest_prob: float = REST_PROB,
     centrality_type: str = "eigenvector",
     seed: int | None = None,
+    engine: CentralityEngine | None = None,
 ) -> list[int]:
     """
     Generate a sequence of notes by performing a biased random walk
@@ -46,6 +296,9 @@ def biased_random_walk(
         One of: "eigenvector", "betweenness", "degree".
     seed : int | None
         Random seed for reproducibility.
+    engine : CentralityEngine | None
+        Engine computing (and caching) the centralities; defaults to the
+        shared engine, so repeated walks on one matrix compute them once.
 
     Returns
     -------
@@ -53,53 +306,47 @@ def biased_random_walk(
         Sequence of note indices [0, n-1] and rests (-1), of fixed length `length`.
     """
     rng = np.random.default_rng(seed)
-    G = nx.from_numpy_array(adj_matrix, create_using=nx.DiGraph())
-
-    ctype = centrality_type.strip().lower()
-    if ctype in ("eig", "eigenvector"):
-        scores = find_eigenvector_centrality(adj_matrix)
-    elif ctype in ("btw", "betweenness"):
-        scores = find_betweenness_centrality(adj_matrix)
-    elif ctype in ("deg", "degree"):
-        scores = find_degree_centrality(adj_matrix)
-    else:
-        raise ValueError(
-            "centrality_type must be one of: 'eigenvector', 'betweenness', 'degree'"
-        )
-
-    centrality = {int(k): float(v) for k, v in scores.items()}
-
+    tables = compile_walk(adj_matrix, centrality_type, engine)
     if start_node is None:
-        start_node = max(centrality, key=centrality.get)
+        start_node = tables.restart
+    return tables.walk(start_node, length, rest_prob, rng)
 
-    sequence: list[int] = []
-    current = int(start_node)
 
-    while len(sequence) < length:
-        if rng.random() < rest_prob:
-            sequence.append(REST)
-            continue
-
-        neighbors = list(G.successors(current))
-        if not neighbors:
-            sequence.append(REST)
-            current = max(centrality, key=centrality.get)
-            continue
-
-        weights = np.array(
-            [G[current][nb]["weight"] * centrality.get(nb, 0.0) for nb in neighbors],
-            dtype=float,
-        )
-        total = float(weights.sum())
-        if total <= 0:
-            weights = np.full(len(neighbors), 1.0 / len(neighbors), dtype=float)
-        else:
-            weights = weights / total
+def batch_random_walk(
+    adj_matrix: np.ndarray,
+    num_walkers: int,
+    length: int = SEQUENCE_LENGTH,
+    rest_prob: float = REST_PROB,
+    centrality_type: str = "eigenvector",
+    seed: int | None = None,
+    start_nodes=None,
+    engine: CentralityEngine | None = None,
+) -> np.ndarray:
+    """
+    `num_walkers` independent biased random walks, simulated together.
+
+    Same walk as `biased_random_walk` (see there for the parameters), but
+    every step advances all walkers with a few array operations; sequences
+    are not those of `biased_random_walk` with the same seed.
 
-        current = int(rng.choice(neighbors, p=weights))
-        sequence.append(current)
+    Parameters
+    ----------
+    num_walkers : int
+        Number of walks.
+    start_nodes : int | array-like | None
+        Start node of every walker (or one for all); None starts all at the
+        highest-centrality node.
 
-    return sequence
+    Returns
+    -------
+    np.ndarray
+        (num_walkers, length) note indices and rests (-1); int8, or int16
+        for more than 127 nodes.
+    """
+    if num_walkers < 0 or length < 0:
+        raise ValueError("num_walkers and length must be >= 0")
+    walker = Walker(adj_matrix, centrality_type, rest_prob, engine)
+    return walker.sample_batch(num_walkers, length, seed, start_nodes)
 
 
 def purely_random_sequence(
@@ -138,7 +385,7 @@ def print_sequence(sequence: list[int]) -> None:
 
 
 if __name__ == "__main__":
-    n = 48
+    n = NUM_NOTES
     mat = np.random.exponential(0.3, size=(n, n))
     mat = mat / mat.max()
     mat[mat < 0.2] = 0
@@ -1,28 +1,195 @@
+import hashlib
+from collections import OrderedDict
+from typing import Iterable
+
 import numpy as np
 import networkx as nx
+from tonnetz.graph.paths import approximate_betweenness, betweenness_centrality, shortest_paths
+from tonnetz.graph.spectral import eigenvector_centrality, katz_centrality, pagerank
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE, PitchSpace
 from tonnetz.util.util import create_note_labels
 
-def find_betweenness_centrality(adj_matrix: np.ndarray) -> dict[str, float]:
+METRICS = ("degree", "betweenness", "eigenvector")
+# Short names used by get_centralities and the walk's centrality_type
+METRIC_ALIASES = {"deg": "degree", "btw": "betweenness", "eig": "eigenvector"}
+DEFAULT_CACHE_SIZE = 64
+
+
+def matrix_key(adj_matrix: np.ndarray) -> str:
+    """Content hash of a matrix (values, shape and dtype)."""
+    adj_matrix = np.ascontiguousarray(adj_matrix)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{adj_matrix.shape}{adj_matrix.dtype.str}".encode("ascii"))
+    h.update(adj_matrix.data)
+    return h.hexdigest()
+
+
+def resolve_metric(name: str) -> str:
+    """Map a metric name or alias (e.g. "btw") to its canonical name."""
+    key = name.strip().lower()
+    key = METRIC_ALIASES.get(key, key)
+    if key not in METRICS:
+        raise ValueError(
+            "centrality_type must be one of: 'eigenvector', 'betweenness', 'degree'"
+        )
+    return key
+
+
+class CentralityEngine:
+    """
+    Computes centralities of adjacency matrices straight from the matrix,
+    without a networkx conversion: degree from the non-zero entries,
+    betweenness and eigenvector centrality from `tonnetz.graph.paths` and
+    `tonnetz.graph.spectral`. A DiGraph is only built when asked for
+    through `graph()`, and then once per matrix.
+
+    Results are node-indexed, read-only float arrays and are memoized by
+    matrix content (`matrix_key`), so asking for another metric of the same
+    matrix, or the same metric again, reuses earlier scores. At most
+    `max_entries` matrices are kept; the least recently used one is evicted
+    first.
+
+    Parameters
+    ----------
+    max_entries : int
+        Number of matrices whose scores (and graph, if built) are kept.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def compute(
+        self, adj_matrix: np.ndarray, metrics: Iterable[str] = METRICS
+    ) -> dict[str, np.ndarray]:
+        """
+        Compute any subset of METRICS (aliases accepted) for one matrix.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Canonical metric name -> array of length n (score of node i at i).
+        """
+        entry = self._entry(adj_matrix)
+        scores = entry["scores"]
+        out = {}
+        for metric in metrics:
+            metric = resolve_metric(metric)
+            if metric in scores:
+                self.hits += 1
+            else:
+                self.misses += 1
+                if metric == "betweenness":
+                    values = betweenness_centrality(adj_matrix)
+                elif metric == "eigenvector":
+                    values = eigenvector_centrality(adj_matrix).scores
+                else:
+                    values = _in_degree_centrality(adj_matrix)
+                values.flags.writeable = False
+                scores[metric] = values
+            out[metric] = scores[metric]
+        return out
+
+    def degree(self, adj_matrix: np.ndarray) -> np.ndarray:
+        """Normalized in-degree centrality per node."""
+        return self.compute(adj_matrix, ("degree",))["degree"]
+
+    def betweenness(self, adj_matrix: np.ndarray) -> np.ndarray:
+        """Normalized betweenness centrality per node (weights as distances)."""
+        return self.compute(adj_matrix, ("betweenness",))["betweenness"]
+
+    def eigenvector(self, adj_matrix: np.ndarray) -> np.ndarray:
+        """Eigenvector centrality per node."""
+        return self.compute(adj_matrix, ("eigenvector",))["eigenvector"]
+
+    def graph(self, adj_matrix: np.ndarray) -> nx.DiGraph:
+        """The (cached) DiGraph of a matrix; treat it as read-only."""
+        return self._graph(self._entry(adj_matrix), adj_matrix)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry(self, adj_matrix: np.ndarray) -> dict:
+        key = matrix_key(adj_matrix)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {"graph": None, "scores": {}}
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+        return entry
+
+    @staticmethod
+    def _graph(entry: dict, adj_matrix: np.ndarray) -> nx.DiGraph:
+        if entry["graph"] is None:
+            entry["graph"] = nx.from_numpy_array(adj_matrix, create_using=nx.DiGraph())
+        return entry["graph"]
+
+
+def _in_degree_centrality(adj_matrix: np.ndarray) -> np.ndarray:
+    """In-degree / (n - 1) per node, as `nx.in_degree_centrality` (self-loops count once)."""
+    n = adj_matrix.shape[0]
+    if n <= 1:
+        return np.ones(n)
+    return np.count_nonzero(adj_matrix, axis=0) / (n - 1)
+
+
+# Shared engine behind the module-level helpers and the random walk
+default_engine = CentralityEngine()
+
+
+def find_betweenness_centrality(
+    adj_matrix: np.ndarray,
+    samples: int | None = None,
+    epsilon: float | None = None,
+    delta: float = 0.1,
+    seed: int | None = None,
+) -> dict[str, float]:
     """
     Compute betweenness centrality for each node in the graph
     represented by adj_matrix.
 
+    Exact by default. Passing `samples` (source nodes) or an `epsilon`
+    error target switches to the sampled estimate of
+    `tonnetz.graph.paths.approximate_betweenness`, which also reports the
+    error bound holding with probability 1 - `delta`.
+
     Parameters
     ----------
     adj_matrix : np.ndarray
         Square weighted adjacency matrix (n x n).
+    samples : int | None
+        Number of sampled source nodes.
+    epsilon : float | None
+        Maximum absolute error of the estimate, used when `samples` is None.
+    delta : float
+        Failure probability of the `epsilon` target.
+    seed : int | None
+        Seed of the source sampling.
 
     Returns
     -------
     dict[str, float]
         Mapping of node label (as str) -> normalized betweenness score.
     """
-    G = nx.from_numpy_array(adj_matrix, create_using=nx.DiGraph())
-    scores = nx.betweenness_centrality(G, normalized=True, weight="weight")
-    return {str(node): score for node, score in scores.items()}
+    if samples is None and epsilon is None:
+        scores = default_engine.betweenness(adj_matrix)
+    else:
+        scores = approximate_betweenness(
+            adj_matrix, samples=samples, epsilon=epsilon, delta=delta, seed=seed
+        ).scores
+    return {str(node): float(score) for node, score in enumerate(scores)}
 
 
-def find_eigenvector_centrality(adj_matrix: np.ndarray) -> dict[str, float]:
+def find_eigenvector_centrality(adj_matrix: np.ndarray) -> dict[str, float] | np.ndarray:
     """
     Compute eigenvector centrality for each node in the graph
     represented by adj_matrix.
@@ -33,21 +200,52 @@ def find_eigenvector_centrality(adj_matrix: np.ndarray) -> dict[str, float]:
     Parameters
     ----------
     adj_matrix : np.ndarray
-        Square weighted adjacency matrix (n x n).
+        Square weighted adjacency matrix (n x n), or a stack of them
+        (N x n x n) scored in one batch.
 
     Returns
     -------
-    dict[str, float]
-        Mapping of node label (as str) -> eigenvector centrality score.
+    dict[str, float] | np.ndarray
+        Mapping of node label (as str) -> eigenvector centrality score,
+        or an (N, n) array of scores for a stack.
     """
-    G = nx.from_numpy_array(adj_matrix, create_using=nx.DiGraph())
-    try:
-        scores = nx.eigenvector_centrality(
-            G, max_iter=1000, tol=1e-6, weight="weight"
-        )
-    except nx.PowerIterationFailedConvergence:
-        scores = nx.eigenvector_centrality_numpy(G, weight="weight")
-    return {str(node): score for node, score in scores.items()}
+    if np.ndim(adj_matrix) == 3:
+        return eigenvector_centrality(adj_matrix).scores
+    scores = default_engine.eigenvector(adj_matrix)
+    return {str(node): float(score) for node, score in enumerate(scores)}
+
+
+def find_pagerank_centrality(adj_matrix: np.ndarray, alpha: float = 0.85) -> dict[str, float] | np.ndarray:
+    """
+    Compute PageRank for each node in the graph represented by adj_matrix
+    (a single n x n matrix, or an N x n x n stack scored in one batch).
+
+    Returns
+    -------
+    dict[str, float] | np.ndarray
+        Mapping of node label (as str) -> PageRank, or an (N, n) array.
+    """
+    scores = pagerank(adj_matrix, alpha=alpha).scores
+    if scores.ndim == 2:
+        return scores
+    return {str(node): float(score) for node, score in enumerate(scores)}
+
+
+def find_katz_centrality(adj_matrix: np.ndarray, alpha: float = 0.1) -> dict[str, float] | np.ndarray:
+    """
+    Compute Katz centrality for each node in the graph represented by
+    adj_matrix (a single n x n matrix, or an N x n x n stack scored in one
+    batch).
+
+    Returns
+    -------
+    dict[str, float] | np.ndarray
+        Mapping of node label (as str) -> Katz centrality, or an (N, n) array.
+    """
+    scores = katz_centrality(adj_matrix, alpha=alpha).scores
+    if scores.ndim == 2:
+        return scores
+    return {str(node): float(score) for node, score in enumerate(scores)}
 
 
 def find_degree_centrality(adj_matrix: np.ndarray) -> dict[int, float]:
@@ -65,32 +263,69 @@ def find_degree_centrality(adj_matrix: np.ndarray) -> dict[int, float]:
     dict[int, float]
         Mapping of node index (int) -> normalized in-degree centrality score.
     """
-    G = nx.from_numpy_array(adj_matrix, create_using=nx.DiGraph())
-    scores = nx.in_degree_centrality(G)
-    return {int(node): score for node, score in scores.items()}
+    scores = default_engine.degree(adj_matrix)
+    return {int(node): float(score) for node, score in enumerate(scores)}
 
 
-def print_top(label: str, scores: dict, top_n: int = 10) -> None:
+def find_closeness_centrality(adj_matrix: np.ndarray) -> dict[str, float]:
+    """
+    Compute closeness centrality for each node in the graph
+    represented by adj_matrix, from incoming weighted distances.
+
+    Parameters
+    ----------
+    adj_matrix : np.ndarray
+        Square weighted adjacency matrix (n x n).
+
+    Returns
+    -------
+    dict[str, float]
+        Mapping of node label (as str) -> Wasserman-Faust closeness score.
+    """
+    scores = shortest_paths(adj_matrix).closeness()
+    return {str(node): float(score) for node, score in enumerate(scores)}
+
+
+def print_top(
+    label: str, scores, top_n: int = 10, pitch_space: PitchSpace = DEFAULT_PITCH_SPACE
+) -> None:
+    if isinstance(scores, np.ndarray):
+        scores = dict(enumerate(scores.tolist()))
     ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:top_n]
     print(f"\n{'='*40}")
     print(f"  {label} — Top {top_n} Nodes")
     print(f"{'='*40}")
-    labels = create_note_labels()
+    labels = create_note_labels(pitch_space)
     for rank, (node, score) in enumerate(ranked, start=1):
         print(f"  {rank:>2}. Node {str(node):>3} ({labels[int(node)]})  →  {score:.6f}")
 
-def print_centralities(adj_matrix: np.ndarray) -> None:
-    print("\nComputing centralities on a 48-node Tonnetz graph...")
-
-    print_top("Degree (in-degree) Centrality", find_degree_centrality(adj_matrix))
-    print_top("Betweenness Centrality",        find_betweenness_centrality(adj_matrix))
-    print_top("Eigenvector Centrality",        find_eigenvector_centrality(adj_matrix))
+def print_centralities(adj_matrix: np.ndarray, pitch_space: PitchSpace | None = None) -> None:
+    """
+    Print the top nodes of every centrality, labelled from `pitch_space`.
+    Defaults to C2-B5 for 48-node matrices and to MIDI notes from 0 (as
+    `FULL_PITCH_SPACE`) for any other size.
+    """
+    n = adj_matrix.shape[0]
+    if pitch_space is None:
+        if n == DEFAULT_PITCH_SPACE.num_notes:
+            pitch_space = DEFAULT_PITCH_SPACE
+        else:
+            pitch_space = PitchSpace(min_note=0, num_notes=n)
+    elif pitch_space.num_notes != n:
+        raise ValueError(f"pitch space has {pitch_space.num_notes} notes, matrix has {n} nodes")
+    print(f"\nComputing centralities on a {adj_matrix.shape[0]}-node Tonnetz graph...")
 
-def get_centralities(adj_matrix: np.ndarray) -> dict:
-    btw_ctr = find_betweenness_centrality(adj_matrix)
-    eig_ctr = find_eigenvector_centrality(adj_matrix)
-    deg_ctr = find_degree_centrality(adj_matrix)
+    scores = default_engine.compute(adj_matrix)
+    print_top("Degree (in-degree) Centrality", scores["degree"], pitch_space=pitch_space)
+    print_top("Betweenness Centrality",        scores["betweenness"], pitch_space=pitch_space)
+    print_top("Eigenvector Centrality",        scores["eigenvector"], pitch_space=pitch_space)
 
-    return {'btw': btw_ctr, 
-            'eig': eig_ctr,
-            'deg': deg_ctr}
\ No newline at end of file
+def get_centralities(adj_matrix: np.ndarray, engine: CentralityEngine | None = None) -> dict:
+    """
+    All three centralities from one graph conversion, as node-indexed
+    arrays under the short keys 'btw', 'eig' and 'deg'.
+    """
+    scores = (default_engine if engine is None else engine).compute(adj_matrix)
+    return {'btw': scores["betweenness"],
+            'eig': scores["eigenvector"],
+            'deg': scores["degree"]}
\ No newline at end of file
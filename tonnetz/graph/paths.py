@@ -0,0 +1,289 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from scipy.sparse import csgraph
+
+
+@dataclass(frozen=True, eq=False)
+class ShortestPaths:
+    """
+    All-pairs shortest paths of an adjacency matrix, computed once with
+    `scipy.sparse.csgraph.shortest_path` and shared by every path-based
+    statistic (betweenness, eccentricity, diameter, closeness).
+
+    Non-zero entries are edges; with `weighted` their values are edge
+    lengths (as networkx does with weight="weight"), otherwise every edge
+    has length 1. Self-loops never lie on a shortest path and are ignored.
+    """
+
+    lengths: np.ndarray   # (n, n) edge lengths, inf where there is no edge
+    dist: np.ndarray      # (n, n) dist[s, t] from s to t, inf if unreachable
+    directed: bool
+
+    @classmethod
+    def from_adjacency(
+        cls, adj_matrix: np.ndarray, weighted: bool = True, directed: bool = True
+    ) -> "ShortestPaths":
+        lengths = _edge_lengths(adj_matrix, weighted, directed)
+        return cls(lengths=lengths, dist=_distances(lengths, directed), directed=directed)
+
+    @property
+    def num_nodes(self) -> int:
+        return self.dist.shape[0]
+
+    def tight_edges(self) -> np.ndarray:
+        """
+        (n, n, n) bool, [s, u, v] true when edge u -> v lies on a shortest
+        path from s, i.e. dist[s, u] + length(u, v) == dist[s, v]. Together
+        they form the shortest-path DAG of every source.
+        """
+        return _tight_edges(self.lengths, self.dist)
+
+    def betweenness(self, normalized: bool = True) -> np.ndarray:
+        """
+        Betweenness centrality per node, equal to
+        `nx.betweenness_centrality(G, normalized, weight=...)`.
+
+        Brandes' recurrences are solved for all sources at once on the
+        shortest-path DAGs (see `_dependencies`).
+        """
+        n = self.num_nodes
+        betweenness = _dependencies(self.lengths, self.dist, np.arange(n)).sum(axis=0)
+        return betweenness * _betweenness_scale(n, normalized, self.directed)
+
+    def eccentricity(self, nodes: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Largest distance from each node to any other node (of `nodes`, if
+        given, measured within the whole graph); inf if one is unreachable.
+        """
+        dist = self.dist if nodes is None else self.dist[np.ix_(nodes, nodes)]
+        if dist.size == 0:
+            return np.zeros(0)
+        return dist.max(axis=1)
+
+    def diameter(self, nodes: Optional[np.ndarray] = None) -> float:
+        """Largest eccentricity; inf unless the graph is (strongly) connected."""
+        eccentricity = self.eccentricity(nodes)
+        return float(eccentricity.max()) if eccentricity.size else 0.0
+
+    def closeness(self, wf_improved: bool = True) -> np.ndarray:
+        """
+        Closeness centrality per node, equal to `nx.closeness_centrality`:
+        the inverse mean distance *to* a node from the nodes that reach it,
+        scaled by the reachable fraction (Wasserman-Faust) if `wf_improved`.
+        """
+        n = self.num_nodes
+        incoming = np.where(np.isfinite(self.dist), self.dist, 0.0)
+        total = incoming.sum(axis=0)
+        reached = np.isfinite(self.dist).sum(axis=0) - 1
+        closeness = np.zeros(n)
+        ok = (total > 0) & (n > 1)
+        closeness[ok] = reached[ok] / total[ok]
+        if wf_improved and n > 1:
+            closeness *= reached / (n - 1)
+        return closeness
+
+
+def _edge_lengths(adj_matrix: np.ndarray, weighted: bool, directed: bool) -> np.ndarray:
+    """(n, n) edge lengths, inf where there is no edge (or on the diagonal)."""
+    adj = np.asarray(adj_matrix, dtype=float)
+    edges = adj != 0
+    if not directed:
+        edges = edges | edges.T
+        adj = np.where(adj != 0, adj, adj.T)
+    np.fill_diagonal(edges, False)
+    return np.where(edges, adj if weighted else 1.0, np.inf)
+
+
+def _distances(
+    lengths: np.ndarray, directed: bool, sources: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Shortest-path distances from `sources` (all nodes if None), (k, n)."""
+    n = lengths.shape[0]
+    if n == 0 or (sources is not None and len(sources) == 0):
+        return np.zeros((n if sources is None else 0, n))
+    graph = np.where(np.isfinite(lengths), lengths, 0.0)
+    return csgraph.shortest_path(graph, method="D", directed=directed, indices=sources)
+
+
+def _tight_edges(lengths: np.ndarray, dist: np.ndarray) -> np.ndarray:
+    """(k, n, n) shortest-path DAGs of the sources whose distances are `dist`."""
+    reachable = np.isfinite(dist)
+    via = dist[:, :, None] + lengths[None, :, :]
+    return (via == dist[:, None, :]) & reachable[:, None, :]
+
+
+# Sources per batched solve; bounds the (k, n, n) temporaries to ~32 MB
+_SOURCE_BLOCK_ELEMENTS = 1 << 22
+
+
+def _dependencies(lengths: np.ndarray, dist: np.ndarray, sources: np.ndarray) -> np.ndarray:
+    """
+    Brandes dependencies delta_s(v) of every source s on every node v, (k, n),
+    with delta_s(s) = 0; their sum over all sources is the raw betweenness.
+
+    On the shortest-path DAG T_s of each source the path counts sigma_s solve
+    (I - T_s^T) sigma_s = e_s and the dependencies solve
+    (I - P_s) delta_s = P_s 1 with P_s[v, w] = T_s[v, w] sigma_s[v] / sigma_s[w];
+    both are batched `np.linalg.solve` calls over the sources.
+    """
+    k, n = dist.shape
+    delta = np.zeros((k, n))
+    if k == 0 or n == 0:
+        return delta
+    eye = np.eye(n)
+    block = max(1, _SOURCE_BLOCK_ELEMENTS // (n * n))
+    for lo in range(0, k, block):
+        hi = min(lo + block, k)
+        tight = _tight_edges(lengths, dist[lo:hi]).astype(float)
+        rhs = eye[sources[lo:hi], :, None]
+
+        # Number of shortest paths from each source; integral by construction
+        sigma = np.linalg.solve(eye - tight.transpose(0, 2, 1), rhs)[..., 0]
+        sigma = np.rint(sigma)
+
+        safe = np.where(sigma > 0, sigma, 1.0)
+        pred = tight * (sigma[:, :, None] / safe[:, None, :])
+        delta[lo:hi] = np.linalg.solve(eye - pred, pred.sum(axis=2)[..., None])[..., 0]
+    delta[np.arange(k), sources] = 0.0
+    return delta
+
+
+def _betweenness_scale(n: int, normalized: bool, directed: bool) -> float:
+    """networkx's rescaling of raw betweenness."""
+    if normalized:
+        return 1.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+    return 1.0 if directed else 0.5
+
+
+def shortest_paths(
+    adj_matrix: np.ndarray, weighted: bool = True, directed: bool = True
+) -> ShortestPaths:
+    """`ShortestPaths.from_adjacency`, see there."""
+    return ShortestPaths.from_adjacency(adj_matrix, weighted=weighted, directed=directed)
+
+
+def betweenness_centrality(adj_matrix: np.ndarray, normalized: bool = True) -> np.ndarray:
+    """Weighted, directed betweenness per node (weights as distances)."""
+    return shortest_paths(adj_matrix).betweenness(normalized)
+
+
+@dataclass(frozen=True, eq=False)
+class ApproximateBetweenness:
+    scores: np.ndarray    # (n,) estimated betweenness per node
+    std_error: np.ndarray # (n,) standard error of each estimate
+    error: float          # Hoeffding bound: P(max |score - exact| > error) <= delta
+    delta: float
+    samples: int          # source nodes used (n means the result is exact)
+
+
+def betweenness_samples(n: int, epsilon: float, delta: float = 0.1) -> int:
+    """
+    Source samples so that every normalized betweenness estimate is within
+    `epsilon` of the exact value with probability >= 1 - delta.
+
+    Each sample contributes n * delta_s(v) / ((n-1)(n-2)), a value in
+    [0, R] with R = n / (n-1); Hoeffding's inequality with a union bound
+    over the n nodes gives k >= R^2 / (2 epsilon^2) * ln(2n / delta).
+    """
+    if epsilon <= 0 or not 0 < delta < 1:
+        raise ValueError("epsilon must be > 0 and delta in (0, 1)")
+    if n < 2:
+        return n
+    R = n / (n - 1)
+    return int(np.ceil(R**2 / (2 * epsilon**2) * np.log(2 * n / delta)))
+
+
+def approximate_betweenness(
+    adj_matrix: np.ndarray,
+    samples: Optional[int] = None,
+    epsilon: Optional[float] = None,
+    delta: float = 0.1,
+    seed: Optional[int] = None,
+    normalized: bool = True,
+    weighted: bool = True,
+) -> ApproximateBetweenness:
+    """
+    Betweenness estimated from the dependencies of randomly sampled sources.
+
+    `samples` sources are drawn uniformly without replacement; the summed
+    dependencies are scaled by n / samples, giving an unbiased estimate of
+    the exact (directed) betweenness. Instead of a sample count an
+    (`epsilon`, `delta`) target may be given, see `betweenness_samples`.
+    Asking for n or more samples computes the exact values.
+
+    Parameters
+    ----------
+    adj_matrix : np.ndarray
+        Square weighted adjacency matrix (n x n).
+    samples : int | None
+        Number of source nodes.
+    epsilon : float | None
+        Target absolute error of the normalized scores, used when `samples`
+        is None.
+    delta : float
+        Failure probability of the error bound.
+    seed : int | None
+        Seed of the source sampling.
+    normalized : bool
+        Scale as `nx.betweenness_centrality(normalized=True)`.
+    weighted : bool
+        Use matrix values as edge lengths (otherwise hop counts).
+
+    Returns
+    -------
+    ApproximateBetweenness
+        Scores with their standard errors and the Hoeffding error bound at
+        confidence 1 - delta (in the units of the scores).
+    """
+    n = adj_matrix.shape[0]
+    if not 0 < delta < 1:
+        raise ValueError("delta must be in (0, 1)")
+    if samples is None:
+        if epsilon is None:
+            raise ValueError("either samples or epsilon is required")
+        samples = betweenness_samples(n, epsilon, delta)
+    elif samples < 1:
+        raise ValueError("samples must be >= 1")
+    samples = min(samples, n)
+
+    rng = np.random.default_rng(seed)
+    sources = np.sort(rng.choice(n, size=samples, replace=False))
+    lengths = _edge_lengths(adj_matrix, weighted, True)
+    dist = _distances(lengths, True, sources)
+    scale = _betweenness_scale(n, normalized, True)
+    contributions = _dependencies(lengths, dist, sources) * (n * scale)
+
+    if samples == n:
+        # Every source was used: exact
+        scores = contributions.sum(axis=0) / n if n else np.zeros(0)
+        std_error = np.zeros(n)
+        error = 0.0
+    else:
+        scores = contributions.mean(axis=0)
+        if samples > 1:
+            # Sampling without replacement: finite population correction
+            fpc = (n - samples) / (n - 1)
+            std_error = contributions.std(axis=0, ddof=1) * np.sqrt(fpc / samples)
+        else:
+            std_error = np.full(n, np.inf)
+        # Range of one contribution: n/(n-1) in normalized units
+        R = n * (n - 2) * scale
+        error = float(R * np.sqrt(np.log(2 * n / delta) / (2 * samples)))
+    return ApproximateBetweenness(
+        scores=scores, std_error=std_error, error=error, delta=delta, samples=samples
+    )
+
+
+def largest_component(adj_matrix: np.ndarray) -> np.ndarray:
+    """
+    Node indices of the largest weakly connected component (ties go to the
+    component with the lowest node, as with networkx).
+    """
+    n = adj_matrix.shape[0]
+    if n == 0:
+        return np.zeros(0, dtype=np.intp)
+    _, labels = csgraph.connected_components(adj_matrix != 0, directed=True, connection="weak")
+    return np.flatnonzero(labels == np.argmax(np.bincount(labels)))
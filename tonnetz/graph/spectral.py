@@ -0,0 +1,213 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True, eq=False)
+class SpectralScores:
+    scores: np.ndarray       # (..., n) centrality per node
+    iterations: np.ndarray   # (...) power-iteration steps taken
+    converged: np.ndarray    # (...) False where the exact fallback was used
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+
+def _as_stack(adj_matrix: np.ndarray) -> tuple[np.ndarray, tuple[int, ...]]:
+    """(N, n, n) float view of one matrix or a stack, plus the batch shape."""
+    adj = np.asarray(adj_matrix, dtype=float)
+    if adj.ndim < 2 or adj.shape[-1] != adj.shape[-2]:
+        raise ValueError(f"expected (n, n) or (N, n, n) matrices, got shape {adj.shape}")
+    batch = adj.shape[:-2]
+    return adj.reshape(-1, *adj.shape[-2:]), batch
+
+
+def _start(x0: Optional[np.ndarray], N: int, n: int, default: float) -> np.ndarray:
+    if x0 is None:
+        return np.full((N, n), default)
+    return np.broadcast_to(np.asarray(x0, dtype=float).reshape(-1, n), (N, n)).copy()
+
+
+def _power_iteration(
+    mats: np.ndarray,
+    x: np.ndarray,
+    step: Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray],
+    max_iter: int,
+    tol: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Iterate x <- step(mats[k], x, k) for every member k until the L1 change
+    drops below n * tol (networkx's criterion). Converged members are taken
+    out of the batch, so later steps only touch the slow ones.
+
+    Returns (x, iterations, active) where `active` indexes the members that
+    did not converge within max_iter.
+    """
+    N, n = x.shape
+    iterations = np.zeros(N, dtype=np.int64)
+    active = np.arange(N)
+    sub = mats
+    for i in range(1, max_iter + 1):
+        if not active.size:
+            break
+        xlast = x[active]
+        xnew = step(sub, xlast, active)
+        x[active] = xnew
+        iterations[active] = i
+        done = np.abs(xnew - xlast).sum(axis=1) < n * tol
+        if done.any():
+            active = active[~done]
+            sub = sub[~done]
+    return x, iterations, active
+
+
+def _result(x, iterations, active, batch) -> SpectralScores:
+    converged = np.ones(len(x), dtype=bool)
+    converged[active] = False
+    n = x.shape[-1]
+    return SpectralScores(
+        scores=x.reshape(*batch, n),
+        iterations=iterations.reshape(batch),
+        converged=converged.reshape(batch),
+    )
+
+
+def _l2_normalize(x: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(x, axis=-1, keepdims=True)
+    return x / np.where(norm > 0, norm, 1.0)
+
+
+def eigenvector_centrality(
+    adj_matrix: np.ndarray,
+    max_iter: int = 1000,
+    tol: float = 1e-6,
+    x0: Optional[np.ndarray] = None,
+) -> SpectralScores:
+    """
+    Eigenvector centrality of one matrix or a stack of matrices.
+
+    Power iteration x <- (A^T + I) x with L2 normalization, batched over the
+    stack and stopped per member as in `nx.eigenvector_centrality`
+    (weight="weight"). Members that do not converge within `max_iter` are
+    solved exactly with one batched `np.linalg.eig`, like
+    `nx.eigenvector_centrality_numpy`.
+
+    Parameters
+    ----------
+    adj_matrix : np.ndarray
+        (n, n) or (N, n, n) weighted adjacency matrices.
+    max_iter : int
+        Power-iteration steps before falling back to the eigensolver.
+    tol : float
+        Per-node tolerance of the L1 convergence test.
+    x0 : np.ndarray | None
+        Starting vector(s), (n,) or (N, n), e.g. the scores of a similar
+        matrix; rescaled to sum to 1. Defaults to uniform.
+
+    Returns
+    -------
+    SpectralScores
+        Scores shaped like the input minus its last axis.
+    """
+    mats, batch = _as_stack(adj_matrix)
+    N, n = mats.shape[:2]
+    x = _start(x0, N, n, 1.0)
+    total = x.sum(axis=1, keepdims=True)
+    x /= np.where(total != 0, total, 1.0)
+
+    def step(sub, xlast, _):
+        return _l2_normalize(xlast + (xlast[:, None, :] @ sub)[:, 0, :])
+
+    x, iterations, active = _power_iteration(mats, x, step, max_iter, tol)
+    if active.size:
+        values, vectors = np.linalg.eig(mats[active].transpose(0, 2, 1))
+        largest = np.argmax(values.real, axis=1)
+        vec = np.take_along_axis(vectors, largest[:, None, None], axis=2)[..., 0].real
+        sign = np.where(vec.sum(axis=1, keepdims=True) < 0, -1.0, 1.0)
+        x[active] = _l2_normalize(vec) * sign
+    return _result(x, iterations, active, batch)
+
+
+def pagerank(
+    adj_matrix: np.ndarray,
+    alpha: float = 0.85,
+    max_iter: int = 100,
+    tol: float = 1e-6,
+    x0: Optional[np.ndarray] = None,
+) -> SpectralScores:
+    """
+    PageRank of one matrix or a stack of matrices, as `nx.pagerank` with
+    weight="weight": rows are normalized to transition probabilities and
+    dangling nodes jump uniformly. Members that do not converge within
+    `max_iter` are solved exactly with a batched `np.linalg.solve`.
+
+    See `eigenvector_centrality` for the shared parameters; `alpha` is the
+    damping factor.
+    """
+    mats, batch = _as_stack(adj_matrix)
+    N, n = mats.shape[:2]
+    out = mats.sum(axis=2, keepdims=True)
+    dangling = out[..., 0] == 0
+    trans = mats / np.where(out != 0, out, 1.0)
+    x = _start(x0, N, n, 1.0)
+    total = x.sum(axis=1, keepdims=True)
+    x /= np.where(total != 0, total, 1.0)
+    uniform = 1.0 / n if n else 0.0
+
+    def step(sub, xlast, active):
+        leaked = (xlast * dangling[active]).sum(axis=1, keepdims=True)
+        return alpha * ((xlast[:, None, :] @ sub)[:, 0, :] + leaked * uniform) + (1 - alpha) * uniform
+
+    x, iterations, active = _power_iteration(trans, x, step, max_iter, tol)
+    if active.size:
+        # Stationary vector of the damped chain: x (I - alpha M) = (1 - alpha) p
+        chain = trans[active] + dangling[active][:, :, None] * uniform
+        system = np.eye(n) - alpha * chain.transpose(0, 2, 1)
+        rhs = np.full((active.size, n, 1), (1 - alpha) * uniform)
+        x[active] = np.linalg.solve(system, rhs)[..., 0]
+    return _result(x, iterations, active, batch)
+
+
+def katz_centrality(
+    adj_matrix: np.ndarray,
+    alpha: float = 0.1,
+    beta: float = 1.0,
+    max_iter: int = 1000,
+    tol: float = 1e-6,
+    normalized: bool = True,
+    x0: Optional[np.ndarray] = None,
+) -> SpectralScores:
+    """
+    Katz centrality of one matrix or a stack of matrices, as
+    `nx.katz_centrality` with weight="weight": x <- alpha A^T x + beta,
+    L2-normalized at the end if `normalized`. Members that do not converge
+    within `max_iter` are solved exactly, (I - alpha A^T) x = beta, with a
+    batched `np.linalg.solve`; that solution is only the Katz score while
+    the series converges, alpha * rho(A) < 1, so a member outside that
+    range raises ValueError (networkx raises PowerIterationFailedConvergence).
+
+    See `eigenvector_centrality` for the shared parameters; `x0` defaults
+    to zeros and is used as given.
+    """
+    mats, batch = _as_stack(adj_matrix)
+    N, n = mats.shape[:2]
+    x = _start(x0, N, n, 0.0)
+
+    def step(sub, xlast, _):
+        return alpha * (xlast[:, None, :] @ sub)[:, 0, :] + beta
+
+    x, iterations, active = _power_iteration(mats, x, step, max_iter, tol)
+    if active.size:
+        radius = np.abs(np.linalg.eigvals(mats[active])).max(axis=1, initial=0.0)
+        if np.any(alpha * radius >= 1):
+            raise ValueError(
+                f"Katz series diverges: alpha * spectral radius = {alpha * radius.max():.4g} >= 1"
+            )
+        system = np.eye(n) - alpha * mats[active].transpose(0, 2, 1)
+        x[active] = np.linalg.solve(system, np.full((active.size, n, 1), float(beta)))[..., 0]
+    if normalized:
+        sign = np.where(x.sum(axis=1, keepdims=True) < 0, -1.0, 1.0)
+        x = _l2_normalize(x) * sign
+    return _result(x, iterations, active, batch)
@@ -1,51 +1,381 @@
 
 
+from functools import cached_property
+
 import numpy as np
-import networkx as nx
+import scipy.sparse as sp
+from scipy.sparse import csgraph
+from tonnetz.graph.paths import ShortestPaths, largest_component
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE, PitchSpace
 from tonnetz.util.util import create_note_labels
 
 
-class Stats:
-    @staticmethod
-    def find_degree_distribution(adj_matrix: np.ndarray) -> dict[int, float]:
-        """
-        Finds the degree distribution from a np matrix
-
-        intution: higher degree distribution -> higher likelihood of transitioning to this note (hierchical tonal structure)
-        """
-
-        A = (adj_matrix != 0).astype(int)
+DEFAULT_STRENGTH_BINS = 10
+
+
+def _weighted_undirected(adj: np.ndarray) -> np.ndarray:
+    """(..., n, n) symmetric weights w_ij + w_ji without self-loops."""
+    W = np.abs(adj).astype(float)
+    W = W + np.swapaxes(W, -1, -2)
+    n = W.shape[-1]
+    W[..., np.arange(n), np.arange(n)] = 0
+    return W
+
+
+def _weighted_triangles(W: np.ndarray) -> np.ndarray:
+    """
+    (..., n) sum over neighbour pairs of the geometric mean of the three
+    triangle weights, each scaled by the graph's largest weight (Onnela).
+    """
+    top = W.max(axis=(-2, -1), keepdims=True) if W.size else np.ones(W.shape[:-2] + (1, 1))
+    C = np.cbrt(np.divide(W, top, out=np.zeros_like(W), where=top > 0))
+    return np.einsum("...ij,...ji->...i", C @ C, C)
+
+
+def _strength_distribution(strength: np.ndarray, bins) -> tuple[np.ndarray, np.ndarray]:
+    """Histogram (fractions) of the non-zero node strengths over shared bins."""
+    if np.ndim(bins) == 0:
+        top = float(strength.max()) if strength.size and strength.max() > 0 else 1.0
+        edges = np.linspace(0.0, top, int(bins) + 1)
+    else:
+        edges = np.asarray(bins, dtype=float)
+    num_bins = edges.size - 1
+    which = np.clip(np.searchsorted(edges, strength, side="right") - 1, 0, num_bins - 1)
+    counted = (strength > 0) & (strength >= edges[0]) & (strength <= edges[-1])
+    hist = ((which[..., None] == np.arange(num_bins)) & counted[..., None]).sum(axis=-2)
+    totals = hist.sum(axis=-1, keepdims=True)
+    return np.divide(hist, totals, out=np.zeros(hist.shape), where=totals > 0), edges
+
+
+class GraphStats:
+    """
+    Structural statistics of one adjacency matrix.
+
+    The binarized matrix, its symmetrized form and the triangle counts are
+    computed once and shared; every statistic is a lazily cached property,
+    so asking for several costs about one matrix product. `Stats` wraps the
+    same metrics as one-off static methods.
+    """
+
+    def __init__(self, adj_matrix: np.ndarray):
+        self.adj_matrix = adj_matrix
+
+    @cached_property
+    def binary(self) -> np.ndarray:
+        """Directed 0/1 adjacency (int), self-loops kept."""
+        return (self.adj_matrix != 0).astype(int)
+
+    @cached_property
+    def undirected(self) -> np.ndarray:
+        """Symmetrized 0/1 adjacency (int) without self-loops."""
+        U = ((self.binary + self.binary.T) > 0).astype(int)
+        np.fill_diagonal(U, 0)
+        return U
+
+    @cached_property
+    def degrees(self) -> np.ndarray:
+        """Undirected degree per node."""
+        return self.undirected.sum(axis=1)
+
+    @cached_property
+    def triangles(self) -> np.ndarray:
+        """diag(U^3) per node, i.e. twice its number of triangles."""
+        U = self.undirected.astype(float)
+        return np.einsum("ij,ji->i", U @ U, U)
+
+    @cached_property
+    def degree_distribution(self) -> dict[int, float]:
+        """Fraction of nodes per total (in + out) degree, degree-0 nodes excluded."""
+        A = self.binary
+        total_degree = A.sum(axis=0) + A.sum(axis=1)
+        if total_degree.size == 0:
+            return {}
 
-        out_degree = A.sum(axis=1)
-        in_degree = A.sum(axis=0)
+        counts = np.bincount(total_degree)
+        counts[0] = 0
+        total_nonzero = counts.sum()
+        if total_nonzero == 0:
+            return {}
 
-        total_degree = in_degree + out_degree
+        probs = counts / total_nonzero
+        dist = {k: float(probs[k]) for k in np.flatnonzero(counts).tolist()}
 
-        if total_degree.size == 0:
-            return {}
+        assert abs(sum(dist.values()) - 1.0) < 1e-9, "error: degree dist must sum to 1"
 
-        max_deg = int(total_degree.max())
+        return dist
 
-        counts = np.bincount(total_degree, minlength=max_deg + 1)
+    @cached_property
+    def clustering(self) -> np.ndarray:
+        """Clustering coefficient per node, 0 for nodes of degree < 2."""
+        k = self.degrees
+        pairs = k * (k - 1)
+        return np.divide(self.triangles, pairs, out=np.zeros(k.shape), where=k >= 2)
+
+    @cached_property
+    def clustering_coefficient(self) -> dict[int, float]:
+        return dict(enumerate(self.clustering.tolist()))
+
+    @cached_property
+    def average_clustering(self) -> float:
+        return float(self.clustering.mean()) if self.clustering.size else 0.0
+
+    @cached_property
+    def in_strength(self) -> np.ndarray:
+        """Weighted in-degree per node (column sums, self-loops included)."""
+        return self.adj_matrix.sum(axis=0).astype(float)
+
+    @cached_property
+    def out_strength(self) -> np.ndarray:
+        """Weighted out-degree per node (row sums, self-loops included)."""
+        return self.adj_matrix.sum(axis=1).astype(float)
+
+    @cached_property
+    def strength(self) -> np.ndarray:
+        """Total (in + out) strength per node."""
+        return self.in_strength + self.out_strength
+
+    def strength_distribution(self, bins=DEFAULT_STRENGTH_BINS) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Fraction of nodes per total-strength bin, strength-0 nodes excluded.
+        `bins` is a count (equal bins up to the largest strength) or edges.
+        Returns (fractions, bin edges).
+        """
+        return _strength_distribution(self.strength, bins)
 
-        # Exclude degree 0 nodes from distribution
-        counts_nonzero = counts.copy()
-        counts_nonzero[0] = 0
-        total_nonzero = counts_nonzero.sum()
+    @cached_property
+    def weighted_undirected(self) -> np.ndarray:
+        """Symmetric weights w_ij + w_ji without self-loops."""
+        return _weighted_undirected(self.adj_matrix)
 
-        if total_nonzero == 0:
-            return {}
+    @cached_property
+    def weighted_clustering(self) -> np.ndarray:
+        """
+        Onnela weighted clustering per node (geometric mean of the scaled
+        triangle weights), as `nx.clustering(G, weight="weight")` on the
+        `weighted_undirected` graph; 0 for nodes of degree < 2.
+        """
+        k = self.degrees
+        pairs = k * (k - 1)
+        triangles = _weighted_triangles(self.weighted_undirected)
+        return np.divide(triangles, pairs, out=np.zeros(k.shape), where=k >= 2)
+
+    @cached_property
+    def average_weighted_clustering(self) -> float:
+        return float(self.weighted_clustering.mean()) if self.weighted_clustering.size else 0.0
+
+    @cached_property
+    def giant_component(self) -> np.ndarray:
+        """Node indices of the largest connected component."""
+        return largest_component(self.undirected)
+
+    @cached_property
+    def giant_component_size(self) -> int:
+        return int(self.giant_component.size)
+
+    @cached_property
+    def eccentricity(self) -> dict[int, int]:
+        """Eccentricity (in undirected steps) of each giant-component node."""
+        giant = self.giant_component
+        if giant.size <= 1:
+            return {int(node): 0 for node in giant}
+
+        paths = ShortestPaths.from_adjacency(
+            self.undirected[np.ix_(giant, giant)], weighted=False, directed=False
+        )
+        return {int(node): int(ecc) for node, ecc in zip(giant, paths.eccentricity())}
+
+    @cached_property
+    def diameter(self) -> int:
+        """Diameter of the giant component."""
+        return int(max(self.eccentricity.values(), default=0))
+
+
+# Graphs per block-diagonal csgraph call in BatchGraphStats. Shortest paths
+# return a dense (chunk * n)^2 array of which only the diagonal blocks are
+# used, so they take fewer graphs at a time than the component labelling.
+COMPONENT_CHUNK = 256
+DIAMETER_CHUNK = 8
+
+
+class BatchGraphStats:
+    """
+    `GraphStats` of a stack of N adjacency matrices, as arrays of shape
+    (N, ...). Clustering uses one batched matrix product; components and
+    diameters run `scipy.sparse.csgraph` on block-diagonal matrices of
+    many graphs at a time instead of looping over graphs in Python.
+    """
+
+    def __init__(self, adj_matrices: np.ndarray):
+        adj_matrices = np.asarray(adj_matrices)
+        if adj_matrices.ndim != 3 or adj_matrices.shape[1] != adj_matrices.shape[2]:
+            raise ValueError(f"expected (N, n, n) matrices, got shape {adj_matrices.shape}")
+        self.adj_matrices = adj_matrices
+
+    def __len__(self) -> int:
+        return len(self.adj_matrices)
+
+    @property
+    def num_nodes(self) -> int:
+        return self.adj_matrices.shape[1]
+
+    @cached_property
+    def binary(self) -> np.ndarray:
+        """(N, n, n) directed 0/1 adjacency (bool), self-loops kept."""
+        return self.adj_matrices != 0
+
+    @cached_property
+    def undirected(self) -> np.ndarray:
+        """(N, n, n) symmetrized 0/1 adjacency (bool) without self-loops."""
+        U = self.binary | self.binary.transpose(0, 2, 1)
+        U[:, np.arange(self.num_nodes), np.arange(self.num_nodes)] = False
+        return U
+
+    @cached_property
+    def degrees(self) -> np.ndarray:
+        """(N, n) undirected degree per node."""
+        return self.undirected.sum(axis=2)
+
+    @cached_property
+    def triangles(self) -> np.ndarray:
+        """(N, n) diag(U^3) per node."""
+        U = self.undirected.astype(float)
+        return np.einsum("kij,kji->ki", U @ U, U)
+
+    @cached_property
+    def degree_distribution(self) -> np.ndarray:
+        """
+        (N, 2n + 1) fraction of nodes per total (in + out) degree, degree-0
+        nodes excluded; all-zero rows for graphs without edges.
+        """
+        A = self.binary
+        total_degree = A.sum(axis=1) + A.sum(axis=2)
+        N, n = total_degree.shape
+        counts = np.zeros((N, 2 * n + 1))
+        np.add.at(counts, (np.arange(N)[:, None], total_degree), 1)
+        counts[:, 0] = 0
+        totals = counts.sum(axis=1, keepdims=True)
+        return np.divide(counts, totals, out=counts, where=totals > 0)
+
+    @cached_property
+    def clustering(self) -> np.ndarray:
+        """(N, n) clustering coefficient per node, 0 for nodes of degree < 2."""
+        k = self.degrees
+        pairs = k * (k - 1)
+        return np.divide(self.triangles, pairs, out=np.zeros(k.shape), where=k >= 2)
+
+    @cached_property
+    def average_clustering(self) -> np.ndarray:
+        """(N,) mean clustering coefficient."""
+        if self.num_nodes == 0:
+            return np.zeros(len(self))
+        return self.clustering.mean(axis=1)
+
+    @cached_property
+    def in_strength(self) -> np.ndarray:
+        """(N, n) weighted in-degree per node."""
+        return self.adj_matrices.sum(axis=1).astype(float)
+
+    @cached_property
+    def out_strength(self) -> np.ndarray:
+        """(N, n) weighted out-degree per node."""
+        return self.adj_matrices.sum(axis=2).astype(float)
+
+    @cached_property
+    def strength(self) -> np.ndarray:
+        """(N, n) total (in + out) strength per node."""
+        return self.in_strength + self.out_strength
+
+    def strength_distribution(self, bins=DEFAULT_STRENGTH_BINS) -> tuple[np.ndarray, np.ndarray]:
+        """
+        (N, bins) fractions of nodes per total-strength bin, with bins
+        shared by the whole stack; see `GraphStats.strength_distribution`.
+        """
+        return _strength_distribution(self.strength, bins)
+
+    @cached_property
+    def weighted_clustering(self) -> np.ndarray:
+        """(N, n) Onnela weighted clustering, see `GraphStats.weighted_clustering`."""
+        k = self.degrees
+        pairs = k * (k - 1)
+        triangles = _weighted_triangles(_weighted_undirected(self.adj_matrices))
+        return np.divide(triangles, pairs, out=np.zeros(k.shape), where=k >= 2)
+
+    @cached_property
+    def average_weighted_clustering(self) -> np.ndarray:
+        """(N,) mean weighted clustering coefficient."""
+        if self.num_nodes == 0:
+            return np.zeros(len(self))
+        return self.weighted_clustering.mean(axis=1)
+
+    def _block_diagonal(self, lo: int, hi: int) -> sp.csr_array:
+        """Undirected graphs lo..hi-1 as one block-diagonal CSR matrix."""
+        n = self.num_nodes
+        k, i, j = np.nonzero(self.undirected[lo:hi])
+        size = (hi - lo) * n
+        return sp.csr_array((np.ones(k.size), (k * n + i, k * n + j)), shape=(size, size))
+
+    @cached_property
+    def giant_component(self) -> np.ndarray:
+        """
+        (N, n) bool mask of each graph's largest connected component (ties
+        go to the component with the lowest node, as in `GraphStats`).
+        """
+        N, n = len(self), self.num_nodes
+        mask = np.zeros((N, n), dtype=bool)
+        if n == 0:
+            return mask
+        for lo in range(0, N, COMPONENT_CHUNK):
+            hi = min(lo + COMPONENT_CHUNK, N)
+            _, labels = csgraph.connected_components(self._block_diagonal(lo, hi), directed=False)
+            node_size = np.bincount(labels)[labels].reshape(hi - lo, n)
+            labels = labels.reshape(hi - lo, n)
+            # Labels grow with the lowest node of a component: first max wins
+            first = np.argmax(node_size == node_size.max(axis=1, keepdims=True), axis=1)
+            mask[lo:hi] = labels == labels[np.arange(hi - lo), first][:, None]
+        return mask
+
+    @cached_property
+    def giant_component_size(self) -> np.ndarray:
+        """(N,) nodes in the largest connected component."""
+        return self.giant_component.sum(axis=1)
+
+    @cached_property
+    def diameter(self) -> np.ndarray:
+        """(N,) diameter (in undirected steps) of each graph's giant component."""
+        N, n = len(self), self.num_nodes
+        diameter = np.zeros(N, dtype=int)
+        if n == 0:
+            return diameter
+        block = np.arange(DIAMETER_CHUNK)
+        for lo in range(0, N, DIAMETER_CHUNK):
+            hi = min(lo + DIAMETER_CHUNK, N)
+            dist = csgraph.shortest_path(
+                self._block_diagonal(lo, hi), method="D", directed=False, unweighted=True
+            )
+            c = hi - lo
+            dist = dist.reshape(c, n, c, n)[block[:c], :, block[:c], :]
+            giant = self.giant_component[lo:hi]
+            within = giant[:, :, None] & giant[:, None, :]
+            diameter[lo:hi] = np.where(within, dist, 0).max(axis=(1, 2))
+        return diameter
 
-        probs = counts_nonzero / total_nonzero
 
-        dist = {k: float(probs[k]) for k in range(1, len(probs)) if counts[k] > 0}
+class Stats:
+    @staticmethod
+    def find_degree_distribution(adj_matrix: np.ndarray) -> dict[int, float] | np.ndarray:
+        """
+        Finds the degree distribution from a np matrix
 
-        assert abs(sum(dist.values()) - 1.0) < 1e-9, "error: degree dist must sum to 1"
+        intution: higher degree distribution -> higher likelihood of transitioning to this note (hierchical tonal structure)
 
-        return dist
+        a stack of N matrices (N x n x n) gives an (N, 2n + 1) array of fractions indexed by degree (see `BatchGraphStats`)
+        """
+        if np.ndim(adj_matrix) == 3:
+            return BatchGraphStats(adj_matrix).degree_distribution
+        return GraphStats(adj_matrix).degree_distribution
 
     @staticmethod
-    def find_clustering_coefficient(adj_matrix: np.ndarray) -> dict[int, float]:
+    def find_clustering_coefficient(adj_matrix: np.ndarray) -> dict[int, float] | np.ndarray:
         """
         Find clustering coefficients
 
@@ -54,122 +384,152 @@ class Stats:
         for example: if a note A has edges to neighbors B and C, how likely will a note transition to C given that it transitioned to B
 
         intuition: if a note has high clustering coefficient, this means notes connected to a given node have high probability of transitioning between each other!
-        """
-        A = (adj_matrix != 0).astype(int)
-        A = ((A + A.T) > 0).astype(int)
-        np.fill_diagonal(A, 0)
-        k = A.sum(axis=1)
-        A3 = A @ A @ A
-
-        clustering = {}
 
-        for i in range(len(A)):
-            if k[i] < 2:
-                clustering[i] = 0.0
-            else:
-                clustering[i] = A3[i, i] / (k[i] * (k[i] - 1))
-
-        return clustering
+        a stack of N matrices (N x n x n) gives an (N, n) array (see `BatchGraphStats`)
+        """
+        if np.ndim(adj_matrix) == 3:
+            return BatchGraphStats(adj_matrix).clustering
+        return GraphStats(adj_matrix).clustering_coefficient
 
     @staticmethod
-    def find_average_clustering(adj_matrix: np.ndarray) -> float:
+    def find_average_clustering(adj_matrix: np.ndarray) -> float | np.ndarray:
         """
         Finds overall average clustering coefficient of the graph
 
         intuition: how harmonically structured is the entire piece?
-        """
-
-        clustering = Stats.find_clustering_coefficient(adj_matrix)
-
-        if not clustering:
-            return 0.0
 
-        return float(np.mean(list(clustering.values())))
+        a stack of N matrices (N x n x n) gives an (N,) array (see `BatchGraphStats`)
+        """
+        if np.ndim(adj_matrix) == 3:
+            return BatchGraphStats(adj_matrix).average_clustering
+        return GraphStats(adj_matrix).average_clustering
 
     @staticmethod
-    def find_diameter(adj_matrix: np.ndarray) -> int:
+    def find_diameter(adj_matrix: np.ndarray) -> int | np.ndarray:
         """
         Finds the diameter of the graph "longest shortest path"
 
         intuition: how wide the musical pitch is of a piece
-        """
 
-        A = (adj_matrix != 0).astype(int)
-        U = ((A + A.T) > 0).astype(int)
-        np.fill_diagonal(U, 0)
-        Gu = nx.from_numpy_array(U, create_using=nx.Graph())
-
-        if Gu.number_of_nodes() <= 1 or Gu.number_of_edges() == 0:
-            return 0
-
-        giant_nodes = max(nx.connected_components(Gu), key=len)
-        H = Gu.subgraph(giant_nodes)
+        a stack of N matrices (N x n x n) gives an (N,) array (see `BatchGraphStats`)
+        """
+        if np.ndim(adj_matrix) == 3:
+            return BatchGraphStats(adj_matrix).diameter
+        return GraphStats(adj_matrix).diameter
 
-        if H.number_of_nodes() <= 1:
-            return 0
+    @staticmethod
+    def find_eccentricity(adj_matrix: np.ndarray) -> dict[int, int]:
+        """
+        Finds the eccentricity of every node of the giant component: the most
+        steps (ignoring edge direction) it takes to reach any other of its notes
 
-        return int(nx.diameter(H))
+        intuition: small eccentricity -> the note sits at the harmonic centre of the piece
+        """
+        return GraphStats(adj_matrix).eccentricity
 
     @staticmethod
-    def find_giant_component_size(adj_matrix: np.ndarray) -> int:
+    def find_giant_component_size(adj_matrix: np.ndarray) -> int | np.ndarray:
         """
         Finds the size of the giant component in a given graph
 
         intuition: if the giant component is close to 48, then most notes are part of the
                 same tonal/transition universe. If it's much smaller, the piece's transitions are
                 split into separate pitch regions that don't interact much.
+
+        a stack of N matrices (N x n x n) gives an (N,) array (see `BatchGraphStats`)
         """
+        if np.ndim(adj_matrix) == 3:
+            return BatchGraphStats(adj_matrix).giant_component_size
+        return GraphStats(adj_matrix).giant_component_size
 
-        A = (adj_matrix != 0).astype(int)
-        U = ((A + A.T) > 0).astype(int)
-        np.fill_diagonal(U, 0)
+    @staticmethod
+    def find_weighted_degree(adj_matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the weighted in- and out-degree (strength) of every node
+
+        intuition: in-strength -> how much probability mass flows into a note
+
+        a stack of N matrices (N x n x n) gives (N, n) arrays
+        """
+        stats = BatchGraphStats(adj_matrix) if np.ndim(adj_matrix) == 3 else GraphStats(adj_matrix)
+        return stats.in_strength, stats.out_strength
+
+    @staticmethod
+    def find_strength_distribution(
+        adj_matrix: np.ndarray, bins=DEFAULT_STRENGTH_BINS
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the distribution of total (in + out) node strength, the weighted
+        counterpart of the degree distribution; returns (fractions, bin edges)
+
+        a stack of N matrices (N x n x n) gives (N, bins) fractions over shared bins
+        """
+        stats = BatchGraphStats(adj_matrix) if np.ndim(adj_matrix) == 3 else GraphStats(adj_matrix)
+        return stats.strength_distribution(bins)
 
-        Gu = nx.from_numpy_array(U, create_using=nx.Graph())
+    @staticmethod
+    def find_weighted_clustering_coefficient(adj_matrix: np.ndarray) -> dict[int, float] | np.ndarray:
+        """
+        Find weighted (Onnela) clustering coefficients
 
-        if Gu.number_of_nodes() == 0:
-            return 0
-        if Gu.number_of_edges() == 0:
-            # nodes exist but no connections; largest component is any single node
-            return 1 if Gu.number_of_nodes() > 0 else 0
+        like find_clustering_coefficient, but a triangle counts with the geometric mean of
+        its transition probabilities, so rare transitions barely add to a note's clustering
+
+        a stack of N matrices (N x n x n) gives an (N, n) array (see `BatchGraphStats`)
+        """
+        if np.ndim(adj_matrix) == 3:
+            return BatchGraphStats(adj_matrix).weighted_clustering
+        return dict(enumerate(GraphStats(adj_matrix).weighted_clustering.tolist()))
 
-        giant_nodes = max(nx.connected_components(Gu), key=len)
-        return int(len(giant_nodes))
+    @staticmethod
+    def find_average_weighted_clustering(adj_matrix: np.ndarray) -> float | np.ndarray:
+        """
+        Finds the average weighted clustering coefficient of the graph
+
+        a stack of N matrices (N x n x n) gives an (N,) array (see `BatchGraphStats`)
+        """
+        if np.ndim(adj_matrix) == 3:
+            return BatchGraphStats(adj_matrix).average_weighted_clustering
+        return GraphStats(adj_matrix).average_weighted_clustering
 
     @staticmethod
-    def print_statistics(adj_matrix: np.ndarray) -> None:
+    def print_statistics(
+        adj_matrix: np.ndarray, pitch_space: PitchSpace = DEFAULT_PITCH_SPACE
+    ) -> None:
         """
         Cleanly prints all stats from a given numpy array
         """
+        stats = GraphStats(adj_matrix)
         width = 40
         print(f"\n{'=' * width}")
         print(f"{'Degree Distribution'.center(width)}")
         print(f"{'=' * width}")
-        deg_dist = Stats.find_degree_distribution(adj_matrix)
+        deg_dist = stats.degree_distribution
         for deg, dist in deg_dist.items():
             print(f"Degree {deg} → Frequency: {dist:.3f}")
 
         print(f"\n{'=' * width}")
         print(f"{'Clustering Coefficients'.center(width)}")
         print(f"{'=' * width}")
-        clust_coeff = Stats.find_clustering_coefficient(adj_matrix)
-        labels = create_note_labels()
+        clust_coeff = stats.clustering_coefficient
+        labels = create_note_labels(pitch_space)
         for node, coeff in clust_coeff.items():
             print(f"Node {node} ({labels[node]}) → {coeff:.3f}")
 
         print(f"\n{'=' * width}")
         print(f"{'Average Clustering'.center(width)}")
         print(f"{'=' * width}")
-        avg_clust = Stats.find_average_clustering(adj_matrix)
+        avg_clust = stats.average_clustering
         print(f"Average Clustering: {avg_clust:.3f}")
 
         print(f"\n{'=' * width}")
         print(f"{'Diameter'.center(width)}")
         print(f"{'=' * width}")
-        diam = Stats.find_diameter(adj_matrix)
+        diam = stats.diameter
         print(f"Diameter: {diam}")
 
         print(f"\n{'=' * width}")
         print(f"{'Giant Component Size'.center(width)}")
         print(f"{'=' * width}")
-        giant_comp_size = Stats.find_giant_component_size(adj_matrix)
+        giant_comp_size = stats.giant_component_size
         print(f"Giant Component Size: {giant_comp_size}")
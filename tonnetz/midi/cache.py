@@ -0,0 +1,254 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import scipy.sparse as sp
+
+from tonnetz.midi.events import EventTable, read_event_table
+from tonnetz.midi.parser import (
+    channel_transition_counts,
+    channel_transition_matrix,
+    compact_counts,
+)
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE, PitchSpace
+
+
+# Bump whenever parsing semantics change so stale entries are never reused.
+CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 1 << 30  # 1 GiB
+
+# (path, size, mtime_ns) -> sha256 hex digest, so a file is hashed once per process.
+_DIGEST_MEMO: dict[tuple[str, int, int], str] = {}
+
+
+def file_digest(path: str | Path) -> str:
+    """Return the sha256 hex digest of a file's contents."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    memo_key = (path, st.st_size, st.st_mtime_ns)
+    digest = _DIGEST_MEMO.get(memo_key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = h.hexdigest()
+        _DIGEST_MEMO[memo_key] = digest
+    return digest
+
+
+class ParseCache:
+    """
+    Content-addressed on-disk cache for parsed event tables, transition
+    counts and transition matrices.
+
+    Entries are keyed on the sha256 of the MIDI file contents plus the parse
+    parameters and CACHE_VERSION, so renaming or touching a file keeps its
+    entries valid while editing it does not. Matrices are stored as `.npy`,
+    event tables and sparse counts as `.npz`. When the directory grows past `max_bytes` the
+    least recently used entries are evicted (hits refresh the file mtime).
+
+    Parameters
+    ----------
+    root : str | Path
+        Cache directory (created if missing).
+    max_bytes : int
+        Size bound for all entries together.
+    reader : str
+        MIDI decoder used on cache misses ("mido" or "smf"); both produce
+        the same tables, so entries are shared between them.
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int = DEFAULT_MAX_BYTES, reader: str = "mido"):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_bytes)
+        self.reader = reader
+        self._size: Optional[int] = None
+
+    # --- public API -------------------------------------------------------
+
+    def event_table(self, midi_file: str) -> EventTable:
+        """Cached `read_event_table`."""
+        path = self._entry_path(midi_file, "events", {}, ".npz")
+        if path.exists():
+            try:
+                with np.load(path) as data:
+                    table = EventTable(
+                        events=data["events"],
+                        tempos=data["tempos"],
+                        ticks_per_beat=int(data["ticks_per_beat"]),
+                    )
+                self._touch(path)
+                return table
+            except (OSError, ValueError, KeyError):
+                path.unlink(missing_ok=True)
+
+        table = read_event_table(midi_file, self.reader)
+        self._write(
+            path,
+            lambda f: np.savez(
+                f,
+                events=table.events,
+                tempos=table.tempos,
+                ticks_per_beat=np.int64(table.ticks_per_beat),
+            ),
+        )
+        return table
+
+    def transition_matrix(
+        self,
+        midi_file: str,
+        target_channel: int,
+        threshold: float = 0.01,
+        pitch_space: PitchSpace = DEFAULT_PITCH_SPACE,
+    ) -> np.ndarray:
+        """Cached `channel_transition_matrix` of one channel of a file."""
+        params = {
+            "channel": int(target_channel),
+            "min_note": pitch_space.min_note,
+            "num_notes": pitch_space.num_notes,
+            "threshold": float(threshold),
+        }
+        path = self._entry_path(midi_file, "transition", params, ".npy")
+        if path.exists():
+            try:
+                matrix = np.load(path)
+                self._touch(path)
+                return matrix
+            except (OSError, ValueError):
+                path.unlink(missing_ok=True)
+
+        matrix = channel_transition_matrix(
+            self.event_table(midi_file).events, target_channel, threshold, pitch_space
+        )
+        self._write(path, lambda f: np.save(f, matrix))
+        return matrix
+
+    def transition_counts(
+        self, midi_file: str, target_channel: int, pitch_space: PitchSpace = DEFAULT_PITCH_SPACE
+    ):
+        """
+        Cached raw `channel_transition_counts` of one channel of a file,
+        as a CSR array when `pitch_space.sparse`.
+        """
+        params = {
+            "channel": int(target_channel),
+            "min_note": pitch_space.min_note,
+            "num_notes": pitch_space.num_notes,
+        }
+        # Dense and sparse entries differ by suffix
+        suffix = ".npz" if pitch_space.sparse else ".npy"
+        path = self._entry_path(midi_file, "counts", params, suffix)
+        if path.exists():
+            try:
+                counts = sp.load_npz(path) if pitch_space.sparse else np.load(path)
+                self._touch(path)
+                return counts
+            except (OSError, ValueError):
+                path.unlink(missing_ok=True)
+
+        counts = channel_transition_counts(
+            self.event_table(midi_file).events, target_channel, pitch_space
+        )
+        if pitch_space.sparse:
+            counts = compact_counts(sp.csr_array(counts))
+            self._write(path, lambda f: sp.save_npz(f, counts))
+        else:
+            counts = compact_counts(counts)
+            self._write(path, lambda f: np.save(f, counts))
+        return counts
+
+    def invalidate(self, midi_file: str) -> int:
+        """Remove every entry derived from `midi_file`; returns the count removed."""
+        prefix = file_digest(midi_file)[:32]
+        return self._remove(p for p in self._entries() if p.name.startswith(prefix))
+
+    def clear(self) -> int:
+        """Remove every entry; returns the count removed."""
+        return self._remove(self._entries())
+
+    def size_bytes(self) -> int:
+        """Total size of all entries in bytes."""
+        return sum(p.stat().st_size for p in self._entries())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._entries())
+
+    # --- internals --------------------------------------------------------
+
+    def _entry_path(self, midi_file: str, kind: str, params: dict, suffix: str) -> Path:
+        param_blob = json.dumps(
+            {"kind": kind, "params": params, "version": CACHE_VERSION}, sort_keys=True
+        )
+        param_hash = hashlib.sha256(param_blob.encode("utf-8")).hexdigest()[:16]
+        return self.root / f"{file_digest(midi_file)[:32]}-{kind}-{param_hash}{suffix}"
+
+    def _entries(self):
+        return (p for p in self.root.iterdir() if p.is_file() and p.suffix in (".npy", ".npz"))
+
+    def _touch(self, path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _write(self, path: Path, save) -> None:
+        # Write to a temp file and rename so concurrent workers never see
+        # a half-written entry.
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                save(f)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        if self._size is None:
+            self._size = self.size_bytes()
+        else:
+            self._size += path.stat().st_size
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under max_bytes."""
+        entries = []
+        for p in self._entries():
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, p))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in entries:
+            if total <= self.max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+        self._size = total
+
+    def _remove(self, paths) -> int:
+        removed = 0
+        for p in list(paths):
+            p.unlink(missing_ok=True)
+            removed += 1
+        self._size = None
+        return removed
+
+
+def load_event_table(
+    midi_file: str, cache: Optional[ParseCache] = None, reader: str = "mido"
+) -> EventTable:
+    """`read_event_table`, served from `cache` when one is given."""
+    if cache is None:
+        return read_event_table(midi_file, reader)
+    return cache.event_table(midi_file)
@@ -0,0 +1,129 @@
+import csv
+import re
+from pathlib import Path
+
+
+def parse_channel_list(raw: str | None) -> list[int]:
+    if raw is None:
+        return []
+    text = str(raw).strip()
+    if not text:
+        return []
+
+    out: list[int] = []
+    for token in re.split(r"[|;/\s]+", text):
+        tok = token.strip()
+        if not tok:
+            continue
+        if not tok.lstrip("-").isdigit():
+            continue
+        ch = int(tok)
+        if 0 <= ch <= 15:
+            out.append(ch)
+    return sorted(set(out))
+
+
+def _normalize_file_key(path_like: str) -> str:
+    return Path(path_like).name.lower().strip()
+
+
+def resolve_channel_roles(
+    role_map: dict[str, dict[str, list[int]]],
+    midi_path: str,
+) -> dict[str, list[int]]:
+    """
+    Resolve channel-role config for a MIDI path with a fallback for combined files.
+    Example fallback: song_combined.mid -> song.mid
+    """
+    key = _normalize_file_key(midi_path)
+    cfg = role_map.get(key)
+    if cfg is not None:
+        return cfg
+
+    stem = Path(key).stem
+    suffix = Path(key).suffix
+    if stem.endswith("_combined"):
+        base_key = f"{stem[:-9]}{suffix}"
+        cfg = role_map.get(base_key)
+        if cfg is not None:
+            return cfg
+
+    return {}
+
+
+def load_channel_map(csv_path: str | Path) -> dict[str, dict[str, list[int]]]:
+    """
+    Load channel role mapping from CSV.
+
+    Supported rows:
+    - filename, channel                (legacy: melody only)
+    - filename, melody_channel, chords_channel
+    - with headers using fields like: file/filename/midi, melody, chord/chords
+    """
+    csv_path = Path(csv_path)
+    mapping: dict[str, dict[str, list[int]]] = {}
+    if not csv_path.exists():
+        return mapping
+
+    lines: list[str] = []
+    with csv_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            s = line.strip()
+            if s and not s.startswith("#"):
+                lines.append(s)
+    if not lines:
+        return mapping
+
+    has_header = any(
+        key in lines[0].lower()
+        for key in ("file", "filename", "midi", "melody", "chord")
+    )
+
+    if has_header:
+        reader = csv.DictReader(lines)
+        for row in reader:
+            if not row:
+                continue
+            filename = (
+                row.get("filename")
+                or row.get("file")
+                or row.get("midi")
+                or row.get("track")
+            )
+            if not filename:
+                continue
+            melody = (
+                row.get("melody")
+                or row.get("melody_channel")
+                or row.get("melody_channels")
+                or row.get("lead")
+            )
+            chords = (
+                row.get("chords")
+                or row.get("chord")
+                or row.get("chord_channel")
+                or row.get("chord_channels")
+                or row.get("harmony")
+            )
+            key = _normalize_file_key(filename)
+            mapping[key] = {
+                "melody": parse_channel_list(melody),
+                "chords": parse_channel_list(chords),
+            }
+    else:
+        reader = csv.reader(lines)
+        for row in reader:
+            if not row:
+                continue
+            filename = str(row[0]).strip()
+            if not filename:
+                continue
+            key = _normalize_file_key(filename)
+            melody_raw = row[1] if len(row) > 1 else ""
+            chords_raw = row[2] if len(row) > 2 else ""
+            mapping[key] = {
+                "melody": parse_channel_list(melody_raw),
+                "chords": parse_channel_list(chords_raw),
+            }
+
+    return mapping
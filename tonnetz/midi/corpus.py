@@ -0,0 +1,247 @@
+from __future__ import annotations
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+import numpy as np
+import scipy.sparse as sp
+
+from tonnetz.midi.cache import ParseCache
+from tonnetz.midi.channel_map import load_channel_map, resolve_channel_roles
+from tonnetz.midi.events import read_event_table
+from tonnetz.midi.parser import (
+    TransitionCounts,
+    channel_transition_counts,
+    channel_transition_matrix,
+    compact_counts,
+)
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE, PitchSpace
+
+
+MIDI_SUFFIXES = (".mid", ".midi")
+
+# One ParseCache per (cache directory, reader) per worker process.
+_WORKER_CACHES: dict[tuple[str, str], ParseCache] = {}
+
+
+def find_midi_files(source: str | Path | Iterable[str | Path]) -> list[Path]:
+    """
+    Resolve a corpus source into a sorted list of MIDI file paths.
+
+    `source` may be a directory (searched recursively), a glob pattern,
+    a single file, or an iterable of any of those.
+    """
+    if not isinstance(source, (str, Path)):
+        files: list[Path] = []
+        for item in source:
+            files.extend(find_midi_files(item))
+        return sorted(set(files))
+
+    path = Path(source)
+    if path.is_dir():
+        return sorted(
+            p for p in path.rglob("*") if p.is_file() and p.suffix.lower() in MIDI_SUFFIXES
+        )
+    if path.is_file():
+        return [path]
+    return sorted(Path(p) for p in glob.glob(str(source), recursive=True) if os.path.isfile(p))
+
+
+def _resolve_channel(
+    midi_path: Path,
+    channel_map: dict[str, dict[str, list[int]]],
+    default_channel: int,
+) -> int:
+    """Pick the first melody channel from the channel map, else the default."""
+    melody = resolve_channel_roles(channel_map, str(midi_path)).get("melody")
+    return melody[0] if melody else default_channel
+
+
+def _parse_job(
+    job: tuple[str, int, Optional[str], bool, PitchSpace, str],
+) -> tuple[Optional[np.ndarray], Optional[str]]:
+    """
+    Worker entry point: parse one file, returning (matrix or counts, error).
+    Results over a sparse pitch space are shipped back as CSR arrays.
+    """
+    midi_path, channel, cache_dir, raw_counts, pitch_space, reader = job
+    try:
+        if not 0 <= channel <= 15:
+            raise ValueError(f"channel {channel} is outside 0-15")
+        if cache_dir is not None:
+            cache = _WORKER_CACHES.get((cache_dir, reader))
+            if cache is None:
+                cache = _WORKER_CACHES[cache_dir, reader] = ParseCache(cache_dir, reader=reader)
+            if raw_counts:
+                result = cache.transition_counts(midi_path, channel, pitch_space=pitch_space)
+            else:
+                result = cache.transition_matrix(midi_path, channel, pitch_space=pitch_space)
+        else:
+            events = read_event_table(midi_path, reader).events
+            if raw_counts:
+                result = compact_counts(channel_transition_counts(events, channel, pitch_space))
+            else:
+                result = channel_transition_matrix(events, channel, pitch_space=pitch_space)
+        if pitch_space.sparse:
+            result = compact_counts(sp.csr_array(result)) if raw_counts else sp.csr_array(result)
+        return result, None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _iter_corpus(
+    source,
+    channel_map,
+    default_channel: int,
+    workers: Optional[int],
+    chunksize: int,
+    progress: Optional[Callable[[int, int], None]],
+    cache_dir,
+    raw_counts: bool,
+    pitch_space: PitchSpace,
+    reader: str,
+) -> Iterator[tuple[str, int, Optional[np.ndarray], Optional[str]]]:
+    """Yield (path, channel, result, error) per file, in sorted file order."""
+    files = find_midi_files(source)
+    if isinstance(channel_map, (str, Path)):
+        channel_map = load_channel_map(channel_map)
+    channel_map = channel_map or {}
+
+    cache_root = None if cache_dir is None else str(cache_dir)
+    jobs = [
+        (str(p), _resolve_channel(p, channel_map, default_channel), cache_root, raw_counts,
+         pitch_space, reader)
+        for p in files
+    ]
+    total = len(jobs)
+
+    if workers == 1 or total <= 1:
+        results = map(_parse_job, jobs)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(_parse_job, jobs, chunksize=max(1, chunksize))
+
+    try:
+        for done, ((path, channel, *_), (result, error)) in enumerate(zip(jobs, results), start=1):
+            yield path, channel, result, error
+            if progress is not None:
+                progress(done, total)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def parse_corpus(
+    source: str | Path | Iterable[str | Path],
+    channel_map: str | Path | dict[str, dict[str, list[int]]] | None = None,
+    default_channel: int = 0,
+    workers: Optional[int] = None,
+    chunksize: int = 8,
+    progress: Optional[Callable[[int, int], None]] = None,
+    cache_dir: str | Path | None = None,
+    raw_counts: bool = False,
+    pitch_space: PitchSpace = DEFAULT_PITCH_SPACE,
+    reader: str = "mido",
+) -> tuple[np.ndarray | sp.csr_array, list[dict]]:
+    """
+    Parse every MIDI file of a corpus into a stacked transition tensor.
+
+    Files are parsed in a process pool. Failures do not abort the run; they
+    are recorded in the manifest instead.
+
+    Parameters
+    ----------
+    source : str | Path | iterable
+        Directory, glob pattern, file, or iterable of those.
+    channel_map : str | Path | dict | None
+        Channel map CSV (e.g. `raw_midi/mono_channels.csv`) or an already
+        loaded mapping. The first melody channel of a file is parsed.
+    default_channel : int
+        Channel used for files missing from the channel map.
+    workers : int | None
+        Number of worker processes. None uses all cores; 1 parses in-process.
+    chunksize : int
+        Files handed to a worker at a time.
+    progress : callable | None
+        Called as progress(done, total) after every finished file.
+    cache_dir : str | Path | None
+        Directory of a `ParseCache` shared by all workers. Unchanged files
+        are then served from disk instead of being re-parsed.
+    raw_counts : bool
+        Stack raw integer counts (compact dtype) instead of normalized
+        matrices; wrap in `TransitionCounts` to merge or normalize later.
+    pitch_space : PitchSpace
+        Notes that become matrix nodes (defaults to C2-B5).
+    reader : str
+        MIDI decoder: "mido", or "smf" for the byte-level fast path that
+        skips building mido message objects.
+
+    Returns
+    -------
+    tuple[np.ndarray | scipy.sparse.csr_array, list[dict]]
+        An (n_ok, n, n) array of transition matrices - or, over a sparse
+        pitch space, an (n_ok, n * n) CSR array with one flattened matrix
+        per row - and one manifest record per input file with keys `path`,
+        `channel`, `row` (index into the array, or None on failure) and
+        `error` (None on success).
+    """
+    matrices: list[np.ndarray] = []
+    manifest: list[dict] = []
+    for path, channel, matrix, error in _iter_corpus(
+        source, channel_map, default_channel, workers, chunksize, progress, cache_dir, raw_counts,
+        pitch_space, reader,
+    ):
+        row = None
+        if matrix is not None:
+            row = len(matrices)
+            matrices.append(matrix)
+        manifest.append({"path": path, "channel": channel, "row": row, "error": error})
+
+    n = pitch_space.num_notes
+    dtype = np.uint8 if raw_counts else float
+    if pitch_space.sparse:
+        if matrices:
+            stacked = sp.vstack([m.reshape(1, n * n) for m in matrices], format="csr")
+        else:
+            stacked = sp.csr_array((0, n * n), dtype=dtype)
+    elif matrices:
+        stacked = np.stack(matrices)
+    else:
+        stacked = np.zeros((0, n, n), dtype=dtype)
+    if raw_counts:
+        stacked = compact_counts(stacked)
+    return stacked, manifest
+
+
+def corpus_counts(
+    source: str | Path | Iterable[str | Path],
+    channel_map: str | Path | dict[str, dict[str, list[int]]] | None = None,
+    default_channel: int = 0,
+    workers: Optional[int] = None,
+    chunksize: int = 8,
+    progress: Optional[Callable[[int, int], None]] = None,
+    cache_dir: str | Path | None = None,
+    pitch_space: PitchSpace = DEFAULT_PITCH_SPACE,
+    reader: str = "mido",
+) -> tuple[TransitionCounts, list[dict]]:
+    """
+    Map-reduce a corpus into one corpus-level `TransitionCounts`.
+
+    Per-file counts are computed in parallel (see `parse_corpus` for the
+    parameters) and summed as they arrive, so no per-file stack is kept.
+    Manifest records have `row` set to None; `error` marks failed files.
+    """
+    n = pitch_space.num_notes
+    total = TransitionCounts(np.zeros((n, n), dtype=np.uint64), pitch_space)
+    manifest: list[dict] = []
+    for path, channel, counts, error in _iter_corpus(
+        source, channel_map, default_channel, workers, chunksize, progress, cache_dir, True,
+        pitch_space, reader,
+    ):
+        if counts is not None:
+            total = total + TransitionCounts(counts, pitch_space)
+        manifest.append({"path": path, "channel": channel, "row": None, "error": error})
+    return total, manifest
@@ -0,0 +1,188 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable, Optional
+
+import mido
+import numpy as np
+
+from tonnetz.midi.tempo import TempoMap
+
+
+NOTE_OFF = 0
+NOTE_ON = 1
+
+# One row per note_on/note_off message, in merged playback order.
+EVENT_DTYPE = np.dtype(
+    [
+        ("time_sec", np.float64),  # seconds since start, tempo-map aware
+        ("tick", np.int64),        # absolute tick since start
+        ("channel", np.uint8),     # MIDI channel (0-15)
+        ("track", np.uint16),      # index of the source track in the file
+        ("note", np.uint8),        # MIDI note number (0-127)
+        ("velocity", np.uint8),    # raw message velocity (0-127)
+        ("kind", np.int8),         # NOTE_ON or NOTE_OFF
+    ]
+)
+
+# One row per set_tempo meta message, in merged playback order.
+TEMPO_DTYPE = np.dtype(
+    [
+        ("tick", np.int64),
+        ("tempo", np.int64),  # microseconds per beat
+    ]
+)
+
+
+@dataclass(frozen=True, eq=False)
+class EventTable:
+    events: np.ndarray    # EVENT_DTYPE rows
+    tempos: np.ndarray    # TEMPO_DTYPE rows
+    ticks_per_beat: int
+
+    @cached_property
+    def tempo_map(self) -> TempoMap:
+        """Tick <-> second conversion of the file, built on first access."""
+        return TempoMap.from_tempos(self.tempos, self.ticks_per_beat)
+
+
+READERS = ("mido", "smf")
+
+
+def read_event_table(midi_file: str, reader: str = "mido") -> EventTable:
+    """
+    Decode every note and tempo message of a MIDI file into columnar arrays.
+
+    Tracks are walked once each without building a merged track; the rows are
+    then put into the same order as `mido.merge_tracks` (stable by absolute
+    tick, ties broken by track order), so results match `for msg in mid`.
+
+    Parameters
+    ----------
+    midi_file : str
+        Path to the MIDI file.
+    reader : str
+        "mido" parses with mido.MidiFile; "smf" uses the byte-level reader of
+        `tonnetz.midi.smf`, which skips building message objects and gives
+        the same table for well-formed files.
+
+    Returns
+    -------
+    EventTable
+        Note events (EVENT_DTYPE), tempo changes (TEMPO_DTYPE) and the
+        file's ticks_per_beat.
+    """
+    if reader == "smf":
+        from tonnetz.midi.smf import read_smf_event_table
+
+        return read_smf_event_table(midi_file)
+    if reader != "mido":
+        raise ValueError(f"unknown MIDI reader {reader!r}, expected one of {READERS}")
+
+    mid = mido.MidiFile(midi_file)
+
+    # Note and tempo rows share these columns; tempo rows carry the tempo
+    # in `value` and kind -1 so they can be split after sorting.
+    ticks: list[int] = []
+    tracks: list[int] = []
+    channels: list[int] = []
+    notes: list[int] = []
+    values: list[int] = []
+    kinds: list[int] = []
+
+    for track_i, track in enumerate(mid.tracks):
+        abs_tick = 0
+        for msg in track:
+            abs_tick += msg.time
+            msg_type = msg.type
+            if msg_type == "note_on":
+                ticks.append(abs_tick)
+                tracks.append(track_i)
+                channels.append(msg.channel)
+                notes.append(msg.note)
+                values.append(msg.velocity)
+                kinds.append(NOTE_ON if msg.velocity > 0 else NOTE_OFF)
+            elif msg_type == "note_off":
+                ticks.append(abs_tick)
+                tracks.append(track_i)
+                channels.append(msg.channel)
+                notes.append(msg.note)
+                values.append(msg.velocity)
+                kinds.append(NOTE_OFF)
+            elif msg_type == "set_tempo":
+                ticks.append(abs_tick)
+                tracks.append(track_i)
+                channels.append(0)
+                notes.append(0)
+                values.append(msg.tempo)
+                kinds.append(-1)
+
+    return build_event_table(ticks, tracks, channels, notes, values, kinds, mid.ticks_per_beat)
+
+
+def build_event_table(ticks, tracks, channels, notes, values, kinds, ticks_per_beat: int) -> EventTable:
+    """
+    Assemble an EventTable from per-track message columns (rows of each track
+    in file order, tracks one after another). Tempo rows have kind -1 and
+    carry the tempo in `values`; note rows carry the velocity.
+    """
+    tick_arr = np.asarray(ticks, dtype=np.int64)
+    order = np.argsort(tick_arr, kind="stable")
+    tick_arr = tick_arr[order]
+    kind_arr = np.asarray(kinds, dtype=np.int8)[order]
+    value_arr = np.asarray(values, dtype=np.int64)[order]
+
+    is_tempo = kind_arr < 0
+    is_note = ~is_tempo
+
+    tempos = np.empty(int(is_tempo.sum()), dtype=TEMPO_DTYPE)
+    tempos["tick"] = tick_arr[is_tempo]
+    tempos["tempo"] = value_arr[is_tempo]
+    tempo_map = TempoMap.from_tempos(tempos, ticks_per_beat)
+
+    events = np.empty(int(is_note.sum()), dtype=EVENT_DTYPE)
+    events["time_sec"] = tempo_map.to_seconds(tick_arr[is_note])
+    events["tick"] = tick_arr[is_note]
+    events["channel"] = np.asarray(channels, dtype=np.uint8)[order][is_note]
+    events["track"] = np.asarray(tracks, dtype=np.uint16)[order][is_note]
+    events["note"] = np.asarray(notes, dtype=np.uint8)[order][is_note]
+    events["velocity"] = value_arr[is_note]
+    events["kind"] = kind_arr[is_note]
+
+    return EventTable(events=events, tempos=tempos, ticks_per_beat=ticks_per_beat)
+
+
+def read_events(midi_file: str) -> np.ndarray:
+    """Return only the note-event array (EVENT_DTYPE) of a MIDI file."""
+    return read_event_table(midi_file).events
+
+
+def select_events(
+    events: np.ndarray,
+    channels: Optional[Iterable[int]] = None,
+    tracks: Optional[Iterable[int]] = None,
+    note_range: Optional[tuple[int, int]] = None,
+) -> np.ndarray:
+    """
+    Filter an event array while keeping playback order.
+
+    Parameters
+    ----------
+    events : np.ndarray
+        Event array (EVENT_DTYPE).
+    channels : iterable of int | None
+        Keep only these MIDI channels. None keeps all channels.
+    tracks : iterable of int | None
+        Keep only these track indices. None keeps all tracks.
+    note_range : tuple[int, int] | None
+        Inclusive (min_note, max_note) window. None keeps all notes.
+    """
+    mask = np.ones(events.shape[0], dtype=bool)
+    if channels is not None:
+        mask &= np.isin(events["channel"], np.fromiter(channels, dtype=np.int64))
+    if tracks is not None:
+        mask &= np.isin(events["track"], np.fromiter(tracks, dtype=np.int64))
+    if note_range is not None:
+        lo, hi = note_range
+        mask &= (events["note"] >= lo) & (events["note"] <= hi)
+    return events[mask]
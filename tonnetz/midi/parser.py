@@ -1,10 +1,34 @@
-import mido
+from dataclasses import dataclass
+from typing import Optional
+
 import numpy as np
+import scipy.sparse as sp
+
+from tonnetz.midi.events import NOTE_ON, read_event_table, select_events
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE, PitchSpace
+
+
+NUM_CHANNELS = 16
+
 
+@dataclass(frozen=True, eq=False)
+class ChannelTransitions:
+    counts: np.ndarray     # (16, n, n) raw transition counts per channel
+    matrices: np.ndarray   # (16, n, n) normalized matrices, as gen_transition_poly
+    combined: np.ndarray   # (n, n) normalized matrix of all channels' counts summed
+    events: list[np.ndarray]  # per-channel event arrays (full note range)
 
-def gen_transition_poly(midi_file: str, target_channel=1) -> np.ndarray:
+
+def gen_transition_poly(
+    midi_file: str,
+    target_channel=1,
+    cache=None,
+    pitch_space: PitchSpace = DEFAULT_PITCH_SPACE,
+    reader: str = "mido",
+) -> np.ndarray:
     """
-    Generates a 48x48 Markov transition matrix tracking note transitions from C2 to B5.
+    Generates a 48x48 Markov transition matrix tracking note transitions from C2 to B5
+    (or over any other `pitch_space`).
     Counts transitions between chords by considering transition between all previous notes to all current notes.
 
     Parameters
@@ -13,133 +37,589 @@ def gen_transition_poly(midi_file: str, target_channel=1) -> np.ndarray:
         Path to the MIDI file.
     target_channel : int
         The MIDI channel number to parse (defaults to 1).
+    cache : tonnetz.midi.cache.ParseCache | None
+        Optional on-disk cache; unchanged files are served without re-parsing.
+    pitch_space : PitchSpace
+        Notes that become matrix nodes (defaults to C2-B5).
+    reader : str
+        MIDI decoder when not served from `cache`: "mido" or the byte-level
+        "smf" fast path (see `read_event_table`).
 
     Returns
     -------
-        np.ndarray: A 48x48 Markov transition matrix.
+        np.ndarray: A dense num_notes x num_notes Markov transition matrix.
     """
 
-    # Initializing the matrix
-    num_notes = 48
-    min_note = 36  # MIDI note number for C2
-    max_note = min_note + num_notes - 1  # MIDI for B5
-
-    transition_matrix = np.zeros((num_notes, num_notes), dtype=int)
+    # Ensure the channel number is valid
+    if target_channel < 0 or target_channel > 15:
+        print("Error: Target channel must be between 0 and 15.")
+        return None
 
     try:
-        mid = mido.MidiFile(midi_file)
+        if cache is not None:
+            return cache.transition_matrix(midi_file, target_channel, pitch_space=pitch_space)
+        table = read_event_table(midi_file, reader)
     except Exception as e:
         print(f"Error loading MIDI file: {e}")
         return None
 
-    # Ensure the channel number is valid
-    if target_channel < 0 or target_channel > 15:
-        print("Error: Target channel must be between 0 and 15.")
-        return None
+    return channel_transition_matrix(table.events, target_channel, pitch_space=pitch_space)
+
+
+def channel_transition_matrix(
+    events: np.ndarray,
+    target_channel: int,
+    threshold: float = 0.01,
+    pitch_space: PitchSpace = DEFAULT_PITCH_SPACE,
+) -> np.ndarray:
+    """
+    Builds the normalized transition matrix of one channel from a
+    whole-file event array (see `gen_transition_poly`).
+    """
+    counts = channel_transition_counts(events, target_channel, pitch_space)
+    return normalize_transition_counts(counts, threshold)
+
+
+def channel_transition_counts(
+    events: np.ndarray, target_channel: int, pitch_space: PitchSpace = DEFAULT_PITCH_SPACE
+) -> np.ndarray:
+    """Raw transition counts of one channel of a whole-file event array."""
+    # Keep only the target channel and the notes of the pitch space (C2-B5 by default)
+    events = select_events(events, channels=[target_channel], note_range=pitch_space.note_range)
+    return transition_counts_from_events(events, pitch_space)
+
+
+class TransitionAccumulator:
+    """
+    Incrementally counts chord-aware note transitions, one message at a time.
+
+    Uses the same rules as `gen_transition_poly`: every note_on adds a
+    transition from all currently active notes to the new note and back
+    (they form a chord), plus one from each note of the previous chord. The
+    previous chord is the set of active notes at the first release. Each
+    update costs O(active notes), and `snapshot()` derives the normalized
+    matrix from the running counts without revisiting past events.
+
+    Parameters
+    ----------
+    pitch_space : PitchSpace
+        Notes that become matrix nodes (defaults to C2-B5); others are ignored.
+    target_channel : int | None
+        If set, `feed` ignores messages from other channels.
+    """
+
+    def __init__(self, pitch_space: PitchSpace = DEFAULT_PITCH_SPACE, target_channel=None):
+        self.pitch_space = pitch_space
+        self.min_note = pitch_space.min_note
+        self.num_notes = pitch_space.num_notes
+        self.target_channel = target_channel
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all counts and note state."""
+        self._counts = np.zeros((self.num_notes, self.num_notes), dtype=int)
+        # Track currently active notes as a set of indices
+        self.active_notes: set[int] = set()
+        # Track the previous chord/notes for sequential transitions
+        self.prev_chord: set[int] = set()
+        self.num_events = 0
+        self._snapshots: dict[float, np.ndarray] = {}
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Read-only view of the raw transition counts."""
+        view = self._counts.view()
+        view.flags.writeable = False
+        return view
+
+    def note_on(self, note: int) -> None:
+        """Register a note_on (velocity > 0) for MIDI note number `note`."""
+        note_idx = note - self.min_note
+        if not 0 <= note_idx < self.num_notes:
+            return
+
+        counts = self._counts
+        # Count transitions from all currently active notes to this new note, and reverse, since its a chord
+        for prev_note_idx in self.active_notes:
+            counts[prev_note_idx, note_idx] += 1
+            counts[note_idx, prev_note_idx] += 1
+        # Count transition from previous chord to this new note
+        for prev_note_idx in self.prev_chord:
+            counts[prev_note_idx, note_idx] += 1
 
-    # Track currently active notes as a set of indices
-    active_notes = set()
-    # Track the previous chord/notes for sequential transitions
-    prev_chord = set()
-
-    for msg in mid:
-        # Check if message is in the target channel
-        if hasattr(msg, "channel") and msg.channel == target_channel:
-            if msg.type == "note_on" and msg.velocity > 0:
-                # Note being played
-                current_note = msg.note
-
-                # Check if the note falls within our 48-note C2-B5 window
-                if min_note <= current_note <= max_note:
-                    current_note_idx = current_note - min_note
-
-                    # Count transitions from all currently active notes to this new note, and reverse, since its a chord
-                    if active_notes:
-                        for prev_note_idx in active_notes:
-                            transition_matrix[prev_note_idx, current_note_idx] += 1
-                            transition_matrix[current_note_idx, prev_note_idx] += 1
-                    # Count transition from previous chord to this new note
-                    if prev_chord:
-                        for prev_note_idx in prev_chord:
-                            transition_matrix[prev_note_idx, current_note_idx] += 1
-
-                    # Add this note to the active set
-                    active_notes.add(current_note_idx)
-
-            elif msg.type == "note_off" or (
-                msg.type == "note_on" and msg.velocity == 0
-            ):
-                # Note being released
-                released_note = msg.note
-
-                # Check if the note falls within our 48-note C2-B5 window
-                if min_note <= released_note <= max_note:
-                    released_note_idx = released_note - min_note
-
-                    # If prev chord is empty, save the current active notes as the prev chord before any releases
-                    if len(prev_chord) == 0 and len(active_notes) > 0:
-                        prev_chord = active_notes.copy()
-
-                    # Remove this note from the active set
-                    active_notes.discard(released_note_idx)
+        # Add this note to the active set
+        self.active_notes.add(note_idx)
+        self.num_events += 1
+        self._snapshots.clear()
+
+    def note_off(self, note: int) -> None:
+        """Register a note_off (or note_on with velocity 0) for `note`."""
+        note_idx = note - self.min_note
+        if not 0 <= note_idx < self.num_notes:
+            return
+
+        # If prev chord is empty, save the current active notes as the prev chord before any releases
+        if not self.prev_chord and self.active_notes:
+            self.prev_chord = self.active_notes.copy()
+
+        # Remove this note from the active set
+        self.active_notes.discard(note_idx)
+        self.num_events += 1
+
+    def feed(self, msg) -> bool:
+        """
+        Consume one mido message. Returns True if it changed the note state;
+        non-note messages and other channels are ignored.
+        """
+        msg_type = msg.type
+        if msg_type != "note_on" and msg_type != "note_off":
+            return False
+        if self.target_channel is not None and msg.channel != self.target_channel:
+            return False
+        if msg_type == "note_on" and msg.velocity > 0:
+            self.note_on(msg.note)
+        else:
+            self.note_off(msg.note)
+        return True
+
+    def feed_events(self, events: np.ndarray) -> None:
+        """Consume an event array (EVENT_DTYPE) in order, ignoring channels."""
+        for note, kind in zip(events["note"].tolist(), events["kind"].tolist()):
+            if kind == NOTE_ON:
+                self.note_on(note)
+            else:
+                self.note_off(note)
+
+    def to_counts(self) -> "TransitionCounts":
+        """Copy of the running counts as a mergeable TransitionCounts."""
+        return TransitionCounts(self._counts.copy(), self.pitch_space)
+
+    def snapshot(self, threshold: float = 0.01) -> np.ndarray:
+        """
+        Normalized, thresholded matrix of the counts so far (the same
+        post-processing as `gen_transition_poly`). Cached until the next
+        note_on changes the counts.
+        """
+        matrix = self._snapshots.get(threshold)
+        if matrix is None:
+            matrix = normalize_transition_counts(self._counts, threshold)
+            matrix.flags.writeable = False
+            self._snapshots[threshold] = matrix
+        return matrix
+
+
+# Events per block when forward-filling note state; bounds the (block, n) scratch arrays.
+_STATE_BLOCK = 4096
+
+
+@dataclass(frozen=True, eq=False)
+class NoteOnsets:
+    """
+    Every note_on of an event stream with the note state it sees, computed
+    without a per-event Python loop (see `note_onsets`).
+    """
+
+    positions: np.ndarray   # (k,) row of each note_on in the source event array
+    notes: np.ndarray       # (k,) node index of each note_on
+    active: np.ndarray      # (k, n) bool, notes sounding just before each note_on
+    prev_chord: np.ndarray  # (n,) bool, chord saved at the first release
+    prev_from: int          # note_ons from this one on also get prev_chord transitions
+
+    def counts(self, groups: Optional[np.ndarray] = None, num_groups: int = 0) -> np.ndarray:
+        """
+        Transition counts of all note_ons, or per group when `groups` gives
+        each note_on's group id in [0, num_groups) (returns (num_groups, n, n)).
+        """
+        n = self.prev_chord.size
+        if groups is None:
+            groups = np.zeros(self.notes.size, dtype=np.int64)
+            num_groups = 1
+            shape = (n, n)
+        else:
+            shape = (num_groups, n, n)
+
+        # to_chord[g, x, a]: onsets of x in group g while a was sounding,
+        # counted with one bincount over the (onset, sounding note) pairs
+        onset, sounding = np.nonzero(self.active)
+        cell = (groups[onset] * n + self.notes[onset]) * n + sounding
+        to_chord = np.bincount(cell, minlength=num_groups * n * n).reshape(shape)
+
+        later = slice(self.prev_from, None)
+        onset_hist = np.bincount(
+            groups[later] * n + self.notes[later], minlength=num_groups * n
+        ).reshape(shape[:-1])
+
+        # Chord transitions go both ways; the previous chord feeds every later onset
+        counts = to_chord + np.swapaxes(to_chord, -1, -2)
+        counts += self.prev_chord[:, None] * onset_hist[..., None, :]
+        return counts
+
+
+def note_onsets(events: np.ndarray, pitch_space: PitchSpace = DEFAULT_PITCH_SPACE) -> NoteOnsets:
+    """
+    Vectorized form of the `TransitionAccumulator` state machine.
+
+    A note is sounding before event i iff its latest event before i is a
+    note_on, so the state is a forward fill of the last event per note
+    (done in blocks with np.maximum.accumulate). The previous chord is the
+    state at the first release that finds notes sounding. Events outside
+    the pitch space are ignored.
+    """
+    n = pitch_space.num_notes
+    note_idx, inside = pitch_space.indices(events["note"])
+    rows = np.flatnonzero(inside)
+    note_idx = note_idx[rows]
+    is_on = events["kind"][rows] == NOTE_ON
+
+    active_blocks: list[np.ndarray] = []
+    state = np.zeros(n, dtype=bool)
+    prev_chord = np.zeros(n, dtype=bool)
+    prev_from = None
+    ons_seen = 0
+    for start in range(0, rows.size, _STATE_BLOCK):
+        x = note_idx[start:start + _STATE_BLOCK]
+        on = is_on[start:start + _STATE_BLOCK]
+        block = np.arange(x.size)
+
+        # Row of the latest event per note up to each row, -1 if none yet
+        last = np.full((x.size, n), -1, dtype=np.int32)
+        last[block, x] = block
+        np.maximum.accumulate(last, axis=0, out=last)
+        after = np.where(last >= 0, on[np.maximum(last, 0)], state)
+        before = np.concatenate((state[None, :], after[:-1]))
+
+        active_blocks.append(before[on])
+        if prev_from is None:
+            releases = np.flatnonzero(~on & before.any(axis=1))
+            if releases.size:
+                first = releases[0]
+                prev_chord = before[first].copy()
+                prev_from = ons_seen + int(on[:first].sum())
+        ons_seen += int(on.sum())
+        state = after[-1]
+
+    return NoteOnsets(
+        positions=rows[is_on],
+        notes=note_idx[is_on],
+        active=np.concatenate(active_blocks) if active_blocks else np.zeros((0, n), dtype=bool),
+        prev_chord=prev_chord,
+        prev_from=ons_seen if prev_from is None else prev_from,
+    )
+
+
+def transition_counts_from_events(
+    events: np.ndarray, pitch_space: PitchSpace = DEFAULT_PITCH_SPACE
+) -> np.ndarray:
+    """
+    Counts chord-aware note transitions over an event array
+    (see `TransitionAccumulator` for the counting rules).
+    Events outside the pitch space are ignored. Computed in batch with
+    `note_onsets`; the result equals feeding the events to an accumulator.
+
+    Parameters
+    ----------
+    events : np.ndarray
+        Event array (EVENT_DTYPE) in playback order, usually a single channel.
+    pitch_space : PitchSpace
+        Notes that become matrix nodes.
+
+    Returns
+    -------
+        np.ndarray: A num_notes x num_notes matrix of integer transition counts.
+    """
+    return note_onsets(events, pitch_space).counts()
+
+
+def normalize_transition_counts(transition_matrix, threshold: float = 0.01):
+    """
+    Row-normalizes transition counts into probabilities and zeroes out
+    entries below `threshold`. Works on a single matrix or a stack; a
+    scipy.sparse matrix stays sparse (CSR).
+    """
+    if sp.issparse(transition_matrix):
+        return _normalize_sparse_counts(transition_matrix, threshold)
 
     # Normalize the transition counts to probabilities
-    row_sums = transition_matrix.sum(axis=1, keepdims=True)
+    row_sums = transition_matrix.sum(axis=-1, keepdims=True)
 
     # Avoid division by zero; if a row sum is zero, keep it as zero
     transition_matrix = transition_matrix.astype(float)
     np.divide(transition_matrix, row_sums, out=transition_matrix, where=row_sums != 0)
 
     # Threshold values below 0.01 to zero for cleaner visualization
-    threshold = 0.01
     transition_matrix[transition_matrix < threshold] = 0
 
     return transition_matrix
 
-def extract_timed_events(midi_file: str, target_channel: int = 1, bpm: float = 120.0) -> list[dict]:
+
+def _normalize_sparse_counts(counts, threshold: float) -> sp.csr_array:
+    matrix = sp.csr_array(counts, dtype=float, copy=True)
+    matrix.eliminate_zeros()
+    # Every stored entry is positive, so rows owning entries have non-zero sums
+    row_sums = np.asarray(matrix.sum(axis=1)).ravel()
+    matrix.data /= np.repeat(row_sums, np.diff(matrix.indptr))
+    matrix.data[matrix.data < threshold] = 0
+    matrix.eliminate_zeros()
+    return matrix
+
+
+def compact_counts(counts):
     """
-    Returns a flat list of {time_sec, note_idx, event_type} dicts,
-    sorted by absolute time in seconds, with CORRECT tempo conversion.
+    Return integer counts in the smallest unsigned dtype that holds them.
+    scipy.sparse counts are returned as CSR with compacted data.
+    """
+    if sp.issparse(counts):
+        counts = sp.csr_array(counts)
+        counts.data = compact_counts(counts.data)
+        return counts
+    counts = np.asarray(counts)
+    if counts.size and counts.min() < 0:
+        raise ValueError("transition counts must be non-negative")
+    max_count = int(counts.max()) if counts.size else 0
+    return counts.astype(np.min_scalar_type(max_count), copy=False)
+
+
+class TransitionCounts:
+    """
+    Raw integer transition counts with lazily derived probability views.
+
+    Counts from different files, channels or shards can be combined with `+`
+    or `sum()` before normalizing, which normalized matrices cannot do. The
+    normalized and thresholded views are computed on first access and cached;
+    all exposed arrays are read-only so the caches stay valid.
+
+    Over a sparse pitch space (see `PitchSpace.sparse`, e.g. the full MIDI
+    range) a single matrix is stored as a scipy.sparse CSR array, and so are
+    its normalized and thresholded views; `toarray()` gives dense counts.
+
+    Parameters
+    ----------
+    counts : np.ndarray | scipy.sparse matrix
+        Square (or stacked square) non-negative integer count matrix.
+    pitch_space : PitchSpace
+        Notes the matrix nodes stand for (defaults to C2-B5).
     """
-    mid = mido.MidiFile(midi_file)
-    ticks_per_beat = mid.ticks_per_beat
-    current_tempo = 500_000  # 120 BPM default in microseconds
 
-    min_note, num_notes = 36, 48
-    events = []
-    abs_time_sec = 0.0
+    def __init__(self, counts, pitch_space: PitchSpace = DEFAULT_PITCH_SPACE):
+        if not sp.issparse(counts):
+            counts = np.asarray(counts)
+        if counts.ndim < 2 or counts.shape[-1] != counts.shape[-2]:
+            raise ValueError(f"counts must be square, got shape {counts.shape}")
+        if counts.shape[-1] != pitch_space.num_notes:
+            raise ValueError(
+                f"counts of shape {counts.shape} do not match a pitch space of "
+                f"{pitch_space.num_notes} notes"
+            )
+        if pitch_space.sparse and counts.ndim == 2:
+            # Private CSR copy, so freezing it never touches the caller's arrays
+            counts = sp.csr_array(counts, copy=True)
+            counts.eliminate_zeros()
+            counts = compact_counts(counts)
+        else:
+            if sp.issparse(counts):
+                counts = counts.toarray()
+            compact = compact_counts(counts)
+            if compact is counts:
+                # Never freeze the caller's array
+                compact = compact.copy()
+            counts = compact
+        _frozen(counts)
+        self.counts = counts
+        self.pitch_space = pitch_space
+        self._normalized = None
+        self._thresholded: dict[float, np.ndarray] = {}
+
+    @property
+    def min_note(self) -> int:
+        return self.pitch_space.min_note
+
+    @property
+    def num_notes(self) -> int:
+        return self.counts.shape[-1]
+
+    @property
+    def is_sparse(self) -> bool:
+        return sp.issparse(self.counts)
+
+    @property
+    def total(self) -> int:
+        """Total number of counted transitions."""
+        data = self.counts.data if self.is_sparse else self.counts
+        return int(data.sum(dtype=np.uint64))
+
+    @property
+    def normalized(self):
+        """Row-normalized transition probabilities (no threshold)."""
+        if self._normalized is None:
+            self._normalized = _frozen(normalize_transition_counts(self.counts, threshold=0.0))
+        return self._normalized
 
-    # First pass: collect all messages with proper absolute timing
-    for msg in mido.merge_tracks(mid.tracks):
-        # Convert delta ticks to seconds using current tempo
-        if msg.time:
-            abs_time_sec += mido.tick2second(msg.time, ticks_per_beat, current_tempo)
+    def thresholded(self, threshold: float = 0.01):
+        """Normalized probabilities with entries below `threshold` zeroed."""
+        matrix = self._thresholded.get(threshold)
+        if matrix is None:
+            matrix = _frozen(normalize_transition_counts(self.counts, threshold))
+            self._thresholded[threshold] = matrix
+        return matrix
 
-        # Track tempo changes
-        if msg.type == "set_tempo":
-            current_tempo = msg.tempo
-            continue
+    @property
+    def matrix(self):
+        """The default view, identical to `gen_transition_poly` output."""
+        return self.thresholded(0.01)
 
-        # Filter by channel
-        if not (hasattr(msg, "channel") and msg.channel == target_channel):
-            continue
+    def toarray(self) -> np.ndarray:
+        """Dense copy of the counts."""
+        return self.counts.toarray() if self.is_sparse else self.counts.copy()
 
-        note = getattr(msg, "note", None)
-        if note is None or not (min_note <= note < min_note + num_notes):
-            continue
+    def sum(self) -> "TransitionCounts":
+        """Collapse a stack of counts (leading axes) into a single matrix."""
+        if self.counts.ndim == 2:
+            return self
+        n = self.num_notes
+        total = self.counts.reshape(-1, n, n).sum(axis=0, dtype=np.uint64)
+        return TransitionCounts(total, self.pitch_space)
 
-        note_idx = note - min_note
-        vel = getattr(msg, "velocity", 64)
+    def __add__(self, other) -> "TransitionCounts":
+        if isinstance(other, int) and other == 0:
+            return self
+        if not isinstance(other, TransitionCounts):
+            return NotImplemented
+        if other.pitch_space != self.pitch_space or other.counts.shape != self.counts.shape:
+            raise ValueError("cannot add transition counts over different pitch ranges")
+        if self.is_sparse:
+            total = self.counts.astype(np.uint64) + other.counts.astype(np.uint64)
+        else:
+            total = self.counts.astype(np.uint64) + other.counts
+        return TransitionCounts(total, self.pitch_space)
 
-        if msg.type == "note_on" and vel > 0:
-            events.append({"time": abs_time_sec, "note": note_idx, "note_num": note, "type": "on", "velocity": vel})
-        elif msg.type == "note_off" or (msg.type == "note_on" and vel == 0):
-            events.append({"time": abs_time_sec, "note": note_idx, "note_num": note, "type": "off", "velocity": vel})
+    # Lets the builtin sum() start from 0
+    __radd__ = __add__
+
+    def __repr__(self) -> str:
+        storage = f", nnz={self.counts.nnz}" if self.is_sparse else ""
+        return (
+            f"TransitionCounts(shape={self.counts.shape}, dtype={self.counts.dtype}, "
+            f"total={self.total}{storage})"
+        )
+
+
+def _frozen(matrix):
+    """Mark a dense or sparse matrix read-only (sparse: its data array)."""
+    (matrix.data if sp.issparse(matrix) else matrix).flags.writeable = False
+    return matrix
+
+
+def gen_transition_counts(
+    midi_file: str,
+    target_channel=1,
+    cache=None,
+    pitch_space: PitchSpace = DEFAULT_PITCH_SPACE,
+    reader: str = "mido",
+) -> TransitionCounts:
+    """
+    Like `gen_transition_poly`, but returns mergeable raw counts
+    (`TransitionCounts`) instead of a normalized matrix.
+    `gen_transition_counts(f, ch).matrix` equals `gen_transition_poly(f, ch)`.
+    """
+    # Ensure the channel number is valid
+    if target_channel < 0 or target_channel > 15:
+        print("Error: Target channel must be between 0 and 15.")
+        return None
+
+    try:
+        if cache is not None:
+            counts = cache.transition_counts(midi_file, target_channel, pitch_space=pitch_space)
+            return TransitionCounts(counts, pitch_space)
+        table = read_event_table(midi_file, reader)
+    except Exception as e:
+        print(f"Error loading MIDI file: {e}")
+        return None
+
+    counts = channel_transition_counts(table.events, target_channel, pitch_space)
+    return TransitionCounts(counts, pitch_space)
+
+
+def gen_transition_all_channels(
+    midi_file: str, cache=None, pitch_space: PitchSpace = DEFAULT_PITCH_SPACE
+) -> ChannelTransitions:
+    """
+    Builds the transition matrices of all 16 channels in one pass.
+
+    The file is decoded once and its merged event stream is split by channel
+    once; each channel keeps its own active-note/previous-chord state, so
+    `result.matrices[ch]` equals `gen_transition_poly(midi_file, ch)`.
+
+    Parameters
+    ----------
+    midi_file : str
+        Path to the MIDI file.
+    cache : tonnetz.midi.cache.ParseCache | None
+        Optional on-disk cache serving the decoded event table.
+    pitch_space : PitchSpace
+        Notes that become matrix nodes (defaults to C2-B5).
+
+    Returns
+    -------
+        ChannelTransitions: per-channel counts and matrices, the combined
+        matrix (counts of all channels summed, then normalized) and the
+        per-channel event arrays.
+    """
+    table = read_event_table(midi_file) if cache is None else cache.event_table(midi_file)
+    per_channel = split_by_channel(table.events)
+    counts = np.stack([transition_counts_from_events(ev, pitch_space) for ev in per_channel])
+
+    return ChannelTransitions(
+        counts=counts,
+        matrices=normalize_transition_counts(counts),
+        combined=normalize_transition_counts(counts.sum(axis=0)),
+        events=per_channel,
+    )
+
+
+def split_by_channel(events: np.ndarray) -> list[np.ndarray]:
+    """
+    Split a merged event array into 16 per-channel arrays with one stable
+    sort instead of 16 masks; playback order is kept within each channel.
+    """
+    order = np.argsort(events["channel"], kind="stable")
+    bounds = np.searchsorted(events["channel"][order], np.arange(1, NUM_CHANNELS))
+    return np.split(events[order], bounds)
+
+
+def extract_timed_events(
+    midi_file: str,
+    target_channel: int = 1,
+    bpm: float = 120.0,
+    pitch_space: PitchSpace = DEFAULT_PITCH_SPACE,
+) -> list[dict]:
+    """
+    Returns a flat list of {time_sec, note_idx, event_type} dicts,
+    sorted by absolute time in seconds, with CORRECT tempo conversion.
+    """
+    min_note = pitch_space.min_note
+    events = select_events(
+        read_event_table(midi_file).events,
+        channels=[target_channel],
+        note_range=pitch_space.note_range,
+    )
 
     # Apply BPM override if needed
+    times = events["time_sec"]
     if bpm != 120.0:
-        scale = 120.0 / bpm  # scale times
-        for event in events:
-            event["time"] *= scale
+        times = times * (120.0 / bpm)  # scale times
 
-    return sorted(events, key=lambda e: e["time"])
\ No newline at end of file
+    return [
+        {
+            "time": time_sec,
+            "note": note - min_note,
+            "note_num": note,
+            "type": "on" if kind == NOTE_ON else "off",
+            "velocity": vel,
+        }
+        for time_sec, note, kind, vel in zip(
+            times.tolist(),
+            events["note"].tolist(),
+            events["kind"].tolist(),
+            events["velocity"].tolist(),
+        )
+    ]
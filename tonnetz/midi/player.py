@@ -3,11 +3,15 @@ from dataclasses import dataclass
 from typing import List, Optional
 import time
 import sys
-import mido
+import numpy as np
 
+from tonnetz.midi.cache import ParseCache, load_event_table
+from tonnetz.midi.events import NOTE_ON, select_events
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE
 
-MIN_NOTE = 36
-MAX_NOTE = 83  # inclusive
+
+MIN_NOTE = DEFAULT_PITCH_SPACE.min_note
+MAX_NOTE = DEFAULT_PITCH_SPACE.max_note  # inclusive
 
 
 @dataclass(frozen=True)
@@ -26,27 +30,24 @@ def _is_macos() -> bool:
     return sys.platform.startswith("darwin")
 
 
-def get_initial_bpm(midi_file: str) -> float:
+def get_initial_bpm(midi_file: str, cache: Optional[ParseCache] = None) -> float:
     """
     Return the first tempo found in the file as BPM.
     Falls back to 120.0 if there is no tempo meta.
     """
-    mid = mido.MidiFile(midi_file)
-    tempo_us = 500_000  # default 120 BPM
-    for msg in mido.merge_tracks(mid.tracks):
-        if msg.type == "set_tempo":
-            tempo_us = msg.tempo
-            break
-    return mido.tempo2bpm(tempo_us)
+    return load_event_table(midi_file, cache).tempo_map.initial_bpm
 
 
-def midi_to_events_ticks(
+def midi_to_event_array(
     midi_file: str,
     target_channel: Optional[int] = 0,
     exclude_drums: bool = True,
-) -> List[MidiEvent]:
+    cache: Optional[ParseCache] = None,
+    reader: str = "mido",
+) -> np.ndarray:
     """
-    Convert a MIDI file into a flat, time-sorted list of MidiEvent objects.
+    Load the note events of a MIDI file as a time-sorted event array
+    (see `tonnetz.midi.events.EVENT_DTYPE`).
     Event times are expressed in SECONDS and respect all tempo changes.
 
     Parameters
@@ -56,42 +57,63 @@ def midi_to_events_ticks(
     target_channel:
         If an integer (0-15), only events from that channel are used.
         If None, events from all non-drum channels are used.
+    cache:
+        Optional ParseCache serving the decoded event table.
+    reader:
+        MIDI decoder, "mido" or the byte-level "smf" fast path.
     """
-    mid = mido.MidiFile(midi_file)
-    ticks_per_beat = mid.ticks_per_beat
-    tempo = 500_000  # default 120 BPM in microseconds
+    events = load_event_table(midi_file, cache, reader).events
+    if target_channel is not None:
+        events = select_events(events, channels=[target_channel])
+    return events
 
-    events: List[MidiEvent] = []
-    abs_sec = 0.0
 
-    for msg in mido.merge_tracks(mid.tracks):
-        if msg.time:
-            abs_sec += mido.tick2second(msg.time, ticks_per_beat, tempo)
+def events_to_midi_events(events: np.ndarray) -> List[MidiEvent]:
+    """Convert an event array into MidiEvent objects (note_off velocity is 0)."""
+    return [
+        MidiEvent(t, "on", note, vel) if kind == NOTE_ON else MidiEvent(t, "off", note, 0)
+        for t, note, vel, kind in zip(
+            events["time_sec"].tolist(),
+            events["note"].tolist(),
+            events["velocity"].tolist(),
+            events["kind"].tolist(),
+        )
+    ]
 
-        if msg.type == "set_tempo":
-            tempo = msg.tempo
-            continue
 
-        channel = getattr(msg, "channel", None)
-        if channel is None:
-            continue
+def midi_to_events_ticks(
+    midi_file: str,
+    target_channel: Optional[int] = 0,
+    exclude_drums: bool = True,
+    reader: str = "mido",
+) -> List[MidiEvent]:
+    """
+    Convert a MIDI file into a flat, time-sorted list of MidiEvent objects.
+    Event times are expressed in SECONDS and respect all tempo changes.
 
-        if target_channel is not None and channel != target_channel:
-            continue
+    Prefer `midi_to_event_array` for bulk processing; this wrapper exists
+    for callers that want one object per event.
 
-        if msg.type == "note_on" and msg.velocity > 0:
-            events.append(MidiEvent(abs_sec, "on", msg.note, int(msg.velocity)))
-        elif msg.type == "note_off" or (msg.type == "note_on" and msg.velocity == 0):
-            # Preserve note_off events without velocity (velocity 0 is semantically correct)
-            events.append(MidiEvent(abs_sec, "off", msg.note, 0))
-    return events
+    Parameters
+    ----------
+    midi_file:
+        Path to the MIDI file.
+    target_channel:
+        If an integer (0-15), only events from that channel are used.
+        If None, events from all non-drum channels are used.
+    reader:
+        MIDI decoder, "mido" or the byte-level "smf" fast path.
+    """
+    return events_to_midi_events(
+        midi_to_event_array(midi_file, target_channel, exclude_drums, reader=reader)
+    )
 
 
 def scale_events_bpm(
-    events: List[MidiEvent],
+    events: List[MidiEvent] | np.ndarray,
     original_bpm: float,
     new_bpm: float,
-) -> List[MidiEvent]:
+) -> List[MidiEvent] | np.ndarray:
     """
     Return a new event list whose times are scaled so that playback
     at new_bpm keeps the same beat positions as original_bpm.
@@ -100,10 +122,16 @@ def scale_events_bpm(
     constant-tempo pieces this is exactly what we want. For files
     with many tempo changes it is still a reasonable global speed
     adjustment.
+
+    Event arrays (EVENT_DTYPE) are scaled column-wise into a copy.
     """
     if new_bpm <= 0:
         return events
     scale = float(original_bpm) / float(new_bpm)
+    if isinstance(events, np.ndarray):
+        scaled = events.copy()
+        scaled["time_sec"] *= scale
+        return scaled
     return [MidiEvent(e.t * scale, e.kind, e.note, e.vel) for e in events]
 
 
@@ -237,8 +265,8 @@ def play_midi_file(
         Override the tempo (BPM). If None, uses original tempo.
     """
     # Extract events in SECONDS using the MIDI's tempo map.
-    events = midi_to_events_ticks(midi_file, target_channel=target_channel)
-    if not events:
+    events = midi_to_event_array(midi_file, target_channel=target_channel)
+    if events.size == 0:
         if target_channel is None:
             print("No note events found in the MIDI file.")
         else:
@@ -255,21 +283,26 @@ def play_midi_file(
     # Create player
     player = FluidSynthPlayer(soundfont_path)
     
+    times = events["time_sec"].tolist()
+    notes = events["note"].tolist()
+    vels = events["velocity"].tolist()
+    kinds = events["kind"].tolist()
+    n_events = len(times)
+
     try:
-        print(f"Playing {len(events)} events at {effective_bpm:.2f} BPM...")
+        print(f"Playing {n_events} events at {effective_bpm:.2f} BPM...")
         start_time = time.perf_counter()
         event_idx = 0
 
-        while event_idx < len(events):
+        while event_idx < n_events:
             current_time = time.perf_counter() - start_time
             
             # Process all events that should have occurred by now
-            while event_idx < len(events) and events[event_idx].t <= current_time:
-                event = events[event_idx]
-                if event.kind == "on":
-                    player.note_on(event.note, event.vel)
-                elif event.kind == "off":
-                    player.note_off(event.note)
+            while event_idx < n_events and times[event_idx] <= current_time:
+                if kinds[event_idx] == NOTE_ON:
+                    player.note_on(notes[event_idx], vels[event_idx])
+                else:
+                    player.note_off(notes[event_idx])
                 event_idx += 1
             
             # Flush periodically to prevent crackling
@@ -278,8 +311,8 @@ def play_midi_file(
             
             # Sleep only until (just before) the next event to avoid
             # accumulating lag while still preventing busy-waiting.
-            if event_idx < len(events):
-                next_t = events[event_idx].t
+            if event_idx < n_events:
+                next_t = times[event_idx]
                 remaining = next_t - current_time
                 if remaining > 0.003:
                     # Wake up a little early (max 5ms) so we can
@@ -288,7 +321,7 @@ def play_midi_file(
                     time.sleep(min(remaining, 0.005))
 
         # Wait for final notes to finish
-        final_event_time = events[-1].t if events else 0
+        final_event_time = times[-1] if times else 0
         while time.perf_counter() - start_time < final_event_time + 2.0:
             time.sleep(0.01)
 
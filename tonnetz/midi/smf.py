@@ -0,0 +1,161 @@
+from __future__ import annotations
+import mmap
+import struct
+
+from tonnetz.midi.events import NOTE_OFF, NOTE_ON, EventTable, build_event_table
+
+
+META = 0xFF
+META_SET_TEMPO = 0x51
+SYSEX_STATUSES = (0xF0, 0xF7)
+
+# Data bytes following each status byte; -1 marks undefined statuses.
+_DATA_LENGTH = [-1] * 256
+for _status in range(0x80, 0xF0):
+    _DATA_LENGTH[_status] = 1 if 0xC0 <= _status < 0xE0 else 2
+for _status, _length in {0xF1: 1, 0xF2: 2, 0xF3: 1, 0xF6: 0, 0xF8: 0, 0xFA: 0,
+                         0xFB: 0, 0xFC: 0, 0xFE: 0}.items():
+    _DATA_LENGTH[_status] = _length
+
+
+def read_smf_event_table(midi_file: str) -> EventTable:
+    """
+    `read_event_table` straight from the bytes of a Standard MIDI File.
+
+    The file is memory-mapped and decoded by `parse_smf`; no mido message
+    objects are built and tracks are never merged.
+    """
+    with open(midi_file, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses empty files
+            raise EOFError(f"{midi_file} is empty") from None
+    with data:
+        return parse_smf(data)
+
+
+def parse_smf(data) -> EventTable:
+    """
+    Decode the note and tempo events of an in-memory Standard MIDI File.
+
+    Only delta-times, running status, note on/off (channel, note, velocity)
+    and set_tempo are decoded; every other message is skipped by its length.
+    Non-MTrk chunks are skipped too. The result matches
+    `read_event_table(path, reader="mido")` for well-formed files.
+
+    Parameters
+    ----------
+    data : bytes | memoryview | mmap.mmap
+        The complete file contents.
+
+    Returns
+    -------
+    EventTable
+    """
+    buf = memoryview(data)
+    try:
+        if bytes(buf[0:4]) != b"MThd":
+            raise ValueError("MThd not found. Probably not a MIDI file")
+        (header_size,) = struct.unpack_from(">L", buf, 4)
+        _, num_tracks, ticks_per_beat = struct.unpack_from(">hhh", buf, 8)
+
+        ticks: list[int] = []
+        tracks: list[int] = []
+        channels: list[int] = []
+        notes: list[int] = []
+        values: list[int] = []
+        kinds: list[int] = []
+
+        pos = 8 + header_size
+        track_i = 0
+        while track_i < num_tracks:
+            name = bytes(buf[pos:pos + 4])
+            (size,) = struct.unpack_from(">L", buf, pos + 4)
+            pos += 8
+            if name == b"MTrk":
+                _parse_track(buf, pos, pos + size, track_i,
+                             ticks, tracks, channels, notes, values, kinds)
+                track_i += 1
+            pos += size
+    except (IndexError, struct.error):
+        raise EOFError("truncated MIDI file") from None
+    finally:
+        buf.release()
+
+    return build_event_table(ticks, tracks, channels, notes, values, kinds, ticks_per_beat)
+
+
+def _parse_track(buf, pos, end, track_i, ticks, tracks, channels, notes, values, kinds) -> None:
+    """Append the note and tempo rows of the MTrk chunk body buf[pos:end]."""
+    if end > len(buf):
+        raise IndexError
+    data_length = _DATA_LENGTH
+    abs_tick = 0
+    running = None
+    while pos < end:
+        # Variable-length delta time
+        byte = buf[pos]
+        pos += 1
+        delta = byte & 0x7F
+        while byte & 0x80:
+            byte = buf[pos]
+            pos += 1
+            delta = (delta << 7) | (byte & 0x7F)
+        abs_tick += delta
+
+        status = buf[pos]
+        if status & 0x80:
+            pos += 1
+            if status != META:
+                # Meta events don't set running status
+                running = status
+        elif running is None:
+            raise ValueError("running status without a previous status byte")
+        else:
+            status = running
+
+        kind = status & 0xF0
+        if kind == 0x90 or kind == 0x80:
+            note = buf[pos]
+            velocity = buf[pos + 1]
+            pos += 2
+            if note > 127 or velocity > 127:
+                raise ValueError("data byte must be in range 0..127")
+            ticks.append(abs_tick)
+            tracks.append(track_i)
+            channels.append(status & 0x0F)
+            notes.append(note)
+            values.append(velocity)
+            kinds.append(NOTE_ON if kind == 0x90 and velocity > 0 else NOTE_OFF)
+        elif status == META:
+            meta_type = buf[pos]
+            pos += 1
+            length, pos = _read_varlen(buf, pos)
+            if meta_type == META_SET_TEMPO and length >= 3:
+                ticks.append(abs_tick)
+                tracks.append(track_i)
+                channels.append(0)
+                notes.append(0)
+                values.append((buf[pos] << 16) | (buf[pos + 1] << 8) | buf[pos + 2])
+                kinds.append(-1)
+            pos += length
+        elif status in SYSEX_STATUSES:
+            length, pos = _read_varlen(buf, pos)
+            pos += length
+        else:
+            length = data_length[status]
+            if length < 0:
+                raise ValueError(f"undefined status byte 0x{status:02x}")
+            pos += length
+
+
+def _read_varlen(buf, pos: int) -> tuple[int, int]:
+    """Decode a variable-length quantity; returns (value, next position)."""
+    value = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value = (value << 7) | (byte & 0x7F)
+        if byte < 0x80:
+            return value, pos
@@ -0,0 +1,68 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+import mido
+import numpy as np
+
+
+DEFAULT_TEMPO = 500_000  # 120 BPM in microseconds
+
+
+@dataclass(frozen=True, eq=False)
+class TempoMap:
+    """
+    Piecewise-linear mapping between absolute ticks and seconds.
+
+    Built once per file from its set_tempo changes; converts whole arrays
+    with `np.searchsorted`, i.e. O(log T) per value for T tempo changes.
+    A tempo change at tick t affects only the time after t, as in mido
+    playback; before the first change DEFAULT_TEMPO applies.
+    """
+
+    ticks: np.ndarray     # (T,) breakpoint ticks, non-decreasing, ticks[0] == 0
+    tempos: np.ndarray    # (T,) microseconds per beat from each breakpoint on
+    seconds: np.ndarray   # (T,) seconds at each breakpoint
+    ticks_per_beat: int
+
+    @classmethod
+    def from_tempos(cls, tempos: np.ndarray, ticks_per_beat: int) -> "TempoMap":
+        """
+        Build from set_tempo rows in playback order (an array with `tick` and
+        `tempo` fields, such as `EventTable.tempos`).
+        """
+        ticks = np.concatenate(([0], np.asarray(tempos["tick"], dtype=np.int64)))
+        values = np.concatenate(([DEFAULT_TEMPO], np.asarray(tempos["tempo"], dtype=np.int64)))
+        sec_per_tick = values * 1e-6 / ticks_per_beat
+        seconds = np.concatenate(([0.0], np.cumsum(np.diff(ticks) * sec_per_tick[:-1])))
+        return cls(ticks=ticks, tempos=values, seconds=seconds, ticks_per_beat=int(ticks_per_beat))
+
+    def _segment(self, values: np.ndarray, breakpoints: np.ndarray) -> np.ndarray:
+        # Last breakpoint <= value; among equal breakpoints the last tempo wins
+        return np.searchsorted(breakpoints, values, side="right") - 1
+
+    def to_seconds(self, ticks):
+        """Seconds since start of absolute tick(s); accepts scalars or arrays."""
+        ticks = np.asarray(ticks)
+        seg = np.maximum(self._segment(ticks, self.ticks), 0)
+        sec_per_tick = self.tempos[seg] * 1e-6 / self.ticks_per_beat
+        return self.seconds[seg] + (ticks - self.ticks[seg]) * sec_per_tick
+
+    def to_ticks(self, seconds):
+        """Inverse of `to_seconds`: (fractional) absolute ticks at time(s) `seconds`."""
+        seconds = np.asarray(seconds, dtype=np.float64)
+        seg = np.maximum(self._segment(seconds, self.seconds), 0)
+        sec_per_tick = self.tempos[seg] * 1e-6 / self.ticks_per_beat
+        return self.ticks[seg] + (seconds - self.seconds[seg]) / sec_per_tick
+
+    def tempo_at(self, ticks):
+        """Tempo (microseconds per beat) in effect right after tick(s)."""
+        return self.tempos[np.maximum(self._segment(np.asarray(ticks), self.ticks), 0)]
+
+    @property
+    def initial_tempo(self) -> int:
+        """First tempo found in the file, DEFAULT_TEMPO if there is none."""
+        return int(self.tempos[1] if self.tempos.size > 1 else self.tempos[0])
+
+    @property
+    def initial_bpm(self) -> float:
+        return mido.tempo2bpm(self.initial_tempo)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from tonnetz.graph.statistics import BatchGraphStats
+from tonnetz.midi.events import read_event_table, select_events
+from tonnetz.midi.parser import normalize_transition_counts, note_onsets
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE, PitchSpace
+
+
+DEFAULT_WINDOW_BARS = 8
+DEFAULT_HOP_BARS = 1
+DEFAULT_BEATS_PER_BAR = 4
+
+
+@dataclass(frozen=True, eq=False)
+class WindowedTransitions:
+    starts: np.ndarray    # (W,) first tick of each window
+    ends: np.ndarray      # (W,) end tick of each window (exclusive)
+    counts: np.ndarray    # (W, n, n) raw transition counts per window
+    pitch_space: PitchSpace
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def matrices(self, threshold: float = 0.01) -> np.ndarray:
+        """(W, n, n) normalized matrices, post-processed like `gen_transition_poly`."""
+        return normalize_transition_counts(self.counts, threshold)
+
+
+def sliding_window_counts(
+    events: np.ndarray,
+    ticks_per_beat: int,
+    target_channel: Optional[int] = None,
+    window_bars: int = DEFAULT_WINDOW_BARS,
+    hop_bars: int = DEFAULT_HOP_BARS,
+    beats_per_bar: int = DEFAULT_BEATS_PER_BAR,
+    pitch_space: PitchSpace = DEFAULT_PITCH_SPACE,
+) -> WindowedTransitions:
+    """
+    Transition counts of every window of a piece from a single traversal.
+
+    The note state of the whole stream is computed once (`note_onsets`);
+    the count increments of each note_on are binned into the hop it falls in
+    and the bins are prefix summed, so each window is one subtraction of two
+    prefix sums. Note state (active notes, previous chord) carries over from
+    the whole piece, i.e. a window holds exactly the transitions the
+    full-file parse counts for the note_ons inside it, and summing disjoint
+    windows gives the file's counts.
+
+    Parameters
+    ----------
+    events : np.ndarray
+        Whole-file event array (EVENT_DTYPE).
+    ticks_per_beat : int
+        The file's resolution, used to convert bars into ticks.
+    target_channel : int | None
+        Channel to analyse; None merges all channels into one stream.
+    window_bars : int
+        Window length in bars (must be a multiple of `hop_bars`).
+    hop_bars : int
+        Distance between consecutive window starts in bars.
+    beats_per_bar : int
+        Beats per bar (the file's time signature is not read).
+    pitch_space : PitchSpace
+        Notes that become matrix nodes (defaults to C2-B5).
+
+    Returns
+    -------
+    WindowedTransitions
+        One window per hop, from tick 0 until a window reaches the last event.
+    """
+    if window_bars <= 0 or hop_bars <= 0 or beats_per_bar <= 0:
+        raise ValueError("window_bars, hop_bars and beats_per_bar must be > 0")
+    if window_bars % hop_bars:
+        raise ValueError("window_bars must be a multiple of hop_bars")
+
+    hop_ticks = hop_bars * beats_per_bar * ticks_per_beat
+    hops_per_window = window_bars // hop_bars
+    last_tick = int(events["tick"].max()) if events.size else 0
+
+    channels = None if target_channel is None else [target_channel]
+    events = select_events(events, channels=channels, note_range=pitch_space.note_range)
+    onsets = note_onsets(events, pitch_space)
+
+    # Counts per hop (shifted by one so row 0 stays empty), then prefix sum over hops
+    num_hops = last_tick // hop_ticks + 1
+    hop = events["tick"][onsets.positions] // hop_ticks
+    per_hop = onsets.counts(groups=hop + 1, num_groups=num_hops + 1)
+    prefix = np.cumsum(per_hop, axis=0, out=per_hop)
+
+    num_windows = max(num_hops - hops_per_window, 0) + 1
+    first = np.arange(num_windows)
+    last = np.minimum(first + hops_per_window, num_hops)
+    return WindowedTransitions(
+        starts=first * hop_ticks,
+        ends=(first + hops_per_window) * hop_ticks,
+        counts=prefix[last] - prefix[first],
+        pitch_space=pitch_space,
+    )
+
+
+def gen_transition_windows(
+    midi_file: str,
+    target_channel: Optional[int] = 1,
+    window_bars: int = DEFAULT_WINDOW_BARS,
+    hop_bars: int = DEFAULT_HOP_BARS,
+    beats_per_bar: int = DEFAULT_BEATS_PER_BAR,
+    cache=None,
+    pitch_space: PitchSpace = DEFAULT_PITCH_SPACE,
+) -> WindowedTransitions:
+    """
+    `sliding_window_counts` of a MIDI file, e.g. 8-bar windows with a 1-bar
+    hop. The file is decoded once (or served from `cache`).
+    """
+    table = read_event_table(midi_file) if cache is None else cache.event_table(midi_file)
+    return sliding_window_counts(
+        table.events,
+        table.ticks_per_beat,
+        target_channel=target_channel,
+        window_bars=window_bars,
+        hop_bars=hop_bars,
+        beats_per_bar=beats_per_bar,
+        pitch_space=pitch_space,
+    )
+
+
+def window_statistics(windows: WindowedTransitions, threshold: float = 0.01) -> dict[str, np.ndarray]:
+    """
+    Per-window summary statistics for tracking harmonic drift.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Arrays of length W:
+        `transitions` raw transition count, `edges` non-zero matrix entries,
+        `average_clustering` and `giant_component` (see `BatchGraphStats`), and `drift`,
+        the mean total-variation distance between the outgoing distributions
+        of a window and the previous one (0 for the first window).
+    """
+    matrices = windows.matrices(threshold)
+    stats = BatchGraphStats(matrices)
+    drift = np.zeros(len(matrices))
+    if len(matrices) > 1:
+        drift[1:] = 0.5 * np.abs(np.diff(matrices, axis=0)).sum(axis=-1).mean(axis=-1)
+
+    return {
+        "transitions": windows.counts.sum(axis=(1, 2)),
+        "edges": np.count_nonzero(matrices, axis=(1, 2)),
+        "average_clustering": stats.average_clustering,
+        "giant_component": stats.giant_component_size,
+        "drift": drift,
+    }
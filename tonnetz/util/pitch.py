@@ -0,0 +1,80 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+
+# Pitch spaces wider than this are backed by scipy.sparse by default.
+DENSE_MAX_NOTES = 48
+
+
+@dataclass(frozen=True)
+class PitchSpace:
+    """
+    Contiguous window of MIDI note numbers that become graph nodes.
+
+    Node index i corresponds to MIDI note `min_note + i`; notes outside the
+    window are ignored by the parser.
+
+    Parameters
+    ----------
+    min_note : int
+        MIDI note number of node 0 (defaults to 36, C2).
+    num_notes : int
+        Number of nodes (defaults to 48, i.e. C2-B5).
+    sparse : bool | None
+        Whether transition counts over this space are stored as scipy.sparse
+        matrices. None picks sparse storage for spaces wider than
+        DENSE_MAX_NOTES, where most of the range is usually unused.
+    """
+
+    min_note: int = 36
+    num_notes: int = 48
+    sparse: bool | None = field(default=None, compare=False)
+
+    def __post_init__(self):
+        if self.num_notes <= 0:
+            raise ValueError("num_notes must be > 0")
+        if self.min_note < 0 or self.min_note + self.num_notes > 128:
+            raise ValueError("pitch space must lie within MIDI notes 0..127")
+        if self.sparse is None:
+            object.__setattr__(self, "sparse", self.num_notes > DENSE_MAX_NOTES)
+
+    @property
+    def max_note(self) -> int:
+        """Highest MIDI note number in the window (inclusive)."""
+        return self.min_note + self.num_notes - 1
+
+    @property
+    def note_range(self) -> tuple[int, int]:
+        """Inclusive (min_note, max_note), as taken by `select_events`."""
+        return self.min_note, self.max_note
+
+    def contains(self, note: int) -> bool:
+        return self.min_note <= note <= self.max_note
+
+    def index(self, note: int) -> int:
+        """Node index of a MIDI note number (may fall outside the window)."""
+        return note - self.min_note
+
+    def note(self, index: int) -> int:
+        """MIDI note number of a node index."""
+        return index + self.min_note
+
+    def indices(self, notes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized `index`: returns (node indices, mask of notes inside the window)."""
+        idx = np.asarray(notes, dtype=np.int64) - self.min_note
+        return idx, (idx >= 0) & (idx < self.num_notes)
+
+    def labels(self) -> dict[int, str]:
+        """Mapping from node index to note name, e.g. {0: "C2", ..., 47: "B5"}."""
+        return {
+            i: f"{NOTE_NAMES[n % 12]}{n // 12 - 1}"
+            for i, n in enumerate(range(self.min_note, self.min_note + self.num_notes))
+        }
+
+
+DEFAULT_PITCH_SPACE = PitchSpace()
+FULL_PITCH_SPACE = PitchSpace(min_note=0, num_notes=128)
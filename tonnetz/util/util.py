@@ -1,4 +1,6 @@
-def create_note_labels() -> dict:
-    """Create a mapping from node indices to note names (0=C2, 47=B5)."""
-    note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-    return {i: f"{note_names[i % 12]}{i // 12 + 2}" for i in range(48)}
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE, PitchSpace
+
+
+def create_note_labels(pitch_space: PitchSpace = DEFAULT_PITCH_SPACE) -> dict:
+    """Create a mapping from node indices to note names (0=C2, 47=B5 by default)."""
+    return pitch_space.labels()
@@ -1,20 +1,15 @@
 import os
 import time
 import threading
-import csv
-import re
 from pathlib import Path
 
 import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
-import mido
 from matplotlib.widgets import RadioButtons, Button, TextBox
 try:
     from tonnetz.midi.player import (
-        midi_to_events_ticks,
         FluidSynthPlayer,
-        MidiEvent,
         get_initial_bpm,
         scale_events_bpm,
     )
@@ -22,10 +17,12 @@ try:
 except ImportError as _e:  
     _AUDIO_AVAILABLE = False
     _AUDIO_IMPORT_ERROR = _e
+from tonnetz.midi.cache import ParseCache, load_event_table
+from tonnetz.midi.events import EVENT_DTYPE, NOTE_ON, select_events
+from tonnetz.util.pitch import DEFAULT_PITCH_SPACE, PitchSpace
 from tonnetz.util.util import create_note_labels
 
-MIN_NOTE = 36
-MAX_NOTE = 83
+_ROLES = ("melody", "chords")
 
 _MODULE_DIR = Path(__file__).resolve().parent         
 _PROJECT_ROOT = _MODULE_DIR.parents[2]                 
@@ -34,197 +31,16 @@ _DEFAULT_SOUNDFONT = _MIDI_DIR / "GeneralUser-GS.sf2"
 _CHANNEL_MAP_CSV = _MIDI_DIR / "mono_channels.csv"
 
 
-def _parse_channel_list(raw: str | None) -> list[int]:
-    if raw is None:
-        return []
-    text = str(raw).strip()
-    if not text:
-        return []
-
-    out: list[int] = []
-    for token in re.split(r"[|;/\s]+", text):
-        tok = token.strip()
-        if not tok:
-            continue
-        if not tok.lstrip("-").isdigit():
-            continue
-        ch = int(tok)
-        if 0 <= ch <= 15:
-            out.append(ch)
-    return sorted(set(out))
-
-
-def _normalize_file_key(path_like: str) -> str:
-    return Path(path_like).name.lower().strip()
-
-
-def _resolve_role_config(
-    role_map: dict[str, dict[str, list[int]]],
+def _events_for_tracks(
     midi_path: str,
-) -> dict[str, list[int]]:
-    """
-    Resolve channel-role config for a MIDI path with a fallback for combined files.
-    Example fallback: song_combined.mid -> song.mid
-    """
-    key = _normalize_file_key(midi_path)
-    cfg = role_map.get(key)
-    if cfg is not None:
-        return cfg
-
-    stem = Path(key).stem
-    suffix = Path(key).suffix
-    if stem.endswith("_combined"):
-        base_key = f"{stem[:-9]}{suffix}"
-        cfg = role_map.get(base_key)
-        if cfg is not None:
-            return cfg
-
-    return {}
-
-
-def _load_role_channels(csv_path: Path) -> dict[str, dict[str, list[int]]]:
-    """
-    Load channel role mapping from CSV.
-
-    Supported rows:
-    - filename, channel                (legacy: melody only)
-    - filename, melody_channel, chords_channel
-    - with headers using fields like: file/filename/midi, melody, chord/chords
-    """
-    mapping: dict[str, dict[str, list[int]]] = {}
-    if not csv_path.exists():
-        return mapping
-
-    lines: list[str] = []
-    with csv_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            s = line.strip()
-            if s and not s.startswith("#"):
-                lines.append(s)
-    if not lines:
-        return mapping
-
-    has_header = any(
-        key in lines[0].lower()
-        for key in ("file", "filename", "midi", "melody", "chord")
-    )
-
-    if has_header:
-        reader = csv.DictReader(lines)
-        for row in reader:
-            if not row:
-                continue
-            filename = (
-                row.get("filename")
-                or row.get("file")
-                or row.get("midi")
-                or row.get("track")
-            )
-            if not filename:
-                continue
-            melody = (
-                row.get("melody")
-                or row.get("melody_channel")
-                or row.get("melody_channels")
-                or row.get("lead")
-            )
-            chords = (
-                row.get("chords")
-                or row.get("chord")
-                or row.get("chord_channel")
-                or row.get("chord_channels")
-                or row.get("harmony")
-            )
-            key = _normalize_file_key(filename)
-            mapping[key] = {
-                "melody": _parse_channel_list(melody),
-                "chords": _parse_channel_list(chords),
-            }
-    else:
-        reader = csv.reader(lines)
-        for row in reader:
-            if not row:
-                continue
-            filename = str(row[0]).strip()
-            if not filename:
-                continue
-            key = _normalize_file_key(filename)
-            melody_raw = row[1] if len(row) > 1 else ""
-            chords_raw = row[2] if len(row) > 2 else ""
-            mapping[key] = {
-                "melody": _parse_channel_list(melody_raw),
-                "chords": _parse_channel_list(chords_raw),
-            }
-
-    return mapping
-
-
-def _events_for_channels(midi_path: str, channels: list[int] | None) -> list[MidiEvent]:
-    if not channels:
-        return []
-
-    merged: list[MidiEvent] = []
-    for ch in sorted(set(channels)):
-        merged.extend(midi_to_events_ticks(midi_path, target_channel=ch))
-    merged.sort(key=lambda e: e.t)
-    return merged
-
-
-def _build_tempo_segments(mid: mido.MidiFile) -> list[tuple[int, float, int]]:
-    """
-    Build tempo segments as tuples of:
-    (start_tick, start_sec, tempo_us_per_beat)
-    """
-    ticks_per_beat = mid.ticks_per_beat
-    tempo = 500_000  # default 120 BPM
-    abs_tick = 0
-    abs_sec = 0.0
-    segments: list[tuple[int, float, int]] = [(0, 0.0, tempo)]
-
-    for msg in mido.merge_tracks(mid.tracks):
-        if msg.time:
-            abs_tick += int(msg.time)
-            abs_sec += mido.tick2second(msg.time, ticks_per_beat, tempo)
-        if msg.type == "set_tempo":
-            tempo = int(msg.tempo)
-            segments.append((abs_tick, abs_sec, tempo))
-
-    return segments
-
-
-def _tick_to_sec(
-    tick: int,
-    segments: list[tuple[int, float, int]],
-    ticks_per_beat: int,
-) -> float:
-    # Linear scan is fine for small tempo maps.
-    seg_i = 0
-    for i in range(1, len(segments)):
-        if segments[i][0] > tick:
-            break
-        seg_i = i
-    start_tick, start_sec, tempo = segments[seg_i]
-    delta = tick - start_tick
-    return start_sec + mido.tick2second(delta, ticks_per_beat, tempo)
-
-
-def _events_for_tracks(midi_path: str, track_indices: list[int] | None) -> list[MidiEvent]:
+    track_indices: list[int] | None,
+    cache: ParseCache | None = None,
+) -> np.ndarray:
     if not track_indices:
-        return []
-
-    mid = mido.MidiFile(midi_path)
-    ticks_per_beat = mid.ticks_per_beat
-    segments = _build_tempo_segments(mid)
-    merged: list[MidiEvent] = []
-
-    note_track_indices = [
-        i
-        for i, track in enumerate(mid.tracks)
-        if any(
-            (msg.type in ("note_on", "note_off")) and getattr(msg, "note", None) is not None
-            for msg in track
-        )
-    ]
+        return np.empty(0, dtype=EVENT_DTYPE)
+
+    events = load_event_table(midi_path, cache).events
+    note_track_indices = np.unique(events["track"]).tolist()
 
     # Interpret provided indices as ordinal note-track positions first:
     # 0 => first note-bearing track, 1 => second note-bearing track, etc.
@@ -236,24 +52,34 @@ def _events_for_tracks(midi_path: str, track_indices: list[int] | None) -> list[
         # Fallback: treat as absolute MIDI track indices.
         resolved_indices = unique_requested
 
-    for track_i in resolved_indices:
-        if track_i < 0 or track_i >= len(mid.tracks):
-            continue
-        abs_tick = 0
-        for msg in mid.tracks[track_i]:
-            abs_tick += int(msg.time)
-            note = getattr(msg, "note", None)
-            if note is None:
-                continue
+    return select_events(events, tracks=resolved_indices)
+
 
-            t_sec = _tick_to_sec(abs_tick, segments, ticks_per_beat)
-            if msg.type == "note_on" and msg.velocity > 0:
-                merged.append(MidiEvent(t_sec, "on", int(note), int(msg.velocity)))
-            elif msg.type == "note_off" or (msg.type == "note_on" and msg.velocity == 0):
-                merged.append(MidiEvent(t_sec, "off", int(note), 0))
+def _merge_role_events(
+    melody_events: np.ndarray,
+    chord_events: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Merge melody and chord event arrays into one time-sorted array plus a
+    parallel array of role indices into _ROLES (melody first on ties).
+    """
+    events = np.concatenate([melody_events, chord_events])
+    roles = np.concatenate(
+        [
+            np.zeros(melody_events.size, dtype=np.int8),
+            np.ones(chord_events.size, dtype=np.int8),
+        ]
+    )
+    order = np.argsort(events["time_sec"], kind="stable")
+    return events[order], roles[order]
+
+def _node_values(scores, nodes: list[int]) -> np.ndarray:
+    """Scores of `nodes` from a node-indexed array or a {node: score} dict (int or str keys)."""
+    if isinstance(scores, np.ndarray):
+        return scores[np.asarray(nodes, dtype=int)].astype(float)
+    by_node = {int(k): float(v) for k, v in scores.items()}
+    return np.array([by_node.get(int(n), 0.0) for n in nodes], dtype=float)
 
-    merged.sort(key=lambda e: e.t)
-    return merged
 
 def plot_graph(
     input_graph: nx.DiGraph,
@@ -264,6 +90,8 @@ def plot_graph(
     overlay_chord_midi_name: str | None = None,
     overlay_melody_options: dict[str, str] | None = None,
     enable_playback: bool = True,
+    cache: ParseCache | None = None,
+    pitch_space: PitchSpace = DEFAULT_PITCH_SPACE,
 ):
     G = input_graph.copy()
 
@@ -272,7 +100,7 @@ def plot_graph(
         G.remove_nodes_from(isolated)
 
     # Labels only for nodes that exist in G
-    all_note_labels = create_note_labels()
+    all_note_labels = create_note_labels(pitch_space)
     note_labels = {n: all_note_labels[n] for n in G.nodes()}
 
     # Layout + styling
@@ -363,6 +191,8 @@ def plot_graph(
                 melody_midi_options=resolved_melody_options,
                 melody_track=0,
                 chord_track=1,
+                cache=cache,
+                pitch_space=pitch_space,
             )
     elif not enable_playback:
         print("Playback disabled by configuration -- Check your flags in analysis.py")
@@ -376,19 +206,12 @@ def plot_graph(
     if centralities:
         nodes = list(G.nodes())
 
-        deg_norm = centralities["deg"]
-        btw_str = centralities["btw"]
-        eig_str = centralities["eig"]
-
-        deg_vals = np.array([deg_norm.get(int(n), 0.0) for n in nodes], dtype=float)
+        deg_vals = _node_values(centralities["deg"], nodes)
         deg_min = float(deg_vals.min()) if deg_vals.size else 0.0
         deg_max = float(deg_vals.max()) if deg_vals.size else 1.0
         if deg_max == deg_min:
             deg_max = deg_min + 1.0
 
-        btw = {int(k): float(v) for k, v in btw_str.items()}
-        eig = {int(k): float(v) for k, v in eig_str.items()}
-
         def rescale_to_degree_range(vals: np.ndarray) -> np.ndarray:
             if vals.size == 0:
                 return vals
@@ -399,17 +222,12 @@ def plot_graph(
             t = (vals - vmin) / (vmax - vmin)
             return deg_min + t * (deg_max - deg_min)
 
+        metric_keys = {"degree": "deg", "betweenness": "btw", "eigenvector": "eig"}
+
         def metric_values(metric: str) -> np.ndarray:
-            if metric == "degree":
-                base = np.array([deg_norm.get(int(n), 0.0) for n in nodes], dtype=float)
-                return rescale_to_degree_range(base)
-            if metric == "betweenness":
-                base = np.array([btw.get(int(n), 0.0) for n in nodes], dtype=float)
-                return rescale_to_degree_range(base)
-            if metric == "eigenvector":
-                base = np.array([eig.get(int(n), 0.0) for n in nodes], dtype=float)
-                return rescale_to_degree_range(base)
-            raise ValueError(metric)
+            if metric not in metric_keys:
+                raise ValueError(metric)
+            return rescale_to_degree_range(_node_values(centralities[metric_keys[metric]], nodes))
 
         def sizes_from(vals: np.ndarray) -> np.ndarray:
             return np.array([max(v * 6000, 40) for v in vals], dtype=float)
@@ -480,8 +298,12 @@ class TonnetzRealtimeOverlay:
         melody_midi_options: dict[str, str] | None = None,
         melody_track: int = 0,
         chord_track: int = 1,
+        cache: ParseCache | None = None,
+        pitch_space: PitchSpace = DEFAULT_PITCH_SPACE,
     ):
         self.fig = fig
+        self.cache = cache
+        self.pitch_space = pitch_space
         self.ax = ax
         self.node_artist = node_artist
 
@@ -537,16 +359,13 @@ class TonnetzRealtimeOverlay:
         self.melody_labels = list(self.melody_midi_options.keys())
         self.selected_melody_label = self.melody_labels[0] if self.melody_labels else None
 
-        self.chord_events0 = _events_for_tracks(self.chord_midi_path, [self.chord_track])
+        self.chord_events0 = _events_for_tracks(
+            self.chord_midi_path, [self.chord_track], cache=self.cache
+        )
         self.melody_events0 = self._load_selected_melody_events()
-        self.events0: list[tuple[float, str, MidiEvent]] = [
-            (e.t, "melody", e) for e in self.melody_events0
-        ] + [
-            (e.t, "chords", e) for e in self.chord_events0
-        ]
-        self.events0.sort(key=lambda x: x[0])
-        self.base_bpm = float(get_initial_bpm(self.chord_midi_path))
-        self.events: list[tuple[float, str, MidiEvent]] = self.events0[:]
+        self.events0, self.roles0 = _merge_role_events(self.melody_events0, self.chord_events0)
+        self.base_bpm = float(get_initial_bpm(self.chord_midi_path, cache=self.cache))
+        self.events, self.roles = self.events0, self.roles0
 
         self.audio = None
         self._audio_channel_by_role = {"melody": 0, "chords": 1}
@@ -618,21 +437,18 @@ class TonnetzRealtimeOverlay:
         # Lower default FPS for broader low-spec compatibility.
         return 30
 
-    def _load_selected_melody_events(self) -> list[MidiEvent]:
+    def _load_selected_melody_events(self) -> np.ndarray:
         if not self.selected_melody_label:
-            return []
+            return np.empty(0, dtype=EVENT_DTYPE)
         path = self.melody_midi_options.get(self.selected_melody_label)
         if not path or not os.path.exists(path):
-            return []
-        return _events_for_tracks(path, [self.melody_track])
+            return np.empty(0, dtype=EVENT_DTYPE)
+        return _events_for_tracks(path, [self.melody_track], cache=self.cache)
 
     def _rebuild_events_for_selection(self):
         self.melody_events0 = self._load_selected_melody_events()
-        self.events0 = [(e.t, "melody", e) for e in self.melody_events0] + [
-            (e.t, "chords", e) for e in self.chord_events0
-        ]
-        self.events0.sort(key=lambda x: x[0])
-        self.events = self.events0[:]
+        self.events0, self.roles0 = _merge_role_events(self.melody_events0, self.chord_events0)
+        self.events, self.roles = self.events0, self.roles0
 
     def _on_change_melody(self, label: str):
         self.selected_melody_label = label
@@ -651,7 +467,7 @@ class TonnetzRealtimeOverlay:
     def start(self):
         self.stop()
 
-        self.events = self.events0[:]
+        self.events, self.roles = self.events0, self.roles0
 
         bpm = self._read_bpm()
         if bpm is not None and bpm > 0 and abs(bpm - self.base_bpm) > 1e-6:
@@ -665,10 +481,7 @@ class TonnetzRealtimeOverlay:
                 original_bpm=self.base_bpm,
                 new_bpm=bpm,
             )
-            self.events = [(e.t, "melody", e) for e in melody_scaled] + [
-                (e.t, "chords", e) for e in chord_scaled
-            ]
-            self.events.sort(key=lambda x: x[0])
+            self.events, self.roles = _merge_role_events(melody_scaled, chord_scaled)
 
         self.is_playing = True
         self.t0 = time.perf_counter()
@@ -687,7 +500,7 @@ class TonnetzRealtimeOverlay:
         self._stop_event.clear()
         self._playback_thread = threading.Thread(
             target=self._playback_loop,
-            args=(self.events, self.t0),
+            args=(self.events, self.roles, self.t0),
             daemon=True,
         )
         self._playback_thread.start()
@@ -737,17 +550,25 @@ class TonnetzRealtimeOverlay:
         except Exception:
             return None
 
-    def _playback_loop(self, events: list[tuple[float, str, MidiEvent]], start_time: float):
+    def _playback_loop(self, events: np.ndarray, roles: np.ndarray, start_time: float):
+        times = events["time_sec"].tolist()
+        notes = events["note"].tolist()
+        vels = events["velocity"].tolist()
+        kinds = events["kind"].tolist()
+        role_idxs = roles.tolist()
+        n_events = len(times)
+
         idx = 0
         processed = 0
 
-        while idx < len(events) and not self._stop_event.is_set():
+        while idx < n_events and not self._stop_event.is_set():
             now = time.perf_counter() - start_time
             dispatched = False
 
-            while idx < len(events) and events[idx][0] <= now:
-                _, role, evt = events[idx]
-                self._dispatch_event(role, evt)
+            while idx < n_events and times[idx] <= now:
+                self._dispatch_event(
+                    _ROLES[role_idxs[idx]], notes[idx], kinds[idx] == NOTE_ON, vels[idx]
+                )
                 idx += 1
                 processed += 1
                 dispatched = True
@@ -758,12 +579,12 @@ class TonnetzRealtimeOverlay:
                         self.audio.flush()
                 processed = 0
 
-            if idx >= len(events):
+            if idx >= n_events:
                 break
 
             if not dispatched:
                 # Sleep in short bursts for accurate audio scheduling at high tempos.
-                next_t = events[idx][0]
+                next_t = times[idx]
                 remaining = next_t - now
                 if remaining > 0.004:
                     time.sleep(min(remaining - 0.001, 0.004))
@@ -777,8 +598,9 @@ class TonnetzRealtimeOverlay:
         with self._state_lock:
             self._playback_done = True
 
-    def _dispatch_event(self, role: str, e: MidiEvent):
-        node = e.note - MIN_NOTE
+    def _dispatch_event(self, role: str, note: int, is_on: bool, vel: int):
+        node = self.pitch_space.index(note)
+        in_space = self.pitch_space.contains(note)
 
         target_nodes = self.active_melody_nodes if role == "melody" else self.active_chord_nodes
         target_counts = (
@@ -786,31 +608,30 @@ class TonnetzRealtimeOverlay:
         )
         out_channel = self._audio_channel_by_role[role]
         changed = False
-        if e.kind == "on":
+        if is_on:
             with self._state_lock:
-                was_active = e.note in target_counts
+                was_active = note in target_counts
                 # Treat each pitch as active/inactive per role to avoid stale highlights
                 # when source MIDI has mismatched repeated note_on/note_off pairs.
-                target_counts[e.note] = 1
-                if not was_active and node in self.node_to_i and MIN_NOTE <= e.note <= MAX_NOTE:
+                target_counts[note] = 1
+                if not was_active and node in self.node_to_i and in_space:
                     target_nodes.add(node)
                     changed = True
             if self.audio:
-                vel = int(e.vel) if getattr(e, "vel", None) is not None else 80
                 with self._audio_lock:
-                    self.audio.note_on(e.note, vel, channel=out_channel)
+                    self.audio.note_on(note, vel, channel=out_channel)
         else:
             do_note_off = False
             with self._state_lock:
-                if e.note in target_counts:
-                    target_counts.pop(e.note, None)
+                if note in target_counts:
+                    target_counts.pop(note, None)
                     do_note_off = True
-                    if node in self.node_to_i and MIN_NOTE <= e.note <= MAX_NOTE:
+                    if node in self.node_to_i and in_space:
                         target_nodes.discard(node)
                         changed = True
             if self.audio and do_note_off:
                 with self._audio_lock:
-                    self.audio.note_off(e.note, channel=out_channel)
+                    self.audio.note_off(note, channel=out_channel)
 
         if changed:
             with self._state_lock: